@@ -0,0 +1,241 @@
+"""
+Stand-in for the web server of an Acond Pro controller.
+
+Serves the pages in benchmarks/fixtures over HTTPS with the controller's
+login redirect flow, expiring sessions, configurable latency and jitter,
+and applies POSTed values to its state. The pages are synthetic: they
+follow the controller's element layout and tag names, but their values
+are generated filler, not captures of a real controller. The /_stats,
+/_state and /_sessions endpoints let tests inspect and change the state
+from outside the server process. Run it on its own to point a development
+instance of Home Assistant at it:
+
+    python3 benchmarks/simulator.py --port 8443 --latency 0.05 --jitter 0.02
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import random
+import secrets
+import ssl
+import tempfile
+import time
+from collections import Counter
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING
+from xml.etree import ElementTree as ET
+from xml.sax.saxutils import quoteattr
+
+from aiohttp import web
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+PAGES = ("/PAGE115.XML", "/PAGE121.XML")
+URL_LOGIN = "/SYSWWW/LOGIN.XML"
+SESSION_COOKIE = "SoftPLC"
+
+
+def load_page(path: Path) -> dict[str, str]:
+    """Read the INPUT values of a fixture page."""
+    root = ET.parse(path).getroot()  # noqa: S314 - trusted local fixture
+    return {elem.get("NAME"): elem.get("VALUE") for elem in root.iter("INPUT")}
+
+
+def render_page(values: dict[str, str]) -> bytes:
+    """Render values the way the controller writes its pages."""
+    lines = ['<?xml version="1.0" encoding="UTF-8"?>', "<PAGE>"]
+    lines.extend(
+        f" <INPUT NAME={quoteattr(name)} VALUE={quoteattr(value)} />"
+        for name, value in values.items()
+    )
+    lines.append("</PAGE>")
+    return "\r\n".join(lines).encode()
+
+
+def self_signed_ssl_context() -> ssl.SSLContext:
+    """Create a server context with a throwaway self-signed certificate."""
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "acond-simulator")])
+    now = datetime.now(UTC)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now)
+        .not_valid_after(now + timedelta(days=1))
+        .sign(key, hashes.SHA256())
+    )
+    context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    with tempfile.TemporaryDirectory() as directory:
+        certfile = Path(directory) / "cert.pem"
+        keyfile = Path(directory) / "key.pem"
+        certfile.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+        keyfile.write_bytes(
+            key.private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.PKCS8,
+                serialization.NoEncryption(),
+            )
+        )
+        context.load_cert_chain(certfile, keyfile)
+    return context
+
+
+class ControllerSimulator:
+    """State and request handlers of a simulated controller."""
+
+    def __init__(
+        self,
+        *,
+        username: str = "admin",
+        password: str = "admin",  # noqa: S107
+        session_lifetime: float = 300.0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+    ) -> None:
+        """Load the fixture pages as the initial state."""
+        self.username = username
+        self.password = password
+        self.session_lifetime = session_lifetime
+        self.latency = latency
+        self.jitter = jitter
+        self.pages = {url: load_page(FIXTURES / url.lstrip("/")) for url in PAGES}
+        self.sessions: dict[str, float] = {}
+        self.requests: Counter[str] = Counter()
+        # Form fields of every POST to a page, in order.
+        self.posted: list[dict[str, str]] = []
+
+    def app(self) -> web.Application:
+        """Build the aiohttp application."""
+        app = web.Application()
+        app.router.add_post(URL_LOGIN, self._handle_login)
+        for url in PAGES:
+            app.router.add_route("GET", url, self._handle_page)
+            app.router.add_route("POST", url, self._handle_page)
+        app.router.add_get("/_stats", self._handle_stats)
+        app.router.add_delete("/_stats", self._handle_stats)
+        app.router.add_get("/_state", self._handle_state)
+        app.router.add_patch("/_state", self._handle_state)
+        app.router.add_delete("/_sessions", self._handle_sessions)
+        return app
+
+    async def _delay(self) -> None:
+        """Sleep for the configured latency and jitter."""
+        delay = self.latency + random.uniform(0, self.jitter)  # noqa: S311
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _authenticated(self, request: web.Request) -> bool:
+        """Return true if the request carries a live session cookie."""
+        started = self.sessions.get(request.cookies.get(SESSION_COOKIE, ""))
+        return (
+            started is not None and time.monotonic() - started < self.session_lifetime
+        )
+
+    async def _handle_login(self, request: web.Request) -> web.Response:
+        """Check the credentials and start a session."""
+        self.requests[f"{request.method} {request.path}"] += 1
+        await self._delay()
+        form = await request.post()
+        if form.get("USER") != self.username or form.get("PASS") != self.password:
+            raise web.HTTPFound(URL_LOGIN)
+        token = secrets.token_hex(8)
+        self.sessions[token] = time.monotonic()
+        response = web.HTTPFound("/")
+        response.set_cookie(SESSION_COOKIE, token)
+        raise response
+
+    async def _handle_page(self, request: web.Request) -> web.Response:
+        """Serve a page, applying POSTed values first."""
+        self.requests[f"{request.method} {request.path}"] += 1
+        await self._delay()
+        if not self._authenticated(request):
+            raise web.HTTPFound(URL_LOGIN)
+        values = self.pages[request.path]
+        if request.method == "POST":
+            form = await request.post()
+            self.posted.append({name: str(value) for name, value in form.items()})
+            values.update(
+                (name, str(value)) for name, value in form.items() if name in values
+            )
+        return web.Response(body=render_page(values), content_type="text/xml")
+
+    async def _handle_stats(self, request: web.Request) -> web.Response:
+        """Report the request counters, resetting them on DELETE."""
+        requests = dict(self.requests)
+        if request.method == "DELETE":
+            self.requests.clear()
+        return web.json_response(requests)
+
+    async def _handle_state(self, request: web.Request) -> web.Response:
+        """Report the pages and POSTed forms, PATCH sets page values first."""
+        if request.method == "PATCH":
+            for url, values in (await request.json()).items():
+                self.pages[url].update(values)
+        return web.json_response({"pages": self.pages, "posted": self.posted})
+
+    async def _handle_sessions(self, _: web.Request) -> web.Response:
+        """Expire every session, as a restart of the controller does."""
+        self.sessions.clear()
+        return web.json_response({})
+
+
+async def serve(port: int, ready: Connection | None = None, **options: float) -> None:
+    """Serve a simulator forever, sending the bound port to ready if given."""
+    simulator = ControllerSimulator(**options)
+    runner = web.AppRunner(simulator.app())
+    await runner.setup()
+    try:
+        site = web.TCPSite(
+            runner, "127.0.0.1", port, ssl_context=self_signed_ssl_context()
+        )
+        await site.start()
+        if ready is not None:
+            ready.send(runner.addresses[0][1])
+            ready.close()
+        await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()
+
+
+def run(port: int, ready: Connection | None = None, **options: float) -> None:
+    """
+    Serve a simulator until interrupted or terminated.
+
+    This is the target of the process the tests and benchmarks serve the
+    simulator from, so that its CPU time is not counted as the client's.
+    """
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(serve(port, ready, **options))
+
+
+def main() -> None:
+    """Parse the command line and serve."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--port", type=int, default=8443)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--session-lifetime", type=float, default=300.0)
+    args = parser.parse_args()
+    run(
+        args.port,
+        latency=args.latency,
+        jitter=args.jitter,
+        session_lifetime=args.session_lifetime,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -7,11 +7,9 @@ https://github.com/piotrekcrash/acond
 
 from __future__ import annotations
 
-import ssl
 from datetime import timedelta
 from typing import TYPE_CHECKING
 
-import aiohttp
 from homeassistant.const import (
     CONF_IP_ADDRESS,
     CONF_MAC,
@@ -19,30 +17,68 @@ from homeassistant.const import (
     CONF_USERNAME,
     Platform,
 )
+from homeassistant.core import callback
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import entity_registry as er
 from homeassistant.loader import async_get_loaded_integration
 
 from .api import AcondProApiClient
-from .const import DOMAIN, LOGGER
+from .const import (
+    CONF_ACTIVE_SCAN_INTERVAL,
+    CONF_IDLE_SCAN_INTERVAL,
+    CONF_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_ACTIVE_SCAN_INTERVAL,
+    DEFAULT_IDLE_SCAN_INTERVAL,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DOMAIN,
+    LOGGER,
+)
 from .coordinator import AcondDataUpdateCoordinator
 from .data import AcondProData
+from .hub import async_get_hub
+from .registry import async_get_registry
+from .services import async_setup_services
+from .snapshot import AcondSnapshotStore
+from .timeseries import AcondSeriesRecorder
+from .timetable import AcondTimetables
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.typing import ConfigType
 
     from .data import AcondProConfigEntry
 
 PLATFORMS: list[Platform] = [
     Platform.SENSOR,
     Platform.BINARY_SENSOR,
+    Platform.CALENDAR,
     Platform.SWITCH,
     Platform.CLIMATE,
     Platform.SELECT,
     Platform.WATER_HEATER,
 ]
 
-ssl_context = ssl.create_default_context()
-ssl_context.check_hostname = False
-ssl_context.verify_mode = ssl.CERT_NONE
+# Platforms with entities of their own, besides those of the registered tags.
+DERIVED_PLATFORMS = frozenset({Platform.SENSOR, Platform.BINARY_SENSOR})
+
+# Entities of earlier versions that are not generated anymore, as
+# (platform, key, whether the unique id is prefixed by the MAC).
+RETIRED_ENTITIES = (
+    # The operating mode select wrote a placeholder, not a controller tag.
+    (Platform.SELECT, "__T47138CF2_INT_.1f", True),
+    # The test switch of the integration scaffold.
+    (Platform.SWITCH, "__TBEC2C30E_REAL_.1f", False),
+    # Thermal power, a multi-day average of the GJ counter shown as kW.
+    (Platform.SENSOR, "derived_thermal_power", True),
+)
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:  # noqa: ARG001
+    """Set up the services shared by all entries."""
+    async_setup_services(hass)
+    return True
 
 
 async def async_setup_entry(
@@ -50,28 +86,62 @@ async def async_setup_entry(
     entry: AcondProConfigEntry,
 ) -> bool:
     """Set up this integration using UI."""
+    hub = async_get_hub(hass)
+    registry = await async_get_registry(hass)
     coordinator = AcondDataUpdateCoordinator(
         hass=hass,
         logger=LOGGER,
         name=DOMAIN,
-        update_interval=timedelta(seconds=30),
+        active_interval=timedelta(
+            seconds=entry.options.get(
+                CONF_ACTIVE_SCAN_INTERVAL, DEFAULT_ACTIVE_SCAN_INTERVAL
+            )
+        ),
+        idle_interval=timedelta(
+            seconds=entry.options.get(
+                CONF_IDLE_SCAN_INTERVAL, DEFAULT_IDLE_SCAN_INTERVAL
+            )
+        ),
+        hub=hub,
     )
-    cookie_jar = aiohttp.CookieJar(unsafe=True)
-    tcp_conn = aiohttp.TCPConnector(ssl=ssl_context)
-    entry.runtime_data = AcondProData(
-        client=AcondProApiClient(
-            ip=entry.data[CONF_IP_ADDRESS],
-            username=entry.data[CONF_USERNAME],
-            password=entry.data[CONF_PASSWORD],
-            session=aiohttp.ClientSession(cookie_jar=cookie_jar, connector=tcp_conn),
+    client = AcondProApiClient(
+        ip=entry.data[CONF_IP_ADDRESS],
+        username=entry.data[CONF_USERNAME],
+        password=entry.data[CONF_PASSWORD],
+        max_concurrent_requests=int(
+            entry.options.get(
+                CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS
+            )
         ),
+        connector=hub.connector,
+        budget=hub.budget,
+    )
+    # Both run on unload and on a failed setup attempt.
+    entry.async_on_unload(hub.async_register(coordinator))
+    entry.async_on_unload(client.async_close)
+    entry.runtime_data = AcondProData(
+        client=client,
         integration=async_get_loaded_integration(hass, entry.domain),
         coordinator=coordinator,
+        registry=registry,
+        timetables=AcondTimetables(coordinator, registry.timetables),
     )
+    coordinator.async_plan_initial_pages()
+    _async_remove_retired_entities(hass, entry)
     LOGGER.error("CONF_MAC_" + entry.data[CONF_MAC])
-    await coordinator.async_config_entry_first_refresh()
-
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    await coordinator.series.async_load()
+    entry.async_on_unload(coordinator.series.async_start())
+    entry.async_on_unload(coordinator.series.async_flush)
+    entry.async_on_unload(coordinator.async_flush_snapshot)
+    if await coordinator.async_restore_snapshot():
+        # Entities start from the saved snapshot while the controller is read.
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} {entry.title} first refresh"
+        )
+    else:
+        await coordinator.async_config_entry_first_refresh()
+
+    await hass.config_entries.async_forward_entry_setups(entry, _entry_platforms(entry))
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
     return True
@@ -82,7 +152,47 @@ async def async_unload_entry(
     entry: AcondProConfigEntry,
 ) -> bool:
     """Handle removal of an entry."""
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    return await hass.config_entries.async_unload_platforms(
+        entry, _entry_platforms(entry)
+    )
+
+
+def _entry_platforms(entry: AcondProConfigEntry) -> list[Platform]:
+    """Return the platforms that have entities, the others are not imported."""
+    registry = entry.runtime_data.registry
+    return [
+        platform
+        for platform in PLATFORMS
+        if platform in DERIVED_PLATFORMS or registry.has_entities(platform)
+    ]
+
+
+@callback
+def _async_remove_retired_entities(
+    hass: HomeAssistant, entry: AcondProConfigEntry
+) -> None:
+    """Remove the entities no longer generated, unless their tag is back."""
+    entity_registry = er.async_get(hass)
+    registry = entry.runtime_data.registry
+    mac = entry.data.get(CONF_MAC, "unknown_mac")
+    for platform, key, with_mac in RETIRED_ENTITIES:
+        if any(definition.tag == key for definition in registry.for_platform(platform)):
+            continue
+        unique_id = f"{mac}_{key}" if with_mac else key
+        if entity_id := entity_registry.async_get_entity_id(
+            platform, DOMAIN, unique_id
+        ):
+            LOGGER.info("Removing retired entity %s", entity_id)
+            entity_registry.async_remove(entity_id)
+
+
+async def async_remove_entry(
+    hass: HomeAssistant,
+    entry: AcondProConfigEntry,
+) -> None:
+    """Delete the saved snapshot and time series of a removed entry."""
+    await AcondSnapshotStore(hass, entry.entry_id).async_remove()
+    await AcondSeriesRecorder(hass, entry.entry_id).async_remove()
 
 
 async def async_reload_entry(
@@ -90,5 +200,4 @@ async def async_reload_entry(
     entry: AcondProConfigEntry,
 ) -> None:
     """Reload config entry."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+    await hass.config_entries.async_reload(entry.entry_id)
@@ -2,21 +2,75 @@
 
 from __future__ import annotations
 
+import asyncio
+import random
 import socket
-import ssl
-from typing import Any
+import time
+from collections import Counter
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, Any
 
 import aiohttp
 import async_timeout
-from bs4 import BeautifulSoup
+from homeassistant.util.ssl import get_default_no_verify_context
 
-from .const import LOGGER, URL_HOME, URL_INFO, URL_LOGIN
+from .const import (
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    LOGGER,
+    URL_HOME,
+    URL_INFO,
+    URL_LOGIN,
+)
+from .metrics import (
+    COUNTER_BYTES,
+    COUNTER_CONNECTIONS,
+    COUNTER_LOGINS,
+    COUNTER_REQUESTS,
+    STAGE_CONNECT,
+    STAGE_LOGIN,
+    STAGE_PARSE,
+    STAGE_REQUEST,
+    AcondMetrics,
+)
+from .parser import parse_values
+from .tags import encode_value
 
-ssl_context = ssl.create_default_context()
-ssl_context.check_hostname = False
-ssl_context.verify_mode = ssl.CERT_NONE
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from types import SimpleNamespace
 
 HTTP_FOUND = 302
+# Deadline of a whole exchange, logins included. Each round-trip is bounded
+# by the much shorter connect and read timeouts, so an offline controller
+# fails fast.
+REQUEST_TIMEOUT = 30
+CONNECT_TIMEOUT = 5
+READ_TIMEOUT = 15
+CLIENT_TIMEOUT = aiohttp.ClientTimeout(
+    total=None, sock_connect=CONNECT_TIMEOUT, sock_read=READ_TIMEOUT
+)
+KEEPALIVE_TIMEOUT = 60
+# Log in again once this share of the learned session lifetime has passed.
+SESSION_RENEW_MARGIN = 0.9
+# Sessions seen to live shorter than this many seconds are not renewed ahead,
+# an early expiry such as a controller restart is left to the 302 retry.
+MIN_SESSION_LIFETIME = 60
+# Writes issued within this many seconds are coalesced into one POST.
+WRITE_BATCH_DELAY = 0.2
+MAX_WRITES_PER_POST = 10
+# A page read this many seconds ago is served again instead of re-read.
+PAGE_FRESHNESS = 2
+# The breaker opens after this many consecutive communication failures, then
+# probes after BREAKER_BASE_DELAY, doubling up to BREAKER_MAX_DELAY seconds.
+BREAKER_FAILURE_THRESHOLD = 3
+BREAKER_BASE_DELAY = 30
+BREAKER_MAX_DELAY = 900
+# Share of a probe delay randomized, so dead controllers do not probe in step.
+BREAKER_JITTER = 0.2
+
+BREAKER_CLOSED = "closed"
+BREAKER_OPEN = "open"
+BREAKER_HALF_OPEN = "half_open"
 
 
 class AcondProApiClientError(Exception):
@@ -31,6 +85,126 @@ class AcondProApiClientAuthenticationError(AcondProApiClientError):
     """Exception to indicate an authentication error."""
 
 
+class AcondProApiClientUnavailableError(AcondProApiClientCommunicationError):
+    """Exception to indicate a request skipped while the breaker is open."""
+
+
+class AcondCircuitBreaker:
+    """
+    Circuit breaker of the requests to one controller.
+
+    After BREAKER_FAILURE_THRESHOLD consecutive communication failures
+    requests fail at once with the last error, until a single probe is let
+    through after an exponentially growing, jittered delay. The first
+    answer from the controller closes the breaker again.
+    """
+
+    def __init__(self) -> None:
+        """Initialize closed."""
+        self.failures = 0
+        self.last_error: AcondProApiClientCommunicationError | None = None
+        # Monotonic time from which a probe may be sent, None while closed.
+        self._probe_at: float | None = None
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        """Return the breaker state."""
+        if self._probe_at is None:
+            return BREAKER_CLOSED
+        if self._probing or time.monotonic() >= self._probe_at:
+            return BREAKER_HALF_OPEN
+        return BREAKER_OPEN
+
+    @property
+    def retry_in(self) -> float:
+        """Return the seconds until the next probe, 0 if one may be sent."""
+        if self._probe_at is None:
+            return 0
+        return max(0, self._probe_at - time.monotonic())
+
+    def before_request(self) -> bool:
+        """
+        Raise while the breaker is open, return true for a probe.
+
+        Only one probe is in flight at a time, concurrent requests keep
+        failing until it has been answered.
+        """
+        if self._probe_at is None:
+            return False
+        if self._probing or time.monotonic() < self._probe_at:
+            msg = (
+                f"Controller unreachable, retrying in {self.retry_in:.0f} s"
+                f" - {self.last_error}"
+            )
+            raise AcondProApiClientUnavailableError(msg) from self.last_error
+        self._probing = True
+        return True
+
+    def end_probe(self) -> None:
+        """Allow the next probe, also when the previous one was cancelled."""
+        self._probing = False
+
+    def record_success(self) -> None:
+        """Close the breaker."""
+        if self._probe_at is not None:
+            LOGGER.info("Controller reachable again after %d failures", self.failures)
+        self.failures = 0
+        self.last_error = None
+        self._probe_at = None
+
+    def record_failure(self, error: AcondProApiClientCommunicationError) -> None:
+        """Count a failure, opening the breaker or delaying the next probe."""
+        self.failures += 1
+        self.last_error = error
+        if self.failures < BREAKER_FAILURE_THRESHOLD:
+            return
+        delay = min(
+            BREAKER_MAX_DELAY,
+            BREAKER_BASE_DELAY * 2 ** (self.failures - BREAKER_FAILURE_THRESHOLD),
+        )
+        delay *= 1 + random.uniform(-BREAKER_JITTER, BREAKER_JITTER)  # noqa: S311
+        self._probe_at = time.monotonic() + delay
+
+
+class AcondProRequestBudget:
+    """Concurrency and bandwidth budget shared by the clients of controllers."""
+
+    def __init__(self, max_concurrent_requests: int, bytes_per_second: int) -> None:
+        """Initialize with one second worth of bandwidth available."""
+        self.slots = asyncio.Semaphore(max_concurrent_requests)
+        self._bytes_per_second = bytes_per_second
+        self._available = float(bytes_per_second)
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        """Add the bandwidth accrued since the last update, up to one second."""
+        now = time.monotonic()
+        self._available = min(
+            self._bytes_per_second,
+            self._available + (now - self._updated) * self._bytes_per_second,
+        )
+        self._updated = now
+
+    def consume(self, size: int) -> None:
+        """Account for received bytes, possibly overdrawing the budget."""
+        self._refill()
+        self._available -= size
+
+    async def async_wait(self) -> None:
+        """
+        Wait until the budget is no longer overdrawn.
+
+        Called before a request takes its slots, so a throttled controller
+        neither holds slots the other controllers need nor runs into the
+        request timeout.
+        """
+        self._refill()
+        while self._available <= 0:
+            await asyncio.sleep(-self._available / self._bytes_per_second or 0.01)
+            self._refill()
+
+
 def _verify_response_or_raise(response: aiohttp.ClientResponse) -> None:
     """Verify that the response is valid."""
     if response.status in (401, 403):
@@ -42,19 +216,103 @@ def _verify_response_or_raise(response: aiohttp.ClientResponse) -> None:
 class AcondProApiClient:
     """Sample API Client."""
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         ip: str,
         username: str,
         password: str,
-        session: aiohttp.ClientSession,
+        session: aiohttp.ClientSession | None = None,
+        *,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        connector: aiohttp.BaseConnector | None = None,
+        budget: AcondProRequestBudget | None = None,
     ) -> None:
-        """Sample API Client."""
+        """
+        Sample API Client.
+
+        A shared connector and budget let several clients keep their own
+        host pools inside one connection and bandwidth budget.
+        """
         self._ip = ip
         self._username = username
         self._password = password
-        self._cookie_jar = aiohttp.CookieJar(unsafe=True)
         self._session = session
+        self._owns_session = session is None
+        self._connector = connector
+        self._budget = budget
+        # The controller's embedded web server copes badly with parallel
+        # requests, so every request to it waits for a slot here.
+        self._max_concurrent_requests = max_concurrent_requests
+        self._request_slots = asyncio.Semaphore(max_concurrent_requests)
+        # Controller session state: when the cookie was obtained, when it was
+        # last accepted and how long the controller keeps a session alive.
+        self._login_lock = asyncio.Lock()
+        self._logged_in_at: float | None = None
+        self._session_confirmed_at: float | None = None
+        self._session_lifetime: float | None = None
+        self._pending_writes: dict[str, Any] = {}
+        self._write_task: asyncio.Task | None = None
+        # (url, wanted tags) -> read of the page in flight, shared by callers.
+        self._page_reads: dict[tuple[str, frozenset[str] | None], asyncio.Task] = {}
+        # Url -> (monotonic time, wanted tags, values) of the last read.
+        self._fresh_pages: dict[
+            str, tuple[float, frozenset[str] | None, dict[str, Any]]
+        ] = {}
+        # Url -> number of writes answered with the page, to spot stale reads.
+        self._page_generations: Counter[str] = Counter()
+        self.metrics = AcondMetrics()
+        self.breaker = AcondCircuitBreaker()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the pooled session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._logged_in_at = None
+            self._session = aiohttp.ClientSession(
+                cookie_jar=aiohttp.CookieJar(unsafe=True),
+                connector=self._connector
+                or aiohttp.TCPConnector(
+                    ssl=get_default_no_verify_context(),
+                    limit_per_host=self._max_concurrent_requests,
+                    keepalive_timeout=KEEPALIVE_TIMEOUT,
+                ),
+                connector_owner=self._connector is None,
+                trace_configs=[self._trace_config()],
+            )
+            self._owns_session = True
+        return self._session
+
+    def _trace_config(self) -> aiohttp.TraceConfig:
+        """Time the creation of new pooled connections."""
+
+        async def on_connection_create_start(
+            _: aiohttp.ClientSession, context: SimpleNamespace, __: Any
+        ) -> None:
+            context.connect_started = time.perf_counter()
+
+        async def on_connection_create_end(
+            _: aiohttp.ClientSession, context: SimpleNamespace, __: Any
+        ) -> None:
+            self.metrics.counters[COUNTER_CONNECTIONS] += 1
+            self.metrics.record(
+                STAGE_CONNECT, time.perf_counter() - context.connect_started
+            )
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_create_start.append(on_connection_create_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        return trace_config
+
+    async def async_close(self) -> None:
+        """Close the pooled session if it is owned by the client."""
+        if self._write_task is not None:
+            self._write_task.cancel()
+            self._write_task = None
+        for task in self._page_reads.values():
+            task.cancel()
+        self._fresh_pages.clear()
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+        self._session = None
 
     async def async_get_data(self) -> Any:
         """Get data from the API."""
@@ -72,30 +330,130 @@ class AcondProApiClient:
             headers={"Content-type": "application/json; charset=UTF-8"},
         )
 
-    async def async_get_home(self) -> Any:
-        """Get async home data."""
-        data = {}
-        data.update(
-            await self._api_txt_wrapper(
-                method="get",
-                url=URL_HOME,
+    async def async_get_pages(
+        self, urls: Iterable[str], wanted: frozenset[str] | None = None
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Get the values of each page concurrently, keyed by page url.
+
+        Only the wanted tags are parsed when given, see parse_values. Unless
+        the breaker is closed, the first page probes the controller alone.
+        """
+        urls = list(urls)
+        results = []
+        if urls and self.breaker.state != BREAKER_CLOSED:
+            results.append(await self._async_get_page(urls[0], wanted))
+        results.extend(
+            await asyncio.gather(
+                *(self._async_get_page(url, wanted) for url in urls[len(results) :])
             )
         )
-        data.update(
-            await self._api_txt_wrapper(
-                method="get",
-                url=URL_INFO,
+        return dict(zip(urls, results, strict=True))
+
+    async def _async_get_page(
+        self, url: str, wanted: frozenset[str] | None
+    ) -> dict[str, Any]:
+        """
+        Read a page, sharing a read in flight or served from a fresh one.
+
+        A read covering all the wanted tags is fresh for PAGE_FRESHNESS
+        seconds, so bursts of refresh requests hit the controller once.
+        """
+        if (fresh := self._fresh_pages.get(url)) is not None:
+            read_at, read_wanted, values = fresh
+            if time.monotonic() - read_at < PAGE_FRESHNESS and (
+                read_wanted is None or (wanted is not None and wanted <= read_wanted)
+            ):
+                return values
+        key = (url, wanted)
+        if (task := self._page_reads.get(key)) is None:
+            task = self._page_reads[key] = asyncio.create_task(
+                self._async_read_page(url, wanted)
             )
+            task.add_done_callback(lambda done: self._page_read_done(key, done))
+        return await asyncio.shield(task)
+
+    async def _async_read_page(
+        self, url: str, wanted: frozenset[str] | None
+    ) -> dict[str, Any]:
+        """Read a page and remember it as fresh, unless a write overtook it."""
+        generation = self._page_generations[url]
+        values = await self._api_txt_wrapper(method="get", url=url, wanted=wanted)
+        if self._page_generations[url] != generation:
+            # The page a write was answered with is newer than this read.
+            written = self._fresh_pages.get(url)
+            return written[2] if written is not None else values
+        self._fresh_pages[url] = (time.monotonic(), wanted, values)
+        return values
+
+    def _page_read_done(
+        self, key: tuple[str, frozenset[str] | None], task: asyncio.Task
+    ) -> None:
+        """Forget a finished read, its error is raised to the callers."""
+        self._page_reads.pop(key, None)
+        if not task.cancelled():
+            # Retrieved here in case every caller was cancelled meanwhile.
+            task.exception()
+
+    async def async_read_tags(
+        self, tags: Iterable[str], urls: Iterable[str] = (URL_HOME, URL_INFO)
+    ) -> dict[str, Any]:
+        """Read tags from the pages they may be on, parsing nothing else."""
+        values: dict[str, Any] = {}
+        pages = await self.async_get_pages(urls, frozenset(tags))
+        for page_values in pages.values():
+            values.update(page_values)
+        return values
+
+    async def async_write_tags(self, values: dict[str, Any]) -> Any:
+        """
+        Write values checked against the type encoded in each tag name.
+
+        Raises ValueError before anything is sent if a value does not fit
+        its tag. The values are sent in as few POSTs as possible.
+        """
+        return await self.async_set_values(
+            {name: encode_value(name, value) for name, value in values.items()}
         )
-        return data
 
-    async def async_set_value(self, name: str, value: str) -> Any:
+    async def async_set_value(self, name: str, value: Any) -> Any:
         """Set async data."""
-        return await self._api_txt_wrapper(
-            method="post",
-            url=URL_HOME,
-            data=self.value_update_form(name, value),
-        )
+        return await self.async_set_values({name: value})
+
+    async def async_set_values(self, values: dict[str, Any]) -> Any:
+        """
+        Queue values for writing and wait for the POST that carries them.
+
+        Writes issued within WRITE_BATCH_DELAY of each other are sent
+        together, and a later write to the same tag replaces an earlier one.
+        """
+        self._pending_writes.update(values)
+        if self._write_task is None:
+            self._write_task = asyncio.create_task(self._async_flush_writes())
+        return await asyncio.shield(self._write_task)
+
+    async def _async_flush_writes(self) -> Any:
+        """Send the queued writes, at most MAX_WRITES_PER_POST per request."""
+        await asyncio.sleep(WRITE_BATCH_DELAY)
+        self._write_task = None
+        items = list(self._pending_writes.items())
+        self._pending_writes = {}
+        response = None
+        for start in range(0, len(items), MAX_WRITES_PER_POST):
+            response = await self._api_txt_wrapper(
+                method="post",
+                url=URL_HOME,
+                data=self.value_update_form(
+                    dict(items[start : start + MAX_WRITES_PER_POST])
+                ),
+            )
+        self._page_generations[URL_HOME] += 1
+        if response:
+            # The controller answers a write with the whole updated page.
+            self._fresh_pages[URL_HOME] = (time.monotonic(), None, response)
+        else:
+            self._fresh_pages.pop(URL_HOME, None)
+        return response
 
     async def _api_wrapper(
         self,
@@ -107,7 +465,7 @@ class AcondProApiClient:
         """Get information from the API."""
         try:
             async with async_timeout.timeout(10):
-                response = await self._session.request(
+                response = await self._get_session().request(
                     method=method,
                     url=url,
                     headers=headers,
@@ -127,23 +485,16 @@ class AcondProApiClient:
             raise AcondProApiClientError(msg) from exception
 
     async def login(self) -> Any:
-        """Get data from the API."""
+        """Log in and read the device info page."""
         LOGGER.error("LOGIN")
         return await self._api_txt_wrapper(
             method="get",
             url=URL_INFO,
         )
 
-    def map_response(self, str_response: str) -> Any:
-        """Map response."""
-        soup = BeautifulSoup(str_response, "lxml-xml")
-        input_elements = soup.find_all("INPUT")
-        value_dict: dict[str, str | None] = {}
-        for input_elem in input_elements:
-            name = input_elem.get("NAME")
-            value = input_elem.get("VALUE")
-            value_dict[name] = value
-        return value_dict
+    def map_response(self, body: bytes, wanted: frozenset[str] | None = None) -> Any:
+        """Map response to typed tag values."""
+        return parse_values(body, wanted)
 
     def login_form(self) -> aiohttp.FormData:
         """Login Form."""
@@ -152,11 +503,14 @@ class AcondProApiClient:
         data.add_field("PASS", self._password)
         return data
 
-    def value_update_form(self, name: str, value: str) -> aiohttp.FormData:
-        """Value update form."""
-        data = aiohttp.FormData(quote_fields=True, charset="utf-8")
-        data.add_field(name, value)
-        return data
+    def value_update_form(self, values: dict[str, Any]) -> dict[str, str]:
+        """
+        Value update form.
+
+        A plain dict is sent url-encoded like the login form, and unlike a
+        FormData it can be sent again after a login redirect.
+        """
+        return {name: str(value) for name, value in values.items()}
 
     def _build_url(self, url: str) -> str:
         return "https://" + self._ip + url
@@ -164,50 +518,148 @@ class AcondProApiClient:
     def _raise_auth_error(self, message: str) -> None:
         raise AcondProApiClientAuthenticationError(message)
 
+    def _session_expiring(self, logged_in_at: float | None) -> bool:
+        """Return true if there is no session or it is about to expire."""
+        if logged_in_at is None:
+            return True
+        if self._session_lifetime is None:
+            return False
+        age = time.monotonic() - logged_in_at
+        return age >= self._session_lifetime * SESSION_RENEW_MARGIN
+
+    def _learn_session_lifetime(self, logged_in_at: float | None) -> None:
+        """
+        Remember how long the controller accepted the expired session.
+
+        The session was last seen alive before it expired, so this is only
+        a lower bound and the longest one seen is kept.
+        """
+        confirmed_at = self._session_confirmed_at
+        if logged_in_at is None or confirmed_at is None or confirmed_at <= logged_in_at:
+            return
+        lived = confirmed_at - logged_in_at
+        LOGGER.debug("Controller session lived at least %.0f s", lived)
+        if lived < MIN_SESSION_LIFETIME:
+            return
+        self._session_lifetime = max(self._session_lifetime or 0, lived)
+
+    async def _async_login(
+        self, session: aiohttp.ClientSession, logged_in_at: float | None
+    ) -> None:
+        """
+        Log in unless another caller already replaced the given session.
+
+        Concurrent callers that found the same session expired share a
+        single login instead of each posting their own.
+        """
+        async with self._login_lock:
+            if self._logged_in_at != logged_in_at:
+                return
+            self.metrics.counters[COUNTER_REQUESTS] += 1
+            self.metrics.counters[COUNTER_LOGINS] += 1
+            with self.metrics.measure(STAGE_LOGIN):
+                response = await session.post(
+                    url=self._build_url(URL_LOGIN),
+                    data=self.login_form(),
+                    allow_redirects=False,
+                    timeout=CLIENT_TIMEOUT,
+                )
+                response.release()
+            if (
+                response.status == HTTP_FOUND
+                and response.headers.get("Location") == URL_LOGIN
+            ):
+                self._logged_in_at = None
+                self._raise_auth_error("Invalid credentials")
+            self._logged_in_at = time.monotonic()
+
+    async def _async_send(
+        self,
+        session: aiohttp.ClientSession,
+        method: str,
+        url: str,
+        data: dict | None,
+        headers: dict | None,
+    ) -> bytes | None:
+        """Send one request and return its body, None when sent to log in."""
+        self.metrics.counters[COUNTER_REQUESTS] += 1
+        with self.metrics.measure(STAGE_REQUEST):
+            response = await session.request(
+                url=self._build_url(url),
+                method=method,
+                data=data,
+                headers=headers,
+                allow_redirects=False,
+                timeout=CLIENT_TIMEOUT,
+            )
+            if response.status == HTTP_FOUND:
+                response.release()
+                return None
+            return await response.read()
+
     async def _api_txt_wrapper(
         self,
         method: str,
         url: str,
         data: dict | None = None,
         headers: dict | None = None,
+        wanted: frozenset[str] | None = None,
     ) -> Any:
-        """Get information from the API."""
+        """Get information from the API, unless the breaker is open."""
+        budget = self._budget
+        if budget is not None:
+            await budget.async_wait()
+        probe = self.breaker.before_request()
         try:
-            async with (
-                async_timeout.timeout(30),
-                aiohttp.ClientSession(
-                    cookie_jar=self._cookie_jar,
-                    connector=aiohttp.TCPConnector(ssl=ssl_context),
-                ) as session,
-            ):
-                response = await session.request(
-                    url=self._build_url(url),
-                    method=method,
-                    data=data,
-                    headers=headers,
-                    allow_redirects=False,
-                )
-                if response.status == HTTP_FOUND:
-                    response = await session.post(
-                        url=self._build_url(URL_LOGIN),
-                        data=self.login_form(),
-                        allow_redirects=False,
-                    )
-                    if (
-                        response.status == HTTP_FOUND
-                        and response.headers.get("Location") == URL_LOGIN
-                    ):
-                        self._raise_auth_error("Invalid credentials")
-                response = await session.request(
-                    url=self._build_url(url),
-                    method=method,
-                    data=data,
-                    headers=headers,
-                    allow_redirects=False,
+            async with self._request_slots, budget.slots if budget else nullcontext():
+                result, size = await self._api_txt_request(
+                    method, url, data, headers, wanted
                 )
-                body = await response.read()
-                str_body = body.decode("utf-8", errors="replace")
-                return self.map_response(str_body)
+            if budget is not None:
+                budget.consume(size)
+        except AcondProApiClientCommunicationError as exception:
+            self.breaker.record_failure(exception)
+            raise
+        except AcondProApiClientError:
+            # The controller answered, if not the way it should have.
+            self.breaker.record_success()
+            raise
+        else:
+            self.breaker.record_success()
+            return result
+        finally:
+            if probe:
+                self.breaker.end_probe()
+
+    async def _api_txt_request(
+        self,
+        method: str,
+        url: str,
+        data: dict | None,
+        headers: dict | None,
+        wanted: frozenset[str] | None,
+    ) -> tuple[Any, int]:
+        """Send a request once a slot is free, return its mapping and size."""
+        try:
+            async with async_timeout.timeout(REQUEST_TIMEOUT):
+                session = self._get_session()
+                logged_in_at = self._logged_in_at
+                if self._session_expiring(logged_in_at):
+                    await self._async_login(session, logged_in_at)
+                    logged_in_at = self._logged_in_at
+                body = await self._async_send(session, method, url, data, headers)
+                if body is None:
+                    # The session expired before we expected it to.
+                    self._learn_session_lifetime(logged_in_at)
+                    await self._async_login(session, logged_in_at)
+                    body = await self._async_send(session, method, url, data, headers)
+                    if body is None:
+                        self._raise_auth_error("Session rejected after login")
+                self._session_confirmed_at = time.monotonic()
+                self.metrics.counters[COUNTER_BYTES] += len(body)
+                self.metrics.last_payload_size = len(body)
+                with self.metrics.measure(STAGE_PARSE):
+                    return self.map_response(body, wanted), len(body)
         except TimeoutError as exception:
             msg = f"Timeout error fetching information - {exception}"
             raise AcondProApiClientCommunicationError(msg) from exception
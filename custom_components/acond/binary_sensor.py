@@ -9,7 +9,7 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
     BinarySensorEntityDescription,
 )
-from homeassistant.const import CONF_MAC
+from homeassistant.const import CONF_MAC, Platform
 
 from . import const
 from .entity import AcondBinarySensorEntityDescription, AcondProEntity
@@ -20,56 +20,27 @@ if TYPE_CHECKING:
 
     from .coordinator import AcondDataUpdateCoordinator
     from .data import AcondProConfigEntry
+    from .registry import TagDefinition
 
-ENTITY_DESCRIPTIONS = (
-    AcondBinarySensorEntityDescription(
-        key="__T2BA2EA36_BOOL_i",
-        name="Main Pump",
-        device_class=BinarySensorDeviceClass.RUNNING,
-        icon="mdi:pump",
-        device_name=const.DEVICE_HEAT_PUMP,
-    ),
-    AcondBinarySensorEntityDescription(
-        key="__T6F64FA70_BOOL_i",
-        name="Circulation Pump",
-        device_class=BinarySensorDeviceClass.RUNNING,
-        icon="mdi:pump",
-        device_name=const.DEVICE_HEAT_PUMP,
-    ),
-    AcondBinarySensorEntityDescription(
-        key="__TE1D81C79_BOOL_i",
-        name="Defrost",
-        icon="mdi:snowflake-melt",
-        device_name=const.DEVICE_HEAT_PUMP,
-    ),
-    AcondBinarySensorEntityDescription(
-        key="__TD3998BF7_BOOL_i",
-        name="Bivalence 1",
-        icon="mdi:heat-wave",
-        device_name=const.DEVICE_HEAT_PUMP,
-    ),
-    AcondBinarySensorEntityDescription(
-        key="__T56A70EC9_BOOL_i",
-        name="Bivalence 2",
-        icon="mdi:heat-wave",
-        device_name=const.DEVICE_HEAT_PUMP,
-    ),
-    AcondBinarySensorEntityDescription(
-        key="__T61E4AC91_BOOL_i",
-        name="Compressor",
-        icon="mdi:heat-pump",
-        device_name=const.DEVICE_HEAT_PUMP,
-    ),
-    AcondBinarySensorEntityDescription(
-        key="__T9FF6A530_BOOL_i",
-        name="Fan",
-        icon="mdi:fan",
-        device_name=const.DEVICE_HEAT_PUMP,
-    ),
+
+def tag_description(definition: TagDefinition) -> AcondBinarySensorEntityDescription:
+    """Describe the binary sensor of a registered tag."""
+    return AcondBinarySensorEntityDescription(
+        key=definition.tag,
+        name=definition.name,
+        icon=definition.icon,
+        device_class=definition.device_class,
+        entity_registry_enabled_default=definition.enabled_default,
+        device_name=definition.device,
+    )
+
+
+DERIVED_ENTITY_DESCRIPTIONS = (
     AcondBinarySensorEntityDescription(
-        key=const.BOILER_HEATING,
-        name="Water Tank Heating",
-        icon="mdi:water-boiler",
+        key=const.DERIVED_SHORT_CYCLING,
+        name="Compressor Short Cycling",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        icon="mdi:sync-alert",
         device_name=const.DEVICE_HEAT_PUMP,
     ),
 )
@@ -86,7 +57,13 @@ async def async_setup_entry(
             coordinator=entry.runtime_data.coordinator,
             entity_description=entity_description,
         )
-        for entity_description in ENTITY_DESCRIPTIONS
+        for entity_description in (
+            *map(
+                tag_description,
+                entry.runtime_data.registry.for_platform(Platform.BINARY_SENSOR),
+            ),
+            *DERIVED_ENTITY_DESCRIPTIONS,
+        )
     )
 
 
@@ -100,13 +77,16 @@ class AcondProBinarySensor(AcondProEntity, BinarySensorEntity):
     ) -> None:
         """Initialize the binary_sensor class."""
         super().__init__(
-            coordinator, entity_description.device_name, entity_description.device_key
+            coordinator,
+            entity_description.device_name,
+            entity_description.device_key,
+            tags=(entity_description.key,),
         )
         mac = coordinator.config_entry.data.get(CONF_MAC, "unknown_mac")
         self.entity_description = entity_description
         self._attr_unique_id = f"{mac}_{entity_description.key}"
 
     @property
-    def is_on(self) -> bool:
+    def is_on(self) -> bool | None:
         """Return true if the binary_sensor is on."""
-        return self.coordinator.data[self.entity_description.key] == "1"
+        return self.coordinator.data.get(self.entity_description.key)
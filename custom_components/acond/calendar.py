@@ -0,0 +1,130 @@
+"""Calendar platform for acond timetables."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from homeassistant.components.calendar import CalendarEntity, CalendarEvent
+from homeassistant.const import CONF_MAC
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, LOGGER
+from .entity import AcondCalendarEntityDescription, AcondProEntity
+from .timetable import iter_periods
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+    from .coordinator import AcondDataUpdateCoordinator
+    from .data import AcondProConfigEntry
+    from .registry import TimetableDefinition
+    from .timetable import AcondTimetables
+
+# The current event is looked for this far ahead.
+EVENT_HORIZON = timedelta(days=7)
+
+
+def timetable_description(
+    definition: TimetableDefinition,
+) -> AcondCalendarEntityDescription:
+    """Describe the calendar of a registered timetable."""
+    return AcondCalendarEntityDescription(
+        key=definition.key,
+        name=definition.name,
+        icon="mdi:calendar-clock",
+        device_name=definition.device,
+    )
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,  # noqa: ARG001 Unused function argument: `hass`
+    entry: AcondProConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the calendar platform."""
+    async_add_entities(
+        AcondProTimetableCalendar(
+            coordinator=entry.runtime_data.coordinator,
+            timetables=entry.runtime_data.timetables,
+            entity_description=timetable_description(definition),
+        )
+        for definition in entry.runtime_data.registry.timetables.values()
+    )
+
+
+class AcondProTimetableCalendar(AcondProEntity, CalendarEntity):
+    """
+    acond timetable as a calendar of the periods it is on.
+
+    The timetable is read when the entity is added and then at most once
+    per TIMETABLE_TTL, it is edited through the set_timetable service.
+    """
+
+    def __init__(
+        self,
+        coordinator: AcondDataUpdateCoordinator,
+        timetables: AcondTimetables,
+        entity_description: AcondCalendarEntityDescription,
+    ) -> None:
+        """Initialize the calendar class."""
+        super().__init__(
+            coordinator,
+            entity_description.device_name,
+            entity_description.device_key,
+        )
+        self._timetables = timetables
+        mac = coordinator.config_entry.data.get(CONF_MAC, "unknown_mac")
+        self.entity_description = entity_description
+        self._attr_unique_id = f"{mac}_timetable_{entity_description.key}"
+
+    async def async_added_to_hass(self) -> None:
+        """Follow edits of the timetable and read it in the background."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._timetables.async_add_listener(self.async_write_ha_state)
+        )
+        self.coordinator.config_entry.async_create_background_task(
+            self.hass,
+            self._async_read(),
+            f"{DOMAIN} read timetable {self.entity_description.key}",
+        )
+
+    async def _async_read(self) -> None:
+        """Read the timetable, leaving it unknown if the controller fails."""
+        try:
+            await self._timetables.async_get(self.entity_description.key)
+        except HomeAssistantError as exception:
+            LOGGER.debug("Could not read timetable: %s", exception)
+
+    @property
+    def event(self) -> CalendarEvent | None:
+        """Return the period in progress or the next one within a week."""
+        if (timetable := self._timetables.cached(self.entity_description.key)) is None:
+            return None
+        now = dt_util.now()
+        period = next(iter_periods(timetable, now, now + EVENT_HORIZON), None)
+        return None if period is None else self._event(*period)
+
+    async def async_get_events(
+        self,
+        hass: HomeAssistant,  # noqa: ARG002 Unused method argument: `hass`
+        start_date: datetime,
+        end_date: datetime,
+    ) -> list[CalendarEvent]:
+        """Return the periods of the timetable within a window, or raise."""
+        timetable = await self._timetables.async_get(self.entity_description.key)
+        return [
+            self._event(start, end)
+            for start, end in iter_periods(
+                timetable, dt_util.as_local(start_date), dt_util.as_local(end_date)
+            )
+        ]
+
+    def _event(self, start: datetime, end: datetime) -> CalendarEvent:
+        """Return the event of an on period."""
+        return CalendarEvent(start=start, end=end, summary=self.entity_description.name)
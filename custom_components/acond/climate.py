@@ -10,7 +10,7 @@ from homeassistant.components.climate import (
     ClimateEntityFeature,
 )
 from homeassistant.components.climate.const import HVACMode
-from homeassistant.const import ATTR_TEMPERATURE, CONF_MAC, UnitOfTemperature
+from homeassistant.const import ATTR_TEMPERATURE, CONF_MAC, Platform, UnitOfTemperature
 
 from . import const
 from .entity import AcondClimateEntityDescription, AcondProEntity
@@ -71,13 +71,21 @@ class AcondProClimate(AcondProEntity, ClimateEntity):
         entity_description: ClimateEntityDescription,
     ) -> None:
         """Initialize the climate class."""
+        registry = coordinator.config_entry.runtime_data.registry
+        self._current_tag = registry.role(Platform.CLIMATE, "current_temperature")
+        self._target_tag = registry.role(Platform.CLIMATE, "target_temperature")
+        self._set_tag = registry.role(Platform.CLIMATE, "set_temperature")
         super().__init__(
-            coordinator, entity_description.device_name, entity_description.device_key
+            coordinator,
+            entity_description.device_name,
+            entity_description.device_key,
+            tags=filter(None, (self._current_tag, self._target_tag)),
         )
         mac = coordinator.config_entry.data.get(CONF_MAC, "unknown_mac")
         self.entity_description = entity_description
         self._attr_unique_id = f"{mac}_{entity_description.key}"
-        self._attr_supported_features = ClimateEntityFeature.TARGET_TEMPERATURE
+        if self._set_tag is not None:
+            self._attr_supported_features = ClimateEntityFeature.TARGET_TEMPERATURE
         self._attr_hvac_modes = [HVACMode.HEAT]
         self._attr_temperature_unit = UnitOfTemperature.CELSIUS
         self._attr_min_temp = 10
@@ -87,12 +95,12 @@ class AcondProClimate(AcondProEntity, ClimateEntity):
     @property
     def current_temperature(self) -> float | None:
         """Return the current temperature."""
-        return float(self.coordinator.data[const.INDOOR_TEMPERATURE_CURRENT])
+        return self.coordinator.data.get(self._current_tag)
 
     @property
     def target_temperature(self) -> float | None:
         """Return the temperature we try to reach."""
-        return float(self.coordinator.data[const.INDOOR_TEMPERATURE_TERGET])
+        return self.coordinator.data.get(self._target_tag)
 
     @property
     def hvac_mode(self) -> str:
@@ -102,10 +110,8 @@ class AcondProClimate(AcondProEntity, ClimateEntity):
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
         temperature = kwargs.get(ATTR_TEMPERATURE)
-        await self.coordinator.config_entry.runtime_data.client.async_set_value(
-            const.INDOOR_TEMPERATURE_TERGET_SET, temperature
-        )
-        await self.coordinator.async_request_refresh()
+        if self._set_tag is not None:
+            await self.coordinator.async_set_values({self._set_tag: temperature})
 
     async def async_set_hvac_mode(self, hvac_mode: str) -> None:
         """Set new target hvac mode."""
@@ -133,12 +139,12 @@ class AcondProClimateBoiler(AcondProEntity, ClimateEntity):
     @property
     def current_temperature(self) -> float | None:
         """Return the current temperature."""
-        return float(self.coordinator.data[const.BOILER_TEMPERATURE_CURRENT])
+        return self.coordinator.data.get(const.BOILER_TEMPERATURE_CURRENT)
 
     @property
     def target_temperature(self) -> float | None:
         """Return the temperature we try to reach."""
-        return float(self.coordinator.data[const.BOILER_TEMPERATURE_TARGET])
+        return self.coordinator.data.get(const.BOILER_TEMPERATURE_TARGET)
 
     @property
     def hvac_mode(self) -> str:
@@ -148,10 +154,9 @@ class AcondProClimateBoiler(AcondProEntity, ClimateEntity):
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
         temperature = kwargs.get(ATTR_TEMPERATURE)
-        await self.coordinator.config_entry.runtime_data.client.async_set_value(
-            const.BOILER_TEMPERATURE_TARGET_SET, temperature
+        await self.coordinator.async_set_values(
+            {const.BOILER_TEMPERATURE_TARGET_SET: temperature}
         )
-        await self.coordinator.async_request_refresh()
 
     async def async_set_hvac_mode(self, hvac_mode: str) -> None:
         """Set new target hvac mode."""
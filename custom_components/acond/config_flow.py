@@ -13,8 +13,8 @@ from homeassistant.const import (
     CONF_PASSWORD,
     CONF_USERNAME,
 )
+from homeassistant.core import callback
 from homeassistant.helpers import selector
-from homeassistant.helpers.aiohttp_client import async_create_clientsession
 from slugify import slugify
 
 from .api import (
@@ -23,16 +23,53 @@ from .api import (
     AcondProApiClientCommunicationError,
     AcondProApiClientError,
 )
-from .const import DOMAIN, ETH2_MAC, LOGGER
+from .const import (
+    CONF_ACTIVE_SCAN_INTERVAL,
+    CONF_IDLE_SCAN_INTERVAL,
+    CONF_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_ACTIVE_SCAN_INTERVAL,
+    DEFAULT_IDLE_SCAN_INTERVAL,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DOMAIN,
+    ETH2_MAC,
+    LOGGER,
+)
 
 DEFAULT_NAME = "Acond Pro"
 
+SCAN_INTERVAL_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=5,
+        max=3600,
+        step=1,
+        unit_of_measurement="s",
+        mode=selector.NumberSelectorMode.BOX,
+    ),
+)
+
+CONCURRENCY_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=1,
+        max=4,
+        step=1,
+        mode=selector.NumberSelectorMode.BOX,
+    ),
+)
+
 
 class AcondFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
     """Config flow for Acond."""
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,  # noqa: ARG004
+    ) -> AcondOptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return AcondOptionsFlowHandler()
+
     async def async_step_reconfigure(
         self, user_input: dict[str, Any] | None = None
     ) -> config_entries.ConfigFlowResult:
@@ -161,6 +198,55 @@ class AcondFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
             ip=ip,
             username=username,
             password=password,
-            session=async_create_clientsession(self.hass, verify_ssl=False),
         )
-        return (await client.login())[ETH2_MAC]
+        try:
+            return (await client.login())[ETH2_MAC]
+        finally:
+            await client.async_close()
+
+
+class AcondOptionsFlowHandler(config_entries.OptionsFlow):
+    """Options flow for Acond."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> config_entries.ConfigFlowResult:
+        """Manage the polling intervals."""
+        _errors = {}
+        if user_input is not None:
+            if (
+                user_input[CONF_ACTIVE_SCAN_INTERVAL]
+                > user_input[CONF_IDLE_SCAN_INTERVAL]
+            ):
+                _errors["base"] = "interval_order"
+            else:
+                return self.async_create_entry(data=user_input)
+
+        options = user_input or self.config_entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_ACTIVE_SCAN_INTERVAL,
+                        default=options.get(
+                            CONF_ACTIVE_SCAN_INTERVAL, DEFAULT_ACTIVE_SCAN_INTERVAL
+                        ),
+                    ): SCAN_INTERVAL_SELECTOR,
+                    vol.Required(
+                        CONF_IDLE_SCAN_INTERVAL,
+                        default=options.get(
+                            CONF_IDLE_SCAN_INTERVAL, DEFAULT_IDLE_SCAN_INTERVAL
+                        ),
+                    ): SCAN_INTERVAL_SELECTOR,
+                    vol.Required(
+                        CONF_MAX_CONCURRENT_REQUESTS,
+                        default=options.get(
+                            CONF_MAX_CONCURRENT_REQUESTS,
+                            DEFAULT_MAX_CONCURRENT_REQUESTS,
+                        ),
+                    ): CONCURRENCY_SELECTOR,
+                }
+            ),
+            errors=_errors,
+        )
@@ -7,6 +7,21 @@ LOGGER: Logger = getLogger(__package__)
 DOMAIN = "acond"
 ATTRIBUTION = "TEST_ATTRIBUTION"
 
+# State attributes of entities showing the snapshot restored on startup.
+ATTR_STALE = "stale"
+ATTR_SNAPSHOT_UPDATED = "snapshot_updated"
+
+CONF_ACTIVE_SCAN_INTERVAL = "active_scan_interval"
+CONF_IDLE_SCAN_INTERVAL = "idle_scan_interval"
+DEFAULT_ACTIVE_SCAN_INTERVAL = 15
+DEFAULT_IDLE_SCAN_INTERVAL = 120
+CONF_MAX_CONCURRENT_REQUESTS = "max_concurrent_requests"
+DEFAULT_MAX_CONCURRENT_REQUESTS = 2
+
+# Budget shared by all controllers configured in one Home Assistant instance.
+HUB_MAX_CONCURRENT_REQUESTS = 6
+HUB_BYTES_PER_SECOND = 256_000
+
 URL_LOGIN = "/SYSWWW/LOGIN.XML"
 URL_HOME = "/PAGE115.XML"
 URL_INFO = "/PAGE121.XML"
@@ -47,3 +62,16 @@ ETH2_MAC = "__T96AFE3EA_STRING[17]_s"
 ETH2_IP = "__T2E79BF72_STRING[16]_s"
 SV_VERSION = "__T073CCE9C_REAL_.2f"
 FV_VERSION = "__TAD1309F0_STRING[6]_s"
+
+"""DERIVED Attributes, computed from the tags on every live update"""
+DERIVED_COP = "derived_cop"
+DERIVED_DELTA_T = "derived_delta_t"
+DERIVED_ELECTRIC_POWER = "derived_electric_power"
+DERIVED_DEFROST_ENERGY = "derived_defrost_energy"
+DERIVED_DEFROST_ENERGY_TOTAL = "derived_defrost_energy_total"
+DERIVED_SHORT_CYCLING = "derived_short_cycling"
+
+# Fired with the record of every finished component cycle, and additionally
+# for compressor short cycles.
+EVENT_CYCLE = f"{DOMAIN}_cycle"
+EVENT_SHORT_CYCLE = f"{DOMAIN}_short_cycle"
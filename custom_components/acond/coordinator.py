@@ -2,18 +2,90 @@
 
 from __future__ import annotations
 
+import time
+from collections import Counter, defaultdict
+from dataclasses import asdict
+from datetime import timedelta
 from typing import TYPE_CHECKING, Any
 
-from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.const import CONF_MAC
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.exceptions import ConfigEntryAuthFailed, HomeAssistantError
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from .api import (
     AcondProApiClientAuthenticationError,
     AcondProApiClientError,
 )
+from .const import (
+    BOILER_HEATING,
+    COMPRESSOR,
+    DEFROST,
+    ELECTRIC_ENERGY,
+    EVENT_CYCLE,
+    EVENT_SHORT_CYCLE,
+    IN_WATER_TEMPARATURE,
+    OUT_WATER_TEMPARATURE,
+    OUTDOR_TEMPERATURE,
+    THERMAL_ENERGY,
+    URL_HOME,
+    URL_INFO,
+)
+from .cycles import COMPONENTS, AcondCycleDetector
+from .data import AcondPage
+from .derived import AcondDerivedMetrics
+from .metrics import COUNTER_REFRESHES, STAGE_MERGE, STAGE_NOTIFY, STAGE_REFRESH
+from .snapshot import AcondSnapshotStore
+from .tags import encode_value, parse_tag_name
+from .timeseries import SERIES, AcondSeriesRecorder
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from datetime import datetime
+    from logging import Logger
+
+    from homeassistant.core import HomeAssistant
+
+    from .api import AcondCircuitBreaker
+    from .cycles import CycleRecord
     from .data import AcondProConfigEntry
+    from .hub import AcondHub
+    from .metrics import AcondMetrics
+
+# Poll at the active interval while any of these are running.
+ACTIVITY_TAGS = (COMPRESSOR, DEFROST, BOILER_HEATING)
+# A refresh slower than this means the controller is struggling, so back off.
+SLOW_REFRESH_SECONDS = 10
+# Tags the coordinator reads itself, for the polling interval, the derived
+# metrics, the cycle detector and the time series.
+INTERNAL_TAGS = frozenset(
+    {
+        *ACTIVITY_TAGS,
+        ELECTRIC_ENERGY,
+        THERMAL_ENERGY,
+        IN_WATER_TEMPARATURE,
+        OUT_WATER_TEMPARATURE,
+        OUTDOR_TEMPERATURE,
+        *COMPONENTS.values(),
+        *SERIES.values(),
+    }
+)
+# Requested refreshes are coalesced into one refresh this much later.
+REFRESH_COOLDOWN = 1.0
+
+# Pages are merged in this order. PAGE121 only carries network settings and
+# versions, so it is re-read on startup, after a failed refresh or every 6 h.
+PAGES = (
+    AcondPage(url=URL_HOME, refresh_interval=timedelta(0)),
+    AcondPage(
+        url=URL_INFO,
+        refresh_interval=timedelta(hours=6),
+        ttl=timedelta(days=1),
+    ),
+)
 
 
 class AcondDataUpdateCoordinator(DataUpdateCoordinator):
@@ -21,11 +93,371 @@ class AcondDataUpdateCoordinator(DataUpdateCoordinator):
 
     config_entry: AcondProConfigEntry
 
+    def __init__(  # noqa: PLR0913
+        self,
+        hass: HomeAssistant,
+        logger: Logger,
+        name: str,
+        *,
+        active_interval: timedelta,
+        idle_interval: timedelta,
+        hub: AcondHub | None = None,
+    ) -> None:
+        """Initialize with the active and idle polling intervals."""
+        super().__init__(
+            hass=hass,
+            logger=logger,
+            name=name,
+            update_interval=idle_interval,
+            request_refresh_debouncer=Debouncer(
+                hass, logger, cooldown=REFRESH_COOLDOWN, immediate=False
+            ),
+        )
+        self.active_interval = active_interval
+        self.idle_interval = idle_interval
+        self._hub = hub
+        # Page url -> (monotonic fetch time, values) of the last good read.
+        self._pages: dict[str, tuple[float, dict[str, Any]]] = {}
+        self._reconnected = True
+        # Page url -> number of subscribed entities reading tags from it.
+        self._page_refs: Counter[str] = Counter()
+        self._internal_pages = frozenset(page.url for page in PAGES)
+        # Pages re-read next refresh for tags their last projection skipped.
+        self._stale_pages: set[str] = set()
+        # Pages fetched until the first entity subscribes.
+        self._initial_pages: frozenset[str] | None = None
+        self._last_write_page: dict[str, Any] | None = None
+        # Page url -> number of written pages stored, to drop reads they overtook.
+        self._page_generations: Counter[str] = Counter()
+        # Tag -> listeners of the entities reading it, see async_add_listener.
+        self._tag_listeners: defaultdict[str, set[CALLBACK_TYPE]] = defaultdict(set)
+        self._untagged_listeners: set[CALLBACK_TYPE] = set()
+        self._notified_data: dict[str, Any] | None = None
+        self._notified_success = False
+        self._snapshot = AcondSnapshotStore(hass, self.config_entry.entry_id)
+        # When the restored snapshot was read, None once live data arrived.
+        self.snapshot_updated: datetime | None = None
+        self.series = AcondSeriesRecorder(hass, self.config_entry.entry_id)
+        self._derived = AcondDerivedMetrics()
+        self.cycles = AcondCycleDetector()
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> CALLBACK_TYPE:
+        """Listen for data updates of the tags given as context."""
+        remove = super().async_add_listener(update_callback, context)
+        tags = context if isinstance(context, frozenset) else None
+        if tags is None:
+            self._untagged_listeners.add(update_callback)
+        for tag in tags or ():
+            self._tag_listeners[tag].add(update_callback)
+        pages = self.config_entry.runtime_data.registry.fetch_plan(tags or ())
+        self._async_reference_pages(pages, tags or frozenset())
+
+        @callback
+        def remove_listener() -> None:
+            remove()
+            self._untagged_listeners.discard(update_callback)
+            for tag in tags or ():
+                self._tag_listeners[tag].discard(update_callback)
+            self._page_refs.subtract(pages)
+
+        return remove_listener
+
+    @property
+    def fetch_plan(self) -> frozenset[str]:
+        """Return the urls of the pages read by the coordinator or its entities."""
+        if self._initial_pages is not None:
+            return self._initial_pages
+        return self._internal_pages.union(
+            url for url, count in self._page_refs.items() if count > 0
+        )
+
+    @callback
+    def async_plan_initial_pages(self) -> None:
+        """
+        Plan the pages of the refreshes before the entities subscribe.
+
+        The pages come from the entities enabled in the entity registry, or
+        are all registered pages when the entry has no entities yet.
+        """
+        registry = self.config_entry.runtime_data.registry
+        self._internal_pages = registry.fetch_plan(INTERNAL_TAGS)
+        entities = er.async_entries_for_config_entry(
+            er.async_get(self.hass), self.config_entry.entry_id
+        )
+        if not entities:
+            self._initial_pages = registry.fetch_plan(registry.tags)
+            return
+        prefix = f"{self.config_entry.data.get(CONF_MAC, 'unknown_mac')}_"
+        tags = set(INTERNAL_TAGS)
+        for entity in entities:
+            if entity.disabled:
+                continue
+            if (tag := entity.unique_id.removeprefix(prefix)) in registry.tags:
+                tags.add(tag)
+            else:
+                tags.update(registry.role_tags(entity.domain))
+        self._initial_pages = registry.fetch_plan(tags)
+
+    @property
+    def wanted_tags(self) -> frozenset[str] | None:
+        """Return the tags parsed from the pages, None for all of them."""
+        if self._initial_pages is not None:
+            return None
+        # Entities also listen to keys the coordinator computes, such as the
+        # derived metrics, which are not on any page.
+        return INTERNAL_TAGS.union(
+            tag
+            for tag, listeners in self._tag_listeners.items()
+            if listeners and parse_tag_name(tag) is not None
+        )
+
+    @callback
+    def _async_reference_pages(
+        self, pages: frozenset[str], tags: frozenset[str]
+    ) -> None:
+        """Count a subscribed entity, refreshing if it reads unparsed tags."""
+        if not pages:
+            return
+        self._initial_pages = None
+        self._page_refs.update(pages)
+        data = self.data or {}
+        registry = self.config_entry.runtime_data.registry
+        if missing := [tag for tag in tags if tag in registry.tags and tag not in data]:
+            # A page or tag that was skipped so far is needed now, even from a
+            # page that is not due for hours.
+            self._stale_pages.update(registry.fetch_plan(missing))
+            self.hass.async_create_task(self.async_request_refresh())
+
+    @property
+    def breaker(self) -> AcondCircuitBreaker:
+        """Return the circuit breaker of the controller's client."""
+        return self.config_entry.runtime_data.client.breaker
+
+    @property
+    def metrics(self) -> AcondMetrics:
+        """Return the refresh instrumentation shared with the client."""
+        return self.config_entry.runtime_data.client.metrics
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update only the listeners whose tags changed since the last update."""
+        with self.metrics.measure(STAGE_NOTIFY):
+            self._async_update_changed_listeners()
+
+    @callback
+    def _async_update_changed_listeners(self) -> None:
+        """Diff the data against the last update and call affected listeners."""
+        previous, self._notified_data = self._notified_data, self.data
+        was_successful = self._notified_success
+        self._notified_success = self.last_update_success
+        if (
+            previous is None
+            or self.data is None
+            or was_successful != self.last_update_success
+        ):
+            # Availability changed or there is nothing to diff against.
+            super().async_update_listeners()
+            return
+        data = self.data
+        changed = {tag for tag, value in data.items() if previous.get(tag) != value}
+        changed.update(previous.keys() - data.keys())
+        callbacks = set(self._untagged_listeners)
+        for tag in changed:
+            callbacks.update(self._tag_listeners.get(tag, ()))
+        for update_callback in callbacks:
+            update_callback()
+
+    async def async_restore_snapshot(self) -> bool:
+        """Publish the saved snapshot until the first live refresh."""
+        if (snapshot := await self._snapshot.async_load()) is None:
+            return False
+        self.snapshot_updated, data, aggregates = snapshot
+        self._derived.restore(aggregates.get("derived", {}))
+        self.async_set_updated_data(data)
+        return True
+
+    async def async_remove_snapshot(self) -> None:
+        """Delete the saved snapshot."""
+        await self._snapshot.async_remove()
+
+    async def async_flush_snapshot(self) -> None:
+        """Write the pending snapshot before the entry unloads."""
+        await self._snapshot.async_flush()
+
+    @callback
+    def _async_publish_live(self, data: dict[str, Any]) -> None:
+        """Derive metrics, save live data and leave the snapshot behind."""
+        self._derived.update(time.monotonic(), data)
+        for record in self.cycles.update(time.time(), data):
+            self._async_fire_cycle(record)
+        self._snapshot.async_save(data, {"derived": self._derived.as_dict()})
+        self.series.async_add(data)
+        if self.snapshot_updated is not None:
+            self.snapshot_updated = None
+            # Rewrite every entity to drop its staleness attribute.
+            self._notified_data = None
+
+    @callback
+    def _async_fire_cycle(self, record: CycleRecord) -> None:
+        """Announce a finished component cycle on the event bus."""
+        event_data = {
+            **asdict(record),
+            "start": dt_util.utc_from_timestamp(record.start).isoformat(),
+            "config_entry_id": self.config_entry.entry_id,
+        }
+        self.hass.bus.async_fire(EVENT_CYCLE, event_data)
+        if record.short:
+            self.hass.bus.async_fire(EVENT_SHORT_CYCLE, event_data)
+
+    def _due_pages(self, now: float) -> list[str]:
+        """Return the urls of the pages that have to be read this cycle."""
+        return [
+            page.url
+            for page in PAGES
+            if page.url in self.fetch_plan
+            and (
+                self._reconnected
+                or page.url in self._stale_pages
+                or page.url not in self._pages
+                or now - self._pages[page.url][0]
+                >= page.refresh_interval.total_seconds()
+            )
+        ]
+
+    def _merge_pages(self, now: float) -> dict[str, Any]:
+        """Merge the cached values of all pages that are still valid."""
+        data: dict[str, Any] = {}
+        for page in PAGES:
+            if (cached := self._pages.get(page.url)) is None:
+                continue
+            fetched, values = cached
+            if page.ttl is None or now - fetched <= page.ttl.total_seconds():
+                data.update(values)
+        return data
+
     async def _async_update_data(self) -> Any:
         """Update data via library."""
+        started = time.monotonic()
+        due = self._due_pages(started)
+        generations = {url: self._page_generations[url] for url in due}
         try:
-            return await self.config_entry.runtime_data.client.async_get_home()
+            fresh = await self.config_entry.runtime_data.client.async_get_pages(
+                due, self.wanted_tags
+            )
         except AcondProApiClientAuthenticationError as exception:
+            self._reconnected = True
             raise ConfigEntryAuthFailed(exception) from exception
         except AcondProApiClientError as exception:
+            self._reconnected = True
+            # Poll again when the breaker lets the next probe through.
+            retry_in = timedelta(seconds=self.breaker.retry_in)
+            self._set_next_interval(max(self.idle_interval, retry_in))
             raise UpdateFailed(exception) from exception
+        now = time.monotonic()
+        self._reconnected = False
+        self._stale_pages.difference_update(fresh)
+        # A page written while it was read keeps the newer written values.
+        self._pages.update(
+            (url, (now, values))
+            for url, values in fresh.items()
+            if self._page_generations[url] == generations[url]
+        )
+        with self.metrics.measure(STAGE_MERGE):
+            data = self._merge_pages(now)
+        self.metrics.counters[COUNTER_REFRESHES] += 1
+        self.metrics.record(STAGE_REFRESH, now - started)
+        self._set_next_interval(self._next_interval(data, now - started))
+        self._async_publish_live(data)
+        return data
+
+    async def async_read_tags(
+        self, tags: Iterable[str], max_age: timedelta | None = None
+    ) -> dict[str, Any]:
+        """
+        Return the values of tags, served from the cached pages when fresh.
+
+        A cached page is fresh while younger than max_age, by default than
+        its refresh interval or the polling interval, whichever is longer.
+        The other tags are read in one projected request per page, on every
+        page for unregistered tags.
+        """
+        tags = frozenset(tags)
+        now = time.monotonic()
+        values: dict[str, Any] = {}
+        for page in PAGES:
+            cached = self._pages.get(page.url)
+            fresh_for = (
+                max_age
+                if max_age is not None
+                else max(page.refresh_interval, self.update_interval or timedelta(0))
+            ).total_seconds()
+            if cached is not None and now - cached[0] < fresh_for:
+                values.update((tag, cached[1][tag]) for tag in tags & cached[1].keys())
+        if missing := tags - values.keys():
+            registry = self.config_entry.runtime_data.registry
+            urls = (
+                registry.fetch_plan(missing)
+                if missing <= registry.tags.keys()
+                else {page.url for page in PAGES}
+            )
+            try:
+                values.update(
+                    await self.config_entry.runtime_data.client.async_read_tags(
+                        missing, sorted(urls)
+                    )
+                )
+            except AcondProApiClientError as exception:
+                raise HomeAssistantError(str(exception)) from exception
+        return {tag: values.get(tag) for tag in sorted(tags)}
+
+    async def async_set_values(self, values: dict[str, Any]) -> None:
+        """
+        Write values to the controller and publish the page it returns.
+
+        Every value is checked against its tag type before any is sent.
+        Failures, the controller's included, raise HomeAssistantError.
+        """
+        registry = self.config_entry.runtime_data.registry
+        if denied := sorted(tag for tag in values if not registry.writable(tag)):
+            msg = f"Tags are not writable: {', '.join(denied)}"
+            raise HomeAssistantError(msg)
+        try:
+            encoded = {tag: encode_value(tag, value) for tag, value in values.items()}
+        except ValueError as exception:
+            raise HomeAssistantError(str(exception)) from exception
+        try:
+            page = await self.config_entry.runtime_data.client.async_set_values(encoded)
+        except AcondProApiClientError as exception:
+            raise HomeAssistantError(str(exception)) from exception
+        if not page:
+            await self.async_request_refresh()
+            return
+        if page is self._last_write_page:
+            # Another write of the same batch has already published it.
+            return
+        self._last_write_page = page
+        # Writes are posted to PAGE115, which answers with its current values.
+        now = time.monotonic()
+        self._pages[URL_HOME] = (now, page)
+        self._page_generations[URL_HOME] += 1
+        data = self._merge_pages(now)
+        self._set_next_interval(self._next_interval(data, 0))
+        self._async_publish_live(data)
+        self.async_set_updated_data(data)
+
+    def _set_next_interval(self, interval: timedelta) -> None:
+        """Schedule the next refresh, aligned to this controller's hub phase."""
+        if self._hub is not None:
+            interval = self._hub.aligned_interval(self, interval)
+        self.update_interval = interval
+
+    def _next_interval(self, data: dict[str, Any], elapsed: float) -> timedelta:
+        """Pick the next polling interval from the pump activity."""
+        if elapsed > SLOW_REFRESH_SECONDS:
+            return self.idle_interval
+        if any(data.get(tag) for tag in ACTIVITY_TAGS):
+            return self.active_interval
+        return self.idle_interval
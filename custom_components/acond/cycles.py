@@ -0,0 +1,191 @@
+"""On/off cycle detection of the heat pump components."""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any
+
+from .const import (
+    BIVALENCE_1,
+    BIVALENCE_2,
+    CIRCULATION_PUMP,
+    COMPRESSOR,
+    DEFROST,
+    DERIVED_ELECTRIC_POWER,
+    DERIVED_SHORT_CYCLING,
+    MAIN_PUMP,
+    OUTDOR_TEMPERATURE,
+)
+
+# Component -> binary tag whose transitions delimit its cycles.
+COMPONENTS = {
+    "compressor": COMPRESSOR,
+    "defrost": DEFROST,
+    "bivalence_1": BIVALENCE_1,
+    "bivalence_2": BIVALENCE_2,
+    "main_pump": MAIN_PUMP,
+    "circulation_pump": CIRCULATION_PUMP,
+}
+# Number of finished cycles of all components kept in the log.
+CYCLE_LOG_SIZE = 500
+DUTY_CYCLE_WINDOW = timedelta(hours=24)
+# A compressor cycle shorter than this is a short cycle, and this many of them
+# within the window raise the short cycling alert.
+SHORT_CYCLE = timedelta(minutes=10)
+SHORT_CYCLE_WINDOW = timedelta(hours=1)
+SHORT_CYCLE_ALERT_COUNT = 3
+SECONDS_PER_HOUR = 3600
+
+
+def cycles_key(component: str) -> str:
+    """Return the data key of the cycle count of a component."""
+    return f"derived_cycles_{component}"
+
+
+def duty_cycle_key(component: str) -> str:
+    """Return the data key of the duty cycle of a component."""
+    return f"derived_duty_cycle_{component}"
+
+
+@dataclass(frozen=True, slots=True)
+class CycleRecord:
+    """A finished on/off cycle of a component."""
+
+    component: str
+    # Epoch timestamp of the start and duration in seconds.
+    start: float
+    duration: float
+    # Electric energy of the whole heat pump during the cycle in kWh.
+    energy: float | None
+    # Outdoor temperature when the cycle started.
+    outdoor_temperature: float | None
+    short: bool
+
+
+class ComponentCycles:
+    """Running cycle count and duty cycle of one component."""
+
+    def __init__(self, component: str) -> None:
+        """Initialize without a reading."""
+        self.component = component
+        self.count = 0
+        self._on: bool | None = None
+        self._first_reading: float | None = None
+        self._last_reading: float | None = None
+        self._started: float | None = None
+        self._energy: float | None = None
+        self._outdoor_temperature: float | None = None
+        # (start, end) of the finished cycles overlapping the duty cycle window.
+        self._window: deque[tuple[float, float]] = deque()
+        self._window_on_time = 0.0
+
+    def update(
+        self,
+        now: float,
+        *,
+        on: bool | None,
+        power: float | None,
+        outdoor_temperature: float | None,
+    ) -> CycleRecord | None:
+        """Track a reading, returning the cycle it finished if any."""
+        if on is None:
+            return None
+        was_on, self._on = self._on, on
+        if self._first_reading is None:
+            self._first_reading = now
+        elapsed = 0.0 if self._last_reading is None else now - self._last_reading
+        self._last_reading = now
+        if self._started is not None and self._energy is not None:
+            # A gap in the power estimate leaves the cycle energy unknown.
+            self._energy = (
+                None
+                if power is None
+                else self._energy + power * elapsed / SECONDS_PER_HOUR
+            )
+        if on and was_on is False:
+            self._started = now
+            self._energy = 0.0
+            self._outdoor_temperature = outdoor_temperature
+            return None
+        if on or self._started is None:
+            # Still running, or stopped without a known start.
+            return None
+        started, self._started = self._started, None
+        duration = now - started
+        self.count += 1
+        self._window.append((started, now))
+        self._window_on_time += duration
+        return CycleRecord(
+            component=self.component,
+            start=started,
+            duration=duration,
+            energy=None if self._energy is None else round(self._energy, 3),
+            outdoor_temperature=self._outdoor_temperature,
+            short=self.component == "compressor"
+            and duration < SHORT_CYCLE.total_seconds(),
+        )
+
+    def duty_cycle(self, now: float) -> float | None:
+        """Return the percentage of the window the component was on."""
+        if self._first_reading is None:
+            return None
+        window = DUTY_CYCLE_WINDOW.total_seconds()
+        window_start = now - window
+        while self._window and self._window[0][1] <= window_start:
+            started, ended = self._window.popleft()
+            self._window_on_time -= ended - started
+        on_time = self._window_on_time
+        if self._window:
+            # Only the oldest cycle can begin before the window.
+            on_time -= max(0.0, window_start - self._window[0][0])
+        if self._started is not None:
+            on_time += now - max(self._started, window_start)
+        elapsed = min(window, now - self._first_reading)
+        return round(100 * on_time / elapsed, 1) if elapsed > 0 else None
+
+
+class AcondCycleDetector:
+    """
+    Cycles of all components, detected from the transitions of each update.
+
+    Counts and duty cycles are running aggregates, so nothing is scanned
+    but the few cycles leaving the windows.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the trackers and the empty log."""
+        self._components = {
+            component: ComponentCycles(component) for component in COMPONENTS
+        }
+        self.log: deque[CycleRecord] = deque(maxlen=CYCLE_LOG_SIZE)
+        self._short_cycles: deque[float] = deque()
+
+    def update(self, now: float, data: dict[str, Any]) -> list[CycleRecord]:
+        """Add the cycle values to the data of an update, return finished cycles."""
+        finished = []
+        power = data.get(DERIVED_ELECTRIC_POWER)
+        outdoor_temperature = data.get(OUTDOR_TEMPERATURE)
+        for component, tag in COMPONENTS.items():
+            cycles = self._components[component]
+            record = cycles.update(
+                now,
+                on=data.get(tag),
+                power=power,
+                outdoor_temperature=outdoor_temperature,
+            )
+            if record is not None:
+                finished.append(record)
+                self.log.append(record)
+                if record.short:
+                    self._short_cycles.append(now)
+            data[cycles_key(component)] = cycles.count
+            data[duty_cycle_key(component)] = cycles.duty_cycle(now)
+        while (
+            self._short_cycles
+            and now - self._short_cycles[0] > SHORT_CYCLE_WINDOW.total_seconds()
+        ):
+            self._short_cycles.popleft()
+        data[DERIVED_SHORT_CYCLING] = len(self._short_cycles) >= SHORT_CYCLE_ALERT_COUNT
+        return finished
@@ -6,11 +6,15 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from datetime import timedelta
+
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.loader import Integration
 
     from .api import AcondProApiClient
     from .coordinator import AcondDataUpdateCoordinator
+    from .registry import TagRegistry
+    from .timetable import AcondTimetables
 
 
 type AcondProConfigEntry = ConfigEntry[AcondProData]
@@ -23,3 +27,16 @@ class AcondProData:
     client: AcondProApiClient
     coordinator: AcondDataUpdateCoordinator
     integration: Integration
+    registry: TagRegistry
+    timetables: AcondTimetables
+
+
+@dataclass(frozen=True, kw_only=True)
+class AcondPage:
+    """A controller page and how often it has to be refreshed."""
+
+    url: str
+    # Re-read the page once its cached copy is older than this.
+    refresh_interval: timedelta
+    # Drop the cached copy once it is older than this, None keeps it forever.
+    ttl: timedelta | None = None
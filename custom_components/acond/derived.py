@@ -0,0 +1,163 @@
+"""Metrics derived incrementally from the raw tags."""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Any
+
+from .const import (
+    DEFROST,
+    DERIVED_COP,
+    DERIVED_DEFROST_ENERGY,
+    DERIVED_DEFROST_ENERGY_TOTAL,
+    DERIVED_DELTA_T,
+    DERIVED_ELECTRIC_POWER,
+    ELECTRIC_ENERGY,
+    IN_WATER_TEMPARATURE,
+    OUT_WATER_TEMPARATURE,
+    THERMAL_ENERGY,
+)
+
+# THERMAL_ENERGY is counted in whole GJ, ELECTRIC_ENERGY in kWh.
+KWH_PER_GJ = 1e6 / 3600
+# The COP is averaged over this many of the last thermal counter steps. A step
+# is 277.8 kWh of heat, which can take days, so no time window is used.
+COP_STEPS = 3
+SECONDS_PER_HOUR = 3600
+
+
+class CounterRate:
+    """Rate of a cumulative counter between its last two changes."""
+
+    def __init__(self) -> None:
+        """Initialize without a reading."""
+        self._value: float | None = None
+        self._changed: float | None = None
+        self._step: tuple[float, float] | None = None
+
+    def update(self, now: float, value: float | None) -> float | None:
+        """
+        Return the rate per hour at a new reading of the counter.
+
+        The rate decays once the counter stops changing, as the next step
+        can at the earliest come now.
+        """
+        if value is None:
+            return None
+        if self._value is None or value < self._value:
+            # First reading or a counter reset, the time of a step is unknown.
+            self._value, self._changed, self._step = value, None, None
+            return None
+        if value > self._value:
+            if self._changed is not None:
+                self._step = (value - self._value, now - self._changed)
+            self._value, self._changed = value, now
+        if self._step is None or self._changed is None:
+            return None
+        increase, seconds = self._step
+        return increase * SECONDS_PER_HOUR / max(seconds, now - self._changed)
+
+
+class AcondDerivedMetrics:
+    """
+    COP, delta-T, electric power and defrost energy estimates.
+
+    Every update costs constant time: only the last COP_STEPS + 1 thermal
+    counter steps are kept. The steps and the defrost energy are saved with
+    the snapshot, see as_dict, so they survive restarts.
+    """
+
+    def __init__(self, cop_steps: int = COP_STEPS) -> None:
+        """Initialize the running aggregates."""
+        # (thermal kWh, electric kWh) at the last thermal counter steps.
+        self._steps: deque[tuple[float, float]] = deque(maxlen=cop_steps + 1)
+        self._electric = CounterRate()
+        self._thermal_reading: float | None = None
+        self._defrost_started: tuple[float, float | None] | None = None
+        self._defrost_energy: float | None = None
+        self._defrost_energy_total = 0.0
+
+    def update(self, now: float, data: dict[str, Any]) -> None:
+        """Add the derived values to the data of a live update."""
+        electric = data.get(ELECTRIC_ENERGY)
+        thermal = data.get(THERMAL_ENERGY)
+        if thermal is not None:
+            thermal *= KWH_PER_GJ
+        data[DERIVED_COP] = self._update_cop(electric, thermal)
+        data[DERIVED_DELTA_T] = _delta_t(data)
+        power = self._electric.update(now, electric)
+        data[DERIVED_ELECTRIC_POWER] = _round(power, 2)
+        self._update_defrost(now, defrost=data.get(DEFROST), power=power)
+        data[DERIVED_DEFROST_ENERGY] = _round(self._defrost_energy, 3)
+        data[DERIVED_DEFROST_ENERGY_TOTAL] = round(self._defrost_energy_total, 3)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the aggregates worth keeping across restarts."""
+        return {
+            "cop_steps": list(self._steps),
+            "defrost_energy": self._defrost_energy,
+            "defrost_energy_total": self._defrost_energy_total,
+        }
+
+    def restore(self, saved: dict[str, Any]) -> None:
+        """Continue from aggregates returned by as_dict before a restart."""
+        self._steps.extend(
+            (float(thermal), float(electric))
+            for thermal, electric in saved.get("cop_steps", ())
+        )
+        self._defrost_energy = saved.get("defrost_energy")
+        self._defrost_energy_total = float(saved.get("defrost_energy_total", 0.0))
+
+    def _update_cop(
+        self, electric: float | None, thermal: float | None
+    ) -> float | None:
+        """Return the COP between the first and last kept thermal step."""
+        steps = self._steps
+        if electric is not None and thermal is not None:
+            previous, self._thermal_reading = self._thermal_reading, thermal
+            if steps and thermal < steps[-1][0]:
+                # The counters were reset.
+                steps.clear()
+            elif previous is not None and thermal > previous:
+                # The first reading is not a step, the counter may have
+                # stepped any time before it, while HA was stopped too.
+                steps.append((thermal, electric))
+        if len(steps) < 2:  # noqa: PLR2004
+            return None
+        first_thermal, first_electric = steps[0]
+        last_thermal, last_electric = steps[-1]
+        if last_electric <= first_electric:
+            return None
+        return round(
+            (last_thermal - first_thermal) / (last_electric - first_electric), 2
+        )
+
+    def _update_defrost(
+        self, now: float, *, defrost: bool | None, power: float | None
+    ) -> None:
+        """Estimate the electric energy of a defrost cycle when it ends."""
+        if defrost and self._defrost_started is None:
+            self._defrost_started = (now, power)
+        elif not defrost and self._defrost_started is not None:
+            started, started_power = self._defrost_started
+            self._defrost_started = None
+            if started_power is None:
+                return
+            # The counter is too coarse for a cycle of a few minutes, so the
+            # power drawn when the cycle started is extrapolated.
+            self._defrost_energy = started_power * (now - started) / SECONDS_PER_HOUR
+            self._defrost_energy_total += self._defrost_energy
+
+
+def _delta_t(data: dict[str, Any]) -> float | None:
+    """Return the difference of the outlet and inlet water temperatures."""
+    supply = data.get(OUT_WATER_TEMPARATURE)
+    ret = data.get(IN_WATER_TEMPARATURE)
+    if supply is None or ret is None:
+        return None
+    return round(supply - ret, 1)
+
+
+def _round(value: float | None, digits: int) -> float | None:
+    """Round a value that may be missing."""
+    return None if value is None else round(value, digits)
@@ -0,0 +1,53 @@
+"""Diagnostics support for acond."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.const import CONF_IP_ADDRESS, CONF_MAC, CONF_PASSWORD, CONF_USERNAME
+
+from .const import ETH2_IP, ETH2_MAC
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .data import AcondProConfigEntry
+
+TO_REDACT = {
+    CONF_IP_ADDRESS,
+    CONF_MAC,
+    CONF_PASSWORD,
+    CONF_USERNAME,
+    ETH2_IP,
+    ETH2_MAC,
+}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant,  # noqa: ARG001 Unused function argument: `hass`
+    entry: AcondProConfigEntry,
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = entry.runtime_data.coordinator
+    return {
+        "entry": {
+            "data": async_redact_data(entry.data, TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "update_interval": str(coordinator.update_interval),
+            "snapshot_updated": coordinator.snapshot_updated,
+            "fetch_plan": sorted(coordinator.fetch_plan),
+            "breaker": {
+                "state": coordinator.breaker.state,
+                "failures": coordinator.breaker.failures,
+                "retry_in": round(coordinator.breaker.retry_in),
+            },
+        },
+        "metrics": coordinator.metrics.as_dict(),
+        "cycles": [asdict(record) for record in coordinator.cycles.log],
+        "data": async_redact_data(coordinator.data or {}, TO_REDACT),
+    }
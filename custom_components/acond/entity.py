@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.binary_sensor import BinarySensorEntityDescription
+from homeassistant.components.calendar import CalendarEntityDescription
 from homeassistant.components.climate import ClimateEntityDescription
 from homeassistant.components.select import SelectEntityDescription
 from homeassistant.components.sensor import SensorEntityDescription
@@ -15,9 +17,16 @@ from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import EntityDescription
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import ATTRIBUTION
+from .const import ATTR_SNAPSHOT_UPDATED, ATTR_STALE, ATTRIBUTION
 from .coordinator import AcondDataUpdateCoordinator
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from homeassistant.helpers.typing import StateType
+
+    from .metrics import AcondMetrics
+
 
 class AcondProEntity(CoordinatorEntity[AcondDataUpdateCoordinator]):
     """AcondEntity class."""
@@ -25,10 +34,19 @@ class AcondProEntity(CoordinatorEntity[AcondDataUpdateCoordinator]):
     _attr_attribution = ATTRIBUTION
 
     def __init__(
-        self, coordinator: AcondDataUpdateCoordinator, device_name: str, device_key: str
+        self,
+        coordinator: AcondDataUpdateCoordinator,
+        device_name: str,
+        device_key: str,
+        tags: Iterable[str] = (),
     ) -> None:
-        """Initialize."""
-        super().__init__(coordinator)
+        """
+        Initialize.
+
+        The entity is only written when one of the given tags changes, or on
+        every update when it does not name any.
+        """
+        super().__init__(coordinator, context=frozenset(tags) or None)
         self._attr_has_entity_name = True
         self._attr_device_info = DeviceInfo(
             identifiers={
@@ -43,6 +61,13 @@ class AcondProEntity(CoordinatorEntity[AcondDataUpdateCoordinator]):
             manufacturer="Acond",
         )
 
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Flag values restored from the snapshot saved before a restart."""
+        if (updated := self.coordinator.snapshot_updated) is None:
+            return None
+        return {ATTR_STALE: True, ATTR_SNAPSHOT_UPDATED: updated.isoformat()}
+
 
 @dataclass(frozen=True, kw_only=True)
 class AcondBaseDescription(EntityDescription):
@@ -61,6 +86,13 @@ class AcondSensorEntityDescription(SensorEntityDescription, AcondBaseDescription
     """Hybrid for sensorów."""
 
 
+@dataclass(frozen=True, kw_only=True)
+class AcondMetricSensorEntityDescription(AcondSensorEntityDescription):
+    """Sensor reading the refresh instrumentation instead of a tag."""
+
+    value_fn: Callable[[AcondMetrics], StateType]
+
+
 @dataclass(frozen=True, kw_only=True)
 class AcondBinarySensorEntityDescription(
     BinarySensorEntityDescription, AcondBaseDescription
@@ -85,6 +117,11 @@ class AcondSelectEntityDescription(SelectEntityDescription, AcondBaseDescription
     """Hybrid for select."""
 
 
+@dataclass(frozen=True, kw_only=True)
+class AcondCalendarEntityDescription(CalendarEntityDescription, AcondBaseDescription):
+    """Hybrid for a timetable calendar."""
+
+
 @dataclass(frozen=True, kw_only=True)
 class AcondClimateEntityDescription(ClimateEntityDescription, AcondBaseDescription):
     """Hybrid for sensorów."""
@@ -0,0 +1,90 @@
+"""Scheduling and connection budget shared by all acond controllers."""
+
+from __future__ import annotations
+
+import math
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+import aiohttp
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.ssl import get_default_no_verify_context
+
+from .api import KEEPALIVE_TIMEOUT, AcondProRequestBudget
+from .const import DOMAIN, HUB_BYTES_PER_SECOND, HUB_MAX_CONCURRENT_REQUESTS
+
+if TYPE_CHECKING:
+    from .coordinator import AcondDataUpdateCoordinator
+
+HUB_KEY: HassKey[AcondHub] = HassKey(DOMAIN)
+
+
+@callback
+def async_get_hub(hass: HomeAssistant) -> AcondHub:
+    """Return the hub, creating it for the first controller."""
+    if (hub := hass.data.get(HUB_KEY)) is None:
+        hub = hass.data[HUB_KEY] = AcondHub(hass)
+    return hub
+
+
+class AcondHub:
+    """
+    Registry of every controller coordinator.
+
+    Refreshes are given evenly spaced phases so that several controllers
+    do not poll in bursts, and all clients share one connector (which
+    keeps a pool per host) and one request budget.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the shared connector and budget."""
+        self._hass = hass
+        self._coordinators: list[AcondDataUpdateCoordinator] = []
+        # The controllers use self-signed certificates. Home Assistant builds
+        # its non-verifying context once at startup, off the event loop.
+        self.connector = aiohttp.TCPConnector(
+            ssl=get_default_no_verify_context(),
+            limit=HUB_MAX_CONCURRENT_REQUESTS,
+            keepalive_timeout=KEEPALIVE_TIMEOUT,
+        )
+        self.budget = AcondProRequestBudget(
+            HUB_MAX_CONCURRENT_REQUESTS, HUB_BYTES_PER_SECOND
+        )
+
+    @callback
+    def async_register(self, coordinator: AcondDataUpdateCoordinator) -> CALLBACK_TYPE:
+        """Register a coordinator, returning the callback that removes it."""
+        self._coordinators.append(coordinator)
+
+        @callback
+        def unregister() -> None:
+            self._coordinators.remove(coordinator)
+            if not self._coordinators:
+                self._hass.data.pop(HUB_KEY, None)
+                self._hass.async_create_task(self._async_close())
+
+        return unregister
+
+    async def _async_close(self) -> None:
+        """Close the shared connector after the last controller is gone."""
+        await self.connector.close()
+
+    def aligned_interval(
+        self, coordinator: AcondDataUpdateCoordinator, interval: timedelta
+    ) -> timedelta:
+        """
+        Stretch an interval so the refresh lands on the coordinator's phase.
+
+        Phases are spread evenly over the interval and the result is never
+        shorter than half of it.
+        """
+        if len(self._coordinators) < 2 or coordinator not in self._coordinators:  # noqa: PLR2004
+            return interval
+        seconds = interval.total_seconds()
+        phase = (
+            self._coordinators.index(coordinator) * seconds / len(self._coordinators)
+        )
+        now = self._hass.loop.time()
+        slot = math.ceil((now + seconds / 2 - phase) / seconds)
+        return timedelta(seconds=phase + slot * seconds - now)
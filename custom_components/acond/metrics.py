@@ -0,0 +1,81 @@
+"""Refresh hot-path instrumentation for acond."""
+
+from __future__ import annotations
+
+import time
+from collections import Counter, defaultdict, deque
+from contextlib import contextmanager
+from statistics import fmean
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# Number of recent samples kept per stage.
+SAMPLE_SIZE = 100
+
+STAGE_CONNECT = "connect"  # TCP connect and TLS handshake of a new connection
+STAGE_REQUEST = "request"  # one HTTP round-trip including the body
+STAGE_LOGIN = "login"
+STAGE_PARSE = "parse"
+STAGE_MERGE = "merge"
+STAGE_NOTIFY = "notify"  # diffing the data and updating entities
+STAGE_REFRESH = "refresh"  # a whole coordinator refresh
+
+COUNTER_CONNECTIONS = "connections"
+COUNTER_REQUESTS = "requests"
+COUNTER_LOGINS = "logins"
+COUNTER_REFRESHES = "refreshes"
+COUNTER_BYTES = "bytes_received"
+
+
+class AcondMetrics:
+    """Ring buffers of recent stage timings and running counters."""
+
+    def __init__(self, size: int = SAMPLE_SIZE) -> None:
+        """Initialize empty buffers."""
+        self._samples: defaultdict[str, deque[float]] = defaultdict(
+            lambda: deque(maxlen=size)
+        )
+        self.counters: Counter[str] = Counter()
+        self.last_payload_size: int | None = None
+
+    def record(self, stage: str, seconds: float) -> None:
+        """Record how long a stage took."""
+        self._samples[stage].append(seconds)
+
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        """Record how long the wrapped block took."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._samples[stage].append(time.perf_counter() - started)
+
+    def last_ms(self, stage: str) -> float | None:
+        """Return the latest duration of a stage in milliseconds."""
+        samples = self._samples.get(stage)
+        return round(samples[-1] * 1000, 1) if samples else None
+
+    def mean_ms(self, stage: str) -> float | None:
+        """Return the mean duration of the recent samples in milliseconds."""
+        samples = self._samples.get(stage)
+        return round(fmean(samples) * 1000, 1) if samples else None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Summarize the stages and counters."""
+        return {
+            "stages": {
+                stage: {
+                    "samples": len(samples),
+                    "last_ms": self.last_ms(stage),
+                    "mean_ms": self.mean_ms(stage),
+                    "max_ms": round(max(samples) * 1000, 1),
+                }
+                for stage, samples in self._samples.items()
+                if samples
+            },
+            "counters": dict(self.counters),
+            "last_payload_size": self.last_payload_size,
+        }
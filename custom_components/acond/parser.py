@@ -0,0 +1,106 @@
+"""Parser for the XML pages served by the Acond controller."""
+
+from __future__ import annotations
+
+import os
+import re
+from functools import lru_cache
+from html import unescape
+from typing import Any
+
+from .tags import decode_value
+
+# Every page is a flat list of <INPUT NAME="..." VALUE="..."/> elements written
+# by the controller firmware, so a single precompiled scan over the raw body is
+# enough and no DOM has to be built. The firmware writes NAME before VALUE,
+# both double quoted, which the fast scan relies on. Pages laid out otherwise
+# take the slower scan, which finds each attribute by a lookahead of its own,
+# in any order and either quote style, capturing (quote, NAME, quote, VALUE).
+# VALUE is optional there, an element without it has no VALUE quote.
+_INPUT_RE = re.compile(rb'<INPUT\s[^>]*?NAME="([^"]*)"[^>]*?VALUE="([^"]*)"')
+_ANY_NAME = rb"""(?=[^>]*?\sNAME\s*=\s*(["'])(%s)\1)"""
+_ANY_VALUE = rb"""(?:(?=[^>]*?\sVALUE\s*=\s*(["'])(.*?)\3))?"""
+_ANY_INPUT_RE = re.compile(rb"<INPUT" + _ANY_NAME % rb".*?" + _ANY_VALUE)
+
+
+def _decode_entities(raw: bytes) -> str:
+    """Decode an attribute value that contains XML entities."""
+    return unescape(raw.decode("utf-8", errors="replace"))
+
+
+def _decode_text(raw: bytes) -> str:
+    """Decode an attribute value, unescaping entities only where present."""
+    if b"&" in raw:
+        return _decode_entities(raw)
+    return raw.decode("utf-8", errors="replace")
+
+
+def _firmware_layout(body: bytes) -> bool:
+    """Return whether every element is written as the fast scan expects."""
+    inputs = body.count(b"<INPUT")
+    return body.count(b'<INPUT NAME="') == inputs == body.count(b' VALUE="')
+
+
+@lru_cache(maxsize=8)
+def _projection(wanted: frozenset[str], *, firmware_layout: bool) -> re.Pattern[bytes]:
+    """
+    Compile a scan matching only the elements of the wanted tags.
+
+    The regex engine rejects every other NAME while scanning, so skipped
+    elements never become match objects. Tag names share their "__T"
+    prefix, which is factored out of the alternation.
+    """
+    names = sorted(wanted)
+    prefix = os.path.commonprefix(names)  # noqa: RUF071
+    alternatives = b"|".join(re.escape(name[len(prefix) :].encode()) for name in names)
+    name = re.escape(prefix.encode()) + b"(?:" + alternatives + b")"
+    if firmware_layout:
+        return re.compile(b'NAME="(' + name + b')"[^>]*?VALUE="([^"]*)"')
+    return re.compile(rb"<INPUT" + _ANY_NAME % name + _ANY_VALUE)
+
+
+def _scan(
+    body: bytes, wanted: frozenset[str] | None
+) -> list[tuple[bytes, bytes | None]]:
+    """Return the raw NAME and VALUE, None if absent, of the (wanted) elements."""
+    firmware_layout = _firmware_layout(body)
+    if wanted is not None:
+        pattern = _projection(wanted, firmware_layout=firmware_layout)
+    else:
+        pattern = _INPUT_RE if firmware_layout else _ANY_INPUT_RE
+    if firmware_layout:
+        return pattern.findall(body)
+    return [
+        (name, value if quote else None)
+        for _, name, quote, value in pattern.findall(body)
+    ]
+
+
+def parse_inputs(body: bytes) -> dict[str, str | None]:
+    """Map every INPUT element of a page body to a NAME -> VALUE dict."""
+    return {
+        name.decode("utf-8", errors="replace"): (
+            _decode_text(value) if value is not None else None
+        )
+        for name, value in _scan(body, None)
+    }
+
+
+def parse_values(body: bytes, wanted: frozenset[str] | None = None) -> dict[str, Any]:
+    """
+    Map the INPUT elements of a page body to typed tag values in one pass.
+
+    With wanted tags given, every other element is skipped by the scan.
+    Missing and malformed values become None, see tags.decode_value.
+    """
+    if wanted is not None and not wanted:
+        return {}
+    values: dict[str, Any] = {}
+    for raw_name, raw_value in _scan(body, wanted):
+        name = raw_name.decode("utf-8", errors="replace")
+        values[name] = (
+            decode_value(name, _decode_text(raw_value))
+            if raw_value is not None
+            else None
+        )
+    return values
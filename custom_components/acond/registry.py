@@ -0,0 +1,235 @@
+"""Declarative registry of the controller tags used by acond."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.const import Platform
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DEVICE_HEAT_PUMP, DOMAIN, URL_HOME, URL_INFO, URL_TIMETABLES_1
+from .tags import TagType, decoder_for, parse_tag_name
+from .timetable import WEEKDAYS
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from homeassistant.core import HomeAssistant
+
+REGISTRY_FILE = Path(__file__).parent / "registry.json"
+REGISTRY_VERSION = 1
+REGISTRY_KEY: HassKey[TagRegistry] = HassKey(f"{DOMAIN}_registry")
+
+PAGES = frozenset({URL_HOME, URL_INFO, URL_TIMETABLES_1})
+# Platforms whose entities are generated one per tag.
+TAG_PLATFORMS = frozenset(
+    {Platform.SENSOR, Platform.BINARY_SENSOR, Platform.SELECT, Platform.SWITCH}
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class TagDefinition:
+    """Where a tag is read from and which entity shows or writes it."""
+
+    tag: str
+    page: str
+    # Platform of the entity generated for this tag alone, if any.
+    platform: Platform | None = None
+    device: str = DEVICE_HEAT_PUMP
+    name: str | None = None
+    icon: str | None = None
+    unit: str | None = None
+    device_class: str | None = None
+    state_class: str | None = None
+    enabled_default: bool = True
+    writable: bool = False
+    # Select option -> value written to the tag.
+    options: dict[str, str] | None = None
+    # "<platform>.<role>" of the composite entities using the tag, such as
+    # "climate.target_temperature".
+    roles: tuple[str, ...] = ()
+
+    @property
+    def decoder(self) -> Callable[[str], Any]:
+        """Return the decoder of the tag's raw page values."""
+        return decoder_for(self.tag)
+
+
+@dataclass(frozen=True, kw_only=True)
+class TimetableDefinition:
+    """The INT tags holding the slots of a timetable, in minutes of the day."""
+
+    key: str
+    page: str
+    name: str
+    device: str = DEVICE_HEAT_PUMP
+    # Weekday -> (start tag, end tag) of each of its slots, Monday first.
+    slots: tuple[tuple[tuple[str, str], ...], ...]
+
+    @property
+    def tags(self) -> frozenset[str]:
+        """Return all the tags of the timetable."""
+        return frozenset(tag for day in self.slots for slot in day for tag in slot)
+
+
+class TagRegistry:
+    """Lookup of the registered tags by platform, role and page."""
+
+    def __init__(
+        self,
+        definitions: Iterable[TagDefinition],
+        timetables: Iterable[TimetableDefinition] = (),
+    ) -> None:
+        """Index the definitions."""
+        self.tags = {definition.tag: definition for definition in definitions}
+        self.timetables = {timetable.key: timetable for timetable in timetables}
+        self._roles = {
+            role: definition
+            for definition in self.tags.values()
+            for role in definition.roles
+        }
+
+    def for_platform(self, platform: Platform) -> list[TagDefinition]:
+        """Return the tags that get an entity of their own on a platform."""
+        return [
+            definition
+            for definition in self.tags.values()
+            if definition.platform is platform
+        ]
+
+    def role(self, platform: Platform, role: str) -> str | None:
+        """Return the tag filling a role of a composite entity, if registered."""
+        definition = self._roles.get(f"{platform}.{role}")
+        return definition.tag if definition is not None else None
+
+    def role_tags(self, platform: str) -> set[str]:
+        """Return the tags filling any role of a composite entity platform."""
+        prefix = f"{platform}."
+        return {
+            definition.tag
+            for role, definition in self._roles.items()
+            if role.startswith(prefix)
+        }
+
+    def has_entities(self, platform: Platform) -> bool:
+        """Return true if any registered tag gets an entity on a platform."""
+        if platform is Platform.CALENDAR:
+            return bool(self.timetables)
+        prefix = f"{platform}."
+        return any(
+            definition.platform is platform
+            or any(role.startswith(prefix) for role in definition.roles)
+            for definition in self.tags.values()
+        )
+
+    def writable(self, tag: str) -> bool:
+        """Return true if the tag may be written."""
+        definition = self.tags.get(tag)
+        return definition is not None and definition.writable
+
+    def fetch_plan(self, tags: Iterable[str]) -> frozenset[str]:
+        """Return the urls of the pages the given tags are read from."""
+        return frozenset(self.tags[tag].page for tag in tags if tag in self.tags)
+
+
+def _parse_definition(tag: str, raw: dict[str, Any]) -> TagDefinition:
+    """Validate one registry entry."""
+    if parse_tag_name(tag) is None:
+        msg = f"{tag} does not follow the tag name schema"
+        raise ValueError(msg)
+    if raw.get("page") not in PAGES:
+        msg = f"{tag} is read from unknown page {raw.get('page')!r}"
+        raise ValueError(msg)
+    platform = Platform(raw["platform"]) if "platform" in raw else None
+    if platform is not None and (platform not in TAG_PLATFORMS or "name" not in raw):
+        msg = f"{tag} needs a name and one of {sorted(TAG_PLATFORMS)} as platform"
+        raise ValueError(msg)
+    if platform in {Platform.SELECT, Platform.SWITCH} and not raw.get("writable"):
+        msg = f"{tag} has to be writable to be a {platform}"
+        raise ValueError(msg)
+    if platform is Platform.SELECT and not raw.get("options"):
+        msg = f"{tag} needs options to be a select"
+        raise ValueError(msg)
+    return TagDefinition(
+        tag=tag,
+        page=raw["page"],
+        platform=platform,
+        device=raw.get("device", DEVICE_HEAT_PUMP),
+        name=raw.get("name"),
+        icon=raw.get("icon"),
+        unit=raw.get("unit"),
+        device_class=raw.get("device_class"),
+        state_class=raw.get("state_class"),
+        enabled_default=raw.get("enabled_default", True),
+        writable=raw.get("writable", False),
+        options=raw.get("options"),
+        roles=tuple(raw.get("roles", ())),
+    )
+
+
+def _parse_timetable(
+    key: str, raw: dict[str, Any], tags: dict[str, TagDefinition]
+) -> TimetableDefinition:
+    """Validate one timetable entry against the registered tags."""
+    if raw.get("page") not in PAGES or "name" not in raw:
+        msg = f"Timetable {key} needs a name and a known page"
+        raise ValueError(msg)
+    if set(raw.get("slots", ())) != set(WEEKDAYS):
+        msg = f"Timetable {key} needs the slots of every weekday"
+        raise ValueError(msg)
+    slots = tuple(
+        tuple((start, end) for start, end in raw["slots"][weekday])
+        for weekday in WEEKDAYS
+    )
+    for day in slots:
+        for tag in (tag for slot in day for tag in slot):
+            definition = tags.get(tag)
+            if (
+                definition is None
+                or not definition.writable
+                or definition.page != raw["page"]
+                or parse_tag_name(tag).type is not TagType.INT
+            ):
+                msg = (
+                    f"Timetable {key} slot tag {tag} is not a writable INT tag"
+                    f" registered on {raw['page']}"
+                )
+                raise ValueError(msg)
+    return TimetableDefinition(
+        key=key,
+        page=raw["page"],
+        name=raw["name"],
+        device=raw.get("device", DEVICE_HEAT_PUMP),
+        slots=slots,
+    )
+
+
+def load_registry(path: Path = REGISTRY_FILE) -> TagRegistry:
+    """Load and validate a registry file."""
+    raw = json.loads(path.read_text(encoding="utf-8"))
+    if raw.get("version") != REGISTRY_VERSION:
+        msg = f"Unsupported tag registry version {raw.get('version')!r}"
+        raise ValueError(msg)
+    tags = {
+        tag: _parse_definition(tag, definition)
+        for tag, definition in raw["tags"].items()
+    }
+    return TagRegistry(
+        tags.values(),
+        (
+            _parse_timetable(key, timetable, tags)
+            for key, timetable in raw.get("timetables", {}).items()
+        ),
+    )
+
+
+async def async_get_registry(hass: HomeAssistant) -> TagRegistry:
+    """Return the registry, loading it for the first controller."""
+    if (registry := hass.data.get(REGISTRY_KEY)) is None:
+        registry = hass.data[REGISTRY_KEY] = await hass.async_add_executor_job(
+            load_registry
+        )
+    return registry
@@ -7,7 +7,6 @@ from typing import TYPE_CHECKING
 from homeassistant.components.select import SelectEntity, SelectEntityDescription
 from homeassistant.const import Platform
 
-from . import const
 from .entity import AcondProEntity, AcondSelectEntityDescription
 
 if TYPE_CHECKING:
@@ -16,29 +15,19 @@ if TYPE_CHECKING:
 
     from .coordinator import AcondDataUpdateCoordinator
     from .data import AcondProConfigEntry
-
-# Definicja dostępnych opcji i identyfikatorów zmiennych
-# W tym przykładzie, 'key' to unikalny identyfikator parametru z API Acond,
-# a 'options' to mapa 'wyświetlana_nazwa': 'wartość_do_wysłania_do_API'.
-SELECT_ENTITY_DESCRIPTIONS = (
-    AcondSelectEntityDescription(
-        key="__T47138CF2_INT_.1f",  # Przykładowy klucz zmiennej API Acond
-        name="Acond Operating Mode",
-        icon="mdi:thermostat",
-        device_name=const.DEVICE_HEAT_PUMP,
-    ),
-)
-
-# Mapa opcji dla danego klucza zmiennej
-# Wartości kluczy muszą odpowiadać kluczom w SELECT_ENTITY_DESCRIPTIONS
-MODE_OPTIONS: dict[str, dict[str, str]] = {
-    "__T47138CF2_INT_.1f": {
-        "Auto Mode": "0",  # "Auto Mode" to nazwa widoczna w HA, "0" to wartość do API
-        "Heating Only": "1",
-        "Cooling Only": "2",
-        "Off": "3",
-    }
-}
+    from .registry import TagDefinition
+
+
+def tag_description(definition: TagDefinition) -> AcondSelectEntityDescription:
+    """Describe the select of a registered tag."""
+    return AcondSelectEntityDescription(
+        key=definition.tag,
+        name=definition.name,
+        icon=definition.icon,
+        options=list(definition.options or {}),
+        entity_registry_enabled_default=definition.enabled_default,
+        device_name=definition.device,
+    )
 
 
 async def async_setup_entry(
@@ -52,7 +41,9 @@ async def async_setup_entry(
             coordinator=entry.runtime_data.coordinator,
             entity_description=entity_description,
         )
-        for entity_description in SELECT_ENTITY_DESCRIPTIONS
+        for entity_description in map(
+            tag_description, entry.runtime_data.registry.for_platform(Platform.SELECT)
+        )
     )
 
 
@@ -66,15 +57,24 @@ class AcondProSelect(AcondProEntity, SelectEntity):
     ) -> None:
         """Initialize the select class."""
         super().__init__(
-            coordinator, entity_description.device_name, entity_description.device_key
+            coordinator,
+            entity_description.device_name,
+            entity_description.device_key,
+            tags=(entity_description.key,),
         )
         self.entity_description = entity_description
         # POPRAWKA UNIKALNOŚCI: Łączymy MAC z kluczem encji
         # Gwarantuje unikalność w przypadku wielu urządzeń Acond
         mac = coordinator.config_entry.data.get("mac", "unknown_mac")
         self._attr_unique_id = f"{mac}_{entity_description.key}"
-        # Ustawienie dostępnych opcji
-        self._attr_options = list(MODE_OPTIONS[entity_description.key].keys())
+        # Option name -> value written to the tag.
+        self._option_values = (
+            coordinator.config_entry.runtime_data.registry.tags[
+                entity_description.key
+            ].options
+            or {}
+        )
+        self._attr_options = list(self._option_values)
 
     @property
     def current_option(self) -> str | None:
@@ -88,19 +88,18 @@ class AcondProSelect(AcondProEntity, SelectEntity):
 
         # 2. Odwróć słownik mapowania opcji
         # (wartość API -> nazwa wyświetlana)
-        options_map = MODE_OPTIONS[api_key]
-        reversed_options_map = {v: k for k, v in options_map.items()}
+        reversed_options_map = {v: k for k, v in self._option_values.items()}
 
         # 3. Zwróć wyświetlaną nazwę
         # Home Assistant oczekuje jednej z wartości z self._attr_options
-        return reversed_options_map.get(current_api_value)
+        return reversed_options_map.get(str(current_api_value))
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
         api_key = self.entity_description.key
 
         # 1. Pobierz wartość API na podstawie wybranej opcji (nazwy)
-        value_to_send = MODE_OPTIONS[api_key].get(option)
+        value_to_send = self._option_values.get(option)
 
         if value_to_send is None:
             self.coordinator.hass.async_log_warn(
@@ -109,9 +108,5 @@ class AcondProSelect(AcondProEntity, SelectEntity):
             )
             return
 
-        # 2. Wyślij wartość do API
-        await self.coordinator.config_entry.runtime_data.client.async_set_value(
-            api_key, value_to_send
-        )
-        # 3. Odśwież dane
-        await self.coordinator.async_request_refresh()
+        # 2. Wyślij wartość do API i odśwież dane
+        await self.coordinator.async_set_values({api_key: value_to_send})
@@ -4,112 +4,197 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
-from homeassistant.const import CONF_MAC
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.const import (
+    CONF_MAC,
+    PERCENTAGE,
+    EntityCategory,
+    Platform,
+    UnitOfEnergy,
+    UnitOfInformation,
+    UnitOfPower,
+    UnitOfTemperature,
+    UnitOfTime,
+)
 
-from . import const
-from .entity import AcondProEntity, AcondSensorEntityDescription
+from . import const, cycles, metrics
+from .entity import (
+    AcondMetricSensorEntityDescription,
+    AcondProEntity,
+    AcondSensorEntityDescription,
+)
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
+    from homeassistant.helpers.typing import StateType
 
     from .coordinator import AcondDataUpdateCoordinator
     from .data import AcondProConfigEntry
+    from .registry import TagDefinition
+
+
+def tag_description(definition: TagDefinition) -> AcondSensorEntityDescription:
+    """Describe the sensor of a registered tag."""
+    return AcondSensorEntityDescription(
+        key=definition.tag,
+        name=definition.name,
+        icon=definition.icon,
+        native_unit_of_measurement=definition.unit,
+        device_class=definition.device_class,
+        state_class=definition.state_class,
+        entity_registry_enabled_default=definition.enabled_default,
+        device_name=definition.device,
+    )
 
 
-ENTITY_DESCRIPTIONS = (
+DERIVED_ENTITY_DESCRIPTIONS = (
     AcondSensorEntityDescription(
-        key="__TA725D6FD_REAL_.0f",
-        name="Electric Energy",
-        icon="mdi:lightning-bolt",
-        native_unit_of_measurement="kWh",
-        unit_of_measurement="kWh",
-        state_class="total_increasing",
-        device_class="energy",
+        key=const.DERIVED_COP,
+        name="Coefficient of Performance",
+        icon="mdi:gauge",
+        state_class=SensorStateClass.MEASUREMENT,
         device_name=const.DEVICE_HEAT_PUMP,
     ),
     AcondSensorEntityDescription(
-        key="__T6BEBB72C_REAL_.0f",
-        name="Thermal Energy",
-        icon="mdi:water-boiler",
-        native_unit_of_measurement="GJ",
-        unit_of_measurement="GJ",
-        state_class="total_increasing",
-        device_class="energy",
+        key=const.DERIVED_DELTA_T,
+        name="Water Temperature Difference",
+        icon="mdi:thermometer-lines",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        state_class=SensorStateClass.MEASUREMENT,
         device_name=const.DEVICE_HEAT_PUMP,
     ),
     AcondSensorEntityDescription(
-        key="__TD50B2FF2_REAL_.2f",
-        name="Pump Efficiency",
-        icon="mdi:lightning-bolt",
-        native_unit_of_measurement="kW",
-        unit_of_measurement="kW",
+        key=const.DERIVED_ELECTRIC_POWER,
+        name="Electric Power",
+        icon="mdi:flash",
+        native_unit_of_measurement=UnitOfPower.KILO_WATT,
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
         device_name=const.DEVICE_HEAT_PUMP,
     ),
     AcondSensorEntityDescription(
-        key=const.OUTDOR_TEMPERATURE,
-        name="Outdoor Temperature",
-        icon="mdi:thermometer",
-        native_unit_of_measurement="°C",
-        unit_of_measurement="°C",
+        key=const.DERIVED_DEFROST_ENERGY,
+        name="Last Defrost Energy",
+        icon="mdi:snowflake-melt",
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        device_class=SensorDeviceClass.ENERGY,
         device_name=const.DEVICE_HEAT_PUMP,
     ),
     AcondSensorEntityDescription(
-        key="__TDE3BFC02_REAL_.1f",
-        name="Outdoor Temperature Average",
-        icon="mdi:thermometer",
-        native_unit_of_measurement="°C",
-        unit_of_measurement="°C",
+        key=const.DERIVED_DEFROST_ENERGY_TOTAL,
+        name="Defrost Energy",
+        icon="mdi:snowflake-melt",
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
         device_name=const.DEVICE_HEAT_PUMP,
     ),
-    AcondSensorEntityDescription(
-        key="__T50A32455_REAL_.1f",
-        name="Heat Pump Water Inbound Temperature",
-        icon="mdi:thermometer",
-        native_unit_of_measurement="°C",
-        unit_of_measurement="°C",
+)
+
+CYCLE_ENTITY_DESCRIPTIONS = tuple(
+    description
+    for component in cycles.COMPONENTS
+    for description in (
+        AcondSensorEntityDescription(
+            key=cycles.cycles_key(component),
+            name=f"{component.replace('_', ' ').title()} Cycles",
+            icon="mdi:counter",
+            state_class=SensorStateClass.TOTAL_INCREASING,
+            entity_registry_enabled_default=component in {"compressor", "defrost"},
+            device_name=const.DEVICE_HEAT_PUMP,
+        ),
+        AcondSensorEntityDescription(
+            key=cycles.duty_cycle_key(component),
+            name=f"{component.replace('_', ' ').title()} Duty Cycle",
+            icon="mdi:percent-circle-outline",
+            native_unit_of_measurement=PERCENTAGE,
+            state_class=SensorStateClass.MEASUREMENT,
+            entity_registry_enabled_default=component in {"compressor", "defrost"},
+            device_name=const.DEVICE_HEAT_PUMP,
+        ),
+    )
+)
+
+METRIC_ENTITY_DESCRIPTIONS = (
+    AcondMetricSensorEntityDescription(
+        key="metric_refresh_duration",
+        name="Refresh Duration",
+        icon="mdi:timer-outline",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
         device_name=const.DEVICE_HEAT_PUMP,
+        value_fn=lambda m: m.last_ms(metrics.STAGE_REFRESH),
     ),
-    AcondSensorEntityDescription(
-        key="__T9E13248E_REAL_.1f",
-        name="Heat Pump Water Outbound Temperature",
-        icon="mdi:thermometer",
-        native_unit_of_measurement="°C",
-        unit_of_measurement="°C",
+    AcondMetricSensorEntityDescription(
+        key="metric_request_duration",
+        name="Request Duration",
+        icon="mdi:timer-outline",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
         device_name=const.DEVICE_HEAT_PUMP,
+        value_fn=lambda m: m.mean_ms(metrics.STAGE_REQUEST),
     ),
-    AcondSensorEntityDescription(
-        key=const.INDOOR_TEMPERATURE_CURRENT,
-        name="Indoor Temperature",
-        icon="mdi:thermometer",
-        native_unit_of_measurement="°C",
-        unit_of_measurement="°C",
+    AcondMetricSensorEntityDescription(
+        key="metric_connect_duration",
+        name="Connect Duration",
+        icon="mdi:timer-outline",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
         device_name=const.DEVICE_HEAT_PUMP,
+        value_fn=lambda m: m.mean_ms(metrics.STAGE_CONNECT),
     ),
-    AcondSensorEntityDescription(
-        key=const.ETH2_MAC,
-        name="Ethernet MAC",
-        icon="mdi:ethernet",
+    AcondMetricSensorEntityDescription(
+        key="metric_parse_duration",
+        name="Parse Duration",
+        icon="mdi:timer-outline",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
         device_name=const.DEVICE_HEAT_PUMP,
+        value_fn=lambda m: m.mean_ms(metrics.STAGE_PARSE),
     ),
-    AcondSensorEntityDescription(
-        key=const.ETH2_IP,
-        name="Ethernet IP",
-        icon="mdi:ip",
+    AcondMetricSensorEntityDescription(
+        key="metric_requests",
+        name="Requests",
+        icon="mdi:counter",
+        state_class=SensorStateClass.TOTAL_INCREASING,
         device_name=const.DEVICE_HEAT_PUMP,
+        value_fn=lambda m: m.counters[metrics.COUNTER_REQUESTS],
     ),
-    AcondSensorEntityDescription(
-        key=const.SV_VERSION,
-        name="Foftware Version",
-        icon="mdi:chip",
+    AcondMetricSensorEntityDescription(
+        key="metric_logins",
+        name="Logins",
+        icon="mdi:login",
+        state_class=SensorStateClass.TOTAL_INCREASING,
         device_name=const.DEVICE_HEAT_PUMP,
+        value_fn=lambda m: m.counters[metrics.COUNTER_LOGINS],
     ),
-    AcondSensorEntityDescription(
-        key=const.FV_VERSION,
-        name="Firmware Version",
-        icon="mdi:chip",
+    AcondMetricSensorEntityDescription(
+        key="metric_connections",
+        name="Connections",
+        icon="mdi:lan-connect",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        device_name=const.DEVICE_HEAT_PUMP,
+        value_fn=lambda m: m.counters[metrics.COUNTER_CONNECTIONS],
+    ),
+    AcondMetricSensorEntityDescription(
+        key="metric_payload_size",
+        name="Payload Size",
+        icon="mdi:file-download-outline",
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.MEASUREMENT,
         device_name=const.DEVICE_HEAT_PUMP,
+        value_fn=lambda m: m.last_payload_size,
     ),
 )
 
@@ -125,7 +210,21 @@ async def async_setup_entry(
             coordinator=entry.runtime_data.coordinator,
             entity_description=entity_description,
         )
-        for entity_description in ENTITY_DESCRIPTIONS
+        for entity_description in (
+            *map(
+                tag_description,
+                entry.runtime_data.registry.for_platform(Platform.SENSOR),
+            ),
+            *DERIVED_ENTITY_DESCRIPTIONS,
+            *CYCLE_ENTITY_DESCRIPTIONS,
+        )
+    )
+    async_add_entities(
+        AcondProMetricSensor(
+            coordinator=entry.runtime_data.coordinator,
+            entity_description=entity_description,
+        )
+        for entity_description in METRIC_ENTITY_DESCRIPTIONS
     )
 
 
@@ -136,6 +235,34 @@ class AcondProSensor(AcondProEntity, SensorEntity):
         self,
         coordinator: AcondDataUpdateCoordinator,
         entity_description: SensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor class."""
+        super().__init__(
+            coordinator,
+            entity_description.device_name,
+            entity_description.device_key,
+            tags=(entity_description.key,),
+        )
+        mac = coordinator.config_entry.data.get(CONF_MAC, "unknown_mac")
+        self.entity_description = entity_description
+        self._attr_unique_id = f"{mac}_{entity_description.key}"
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the native value of the sensor."""
+        return self.coordinator.data.get(self.entity_description.key)
+
+
+class AcondProMetricSensor(AcondProEntity, SensorEntity):
+    """acond refresh instrumentation sensor class."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(
+        self,
+        coordinator: AcondDataUpdateCoordinator,
+        entity_description: AcondMetricSensorEntityDescription,
     ) -> None:
         """Initialize the sensor class."""
         super().__init__(
@@ -146,6 +273,6 @@ class AcondProSensor(AcondProEntity, SensorEntity):
         self._attr_unique_id = f"{mac}_{entity_description.key}"
 
     @property
-    def native_value(self) -> str | None:
+    def native_value(self) -> StateType:
         """Return the native value of the sensor."""
-        return self.coordinator.data[self.entity_description.key]
+        return self.entity_description.value_fn(self.coordinator.metrics)
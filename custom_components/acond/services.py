@@ -0,0 +1,246 @@
+"""Services for acond."""
+
+from __future__ import annotations
+
+from datetime import time, timedelta
+from typing import TYPE_CHECKING
+
+import voluptuous as vol
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .timeseries import SERIES
+from .timetable import MINUTES_PER_DAY, WEEKDAYS, TimetableSlot
+
+if TYPE_CHECKING:
+    from .data import AcondProConfigEntry
+    from .timetable import AcondTimetables, Timetable
+
+SERVICE_GET_SERIES = "get_series"
+SERVICE_GET_TIMETABLE = "get_timetable"
+SERVICE_SET_TIMETABLE = "set_timetable"
+SERVICE_READ_TAGS = "read_tags"
+SERVICE_WRITE_TAGS = "write_tags"
+
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_SERIES = "series"
+ATTR_START = "start"
+ATTR_END = "end"
+ATTR_POINTS = "points"
+ATTR_TIMETABLE = "timetable"
+ATTR_REFRESH = "refresh"
+ATTR_WEEKDAYS = "weekdays"
+ATTR_SLOTS = "slots"
+ATTR_SLOT_START = "start"
+ATTR_SLOT_END = "end"
+ATTR_TAGS = "tags"
+ATTR_MAX_AGE = "max_age"
+ATTR_VALUES = "values"
+
+DEFAULT_SERIES_WINDOW = timedelta(hours=1)
+DEFAULT_SERIES_POINTS = 120
+MAX_SERIES_POINTS = 2000
+
+GET_SERIES_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_SERIES): vol.All(cv.ensure_list, [vol.In(SERIES)]),
+        vol.Optional(ATTR_START): cv.datetime,
+        vol.Optional(ATTR_END): cv.datetime,
+        vol.Optional(ATTR_POINTS, default=DEFAULT_SERIES_POINTS): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=MAX_SERIES_POINTS)
+        ),
+    }
+)
+
+GET_TIMETABLE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_TIMETABLE): cv.string,
+        vol.Optional(ATTR_REFRESH, default=False): cv.boolean,
+    }
+)
+SET_TIMETABLE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_TIMETABLE): cv.string,
+        vol.Required(ATTR_WEEKDAYS): vol.All(cv.ensure_list, [vol.In(WEEKDAYS)]),
+        vol.Optional(ATTR_SLOTS, default=list): vol.All(
+            cv.ensure_list,
+            [
+                vol.Schema(
+                    {
+                        vol.Required(ATTR_SLOT_START): cv.time,
+                        vol.Required(ATTR_SLOT_END): cv.time,
+                    }
+                )
+            ],
+        ),
+    }
+)
+READ_TAGS_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_TAGS): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_MAX_AGE): cv.positive_time_period,
+    }
+)
+WRITE_TAGS_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_VALUES): vol.Schema(
+            {cv.string: vol.Any(bool, int, float, str)}
+        ),
+    }
+)
+
+
+def _get_entry(hass: HomeAssistant, entry_id: str) -> AcondProConfigEntry:
+    """Return a loaded acond config entry or raise."""
+    entry = hass.config_entries.async_get_entry(entry_id)
+    if entry is None or entry.domain != DOMAIN:
+        msg = f"No acond config entry {entry_id}"
+        raise ServiceValidationError(msg)
+    if entry.state is not ConfigEntryState.LOADED:
+        msg = f"Config entry {entry.title} is not loaded"
+        raise ServiceValidationError(msg)
+    return entry
+
+
+async def _async_get_series(call: ServiceCall) -> ServiceResponse:
+    """Return the downsampled time series of a window."""
+    entry = _get_entry(call.hass, call.data[ATTR_CONFIG_ENTRY_ID])
+    end = dt_util.as_utc(call.data.get(ATTR_END) or dt_util.utcnow())
+    start = dt_util.as_utc(call.data.get(ATTR_START) or end - DEFAULT_SERIES_WINDOW)
+    if start >= end:
+        msg = "The start of the window must be before its end"
+        raise ServiceValidationError(msg)
+    times, series = entry.runtime_data.coordinator.series.downsample(
+        start, end, call.data[ATTR_POINTS], call.data.get(ATTR_SERIES)
+    )
+    return {
+        "time": [
+            dt_util.utc_from_timestamp(timestamp).isoformat() for timestamp in times
+        ],
+        "series": series,
+    }
+
+
+def _get_timetables(call: ServiceCall) -> AcondTimetables:
+    """Return the timetables of the entry holding the called one or raise."""
+    entry = _get_entry(call.hass, call.data[ATTR_CONFIG_ENTRY_ID])
+    timetables = entry.runtime_data.timetables
+    if call.data[ATTR_TIMETABLE] not in timetables.definitions:
+        msg = f"{entry.title} has no timetable {call.data[ATTR_TIMETABLE]}"
+        raise ServiceValidationError(msg)
+    return timetables
+
+
+def _minutes(value: time, *, end: bool = False) -> int:
+    """Return the minutes since midnight, an end at 00:00 being midnight."""
+    minutes = value.hour * 60 + value.minute
+    return MINUTES_PER_DAY if end and minutes == 0 else minutes
+
+
+def _format_minutes(minutes: int) -> str:
+    """Return minutes since midnight as HH:MM, midnight ending a day as 24:00."""
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def _timetable_response(timetable: Timetable) -> ServiceResponse:
+    """Return a timetable as weekday -> list of start and end times."""
+    return {
+        weekday: [
+            {
+                ATTR_SLOT_START: _format_minutes(slot.start),
+                ATTR_SLOT_END: _format_minutes(slot.end),
+            }
+            for slot in day
+        ]
+        for weekday, day in zip(WEEKDAYS, timetable, strict=True)
+    }
+
+
+async def _async_get_timetable(call: ServiceCall) -> ServiceResponse:
+    """Return a timetable, read from the controller unless cached."""
+    timetable = await _get_timetables(call).async_get(
+        call.data[ATTR_TIMETABLE], refresh=call.data[ATTR_REFRESH]
+    )
+    return _timetable_response(timetable)
+
+
+async def _async_set_timetable(call: ServiceCall) -> None:
+    """Replace the slots of weekdays of a timetable."""
+    slots = [
+        TimetableSlot(
+            _minutes(slot[ATTR_SLOT_START]), _minutes(slot[ATTR_SLOT_END], end=True)
+        )
+        for slot in call.data[ATTR_SLOTS]
+    ]
+    await _get_timetables(call).async_set_days(
+        call.data[ATTR_TIMETABLE],
+        {WEEKDAYS.index(weekday): slots for weekday in call.data[ATTR_WEEKDAYS]},
+    )
+
+
+async def _async_read_tags(call: ServiceCall) -> ServiceResponse:
+    """Return the values of tags, read from the controller unless fresh."""
+    entry = _get_entry(call.hass, call.data[ATTR_CONFIG_ENTRY_ID])
+    values = await entry.runtime_data.coordinator.async_read_tags(
+        call.data[ATTR_TAGS], call.data.get(ATTR_MAX_AGE)
+    )
+    return {ATTR_VALUES: values}
+
+
+async def _async_write_tags(call: ServiceCall) -> None:
+    """Write the values of writable tags in as few requests as possible."""
+    entry = _get_entry(call.hass, call.data[ATTR_CONFIG_ENTRY_ID])
+    await entry.runtime_data.coordinator.async_set_values(call.data[ATTR_VALUES])
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration services."""
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_SERIES,
+        _async_get_series,
+        schema=GET_SERIES_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_TIMETABLE,
+        _async_get_timetable,
+        schema=GET_TIMETABLE_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_TIMETABLE,
+        _async_set_timetable,
+        schema=SET_TIMETABLE_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_READ_TAGS,
+        _async_read_tags,
+        schema=READ_TAGS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_WRITE_TAGS,
+        _async_write_tags,
+        schema=WRITE_TAGS_SCHEMA,
+    )
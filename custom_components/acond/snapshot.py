@@ -0,0 +1,77 @@
+"""Last good tag snapshot of a controller, kept across restarts."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, FV_VERSION
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from homeassistant.core import HomeAssistant
+
+STORAGE_VERSION = 1
+# Write the snapshot at most this often, Store also writes it when HA stops.
+SAVE_DELAY = 300
+
+
+class AcondSnapshotStore:
+    """
+    Throttled persistence of the merged tag values of one config entry.
+
+    Running aggregates derived from the values are saved alongside them.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the store of the given config entry."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}"
+        )
+        self._data: dict[str, Any] = {}
+        self._aggregates: dict[str, Any] = {}
+        self._updated: datetime | None = None
+        self._save_pending = False
+
+    async def async_load(
+        self,
+    ) -> tuple[datetime, dict[str, Any], dict[str, Any]] | None:
+        """Return when the saved snapshot was read, its values and aggregates."""
+        stored = await self._store.async_load()
+        if not stored or (updated := dt_util.parse_datetime(stored["updated"])) is None:
+            return None
+        return updated, stored["data"], stored.get("aggregates", {})
+
+    @callback
+    def async_save(self, data: dict[str, Any], aggregates: dict[str, Any]) -> None:
+        """Schedule saving the latest values unless a save is already pending."""
+        self._data = data
+        self._aggregates = aggregates
+        self._updated = dt_util.utcnow()
+        if not self._save_pending:
+            self._save_pending = True
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the snapshot as it is written to disk."""
+        self._save_pending = False
+        return {
+            "updated": (self._updated or dt_util.utcnow()).isoformat(),
+            "firmware": self._data.get(FV_VERSION),
+            "data": self._data,
+            "aggregates": self._aggregates,
+        }
+
+    async def async_flush(self) -> None:
+        """Write a pending save now, as when the entry is reloaded."""
+        if self._save_pending:
+            await self._store.async_save(self._data_to_save())
+
+    async def async_remove(self) -> None:
+        """Delete the saved snapshot."""
+        await self._store.async_remove()
@@ -5,8 +5,8 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
+from homeassistant.const import CONF_MAC, Platform
 
-from . import const
 from .entity import AcondProEntity, AcondSwitchEntityDescription
 
 if TYPE_CHECKING:
@@ -15,15 +15,18 @@ if TYPE_CHECKING:
 
     from .coordinator import AcondDataUpdateCoordinator
     from .data import AcondProConfigEntry
+    from .registry import TagDefinition
 
-ENTITY_DESCRIPTIONS = (
-    AcondSwitchEntityDescription(
-        key="__TBEC2C30E_REAL_.1f",
-        name="Integration Switch TEST",
-        icon="mdi:format-quote-close",
-        device_name=const.DEVICE_HEAT_PUMP,
-    ),
-)
+
+def tag_description(definition: TagDefinition) -> AcondSwitchEntityDescription:
+    """Describe the switch of a registered BOOL tag."""
+    return AcondSwitchEntityDescription(
+        key=definition.tag,
+        name=definition.name,
+        icon=definition.icon,
+        entity_registry_enabled_default=definition.enabled_default,
+        device_name=definition.device,
+    )
 
 
 async def async_setup_entry(
@@ -37,7 +40,9 @@ async def async_setup_entry(
             coordinator=entry.runtime_data.coordinator,
             entity_description=entity_description,
         )
-        for entity_description in ENTITY_DESCRIPTIONS
+        for entity_description in map(
+            tag_description, entry.runtime_data.registry.for_platform(Platform.SWITCH)
+        )
     )
 
 
@@ -51,26 +56,24 @@ class AcondProSwitch(AcondProEntity, SwitchEntity):
     ) -> None:
         """Initialize the switch class."""
         super().__init__(
-            coordinator, entity_description.device_name, entity_description.device_key
+            coordinator,
+            entity_description.device_name,
+            entity_description.device_key,
+            tags=(entity_description.key,),
         )
+        mac = coordinator.config_entry.data.get(CONF_MAC, "unknown_mac")
         self.entity_description = entity_description
-        self._attr_unique_id = entity_description.key
+        self._attr_unique_id = f"{mac}_{entity_description.key}"
 
     @property
-    def is_on(self) -> bool:
+    def is_on(self) -> bool | None:
         """Return true if the switch is on."""
-        return self.coordinator.data.get("title", "") == "foo"
+        return self.coordinator.data.get(self.entity_description.key)
 
     async def async_turn_on(self, **_: Any) -> None:
         """Turn on the switch."""
-        await self.coordinator.config_entry.runtime_data.client.async_set_value(
-            "__TBEC2C30E_REAL_.1f", "20.1"
-        )
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_set_values({self.entity_description.key: 1})
 
     async def async_turn_off(self, **_: Any) -> None:
         """Turn off the switch."""
-        await self.coordinator.config_entry.runtime_data.client.async_set_value(
-            "__TBEC2C30E_REAL_.1f", "20.9"
-        )
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_set_values({self.entity_description.key: 0})
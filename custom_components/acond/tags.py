@@ -0,0 +1,181 @@
+"""Tag name schema and typed value decoding and encoding for acond."""
+
+from __future__ import annotations
+
+import math
+import re
+from dataclasses import dataclass
+from enum import StrEnum
+from functools import cache
+from typing import TYPE_CHECKING, Any
+
+from .const import LOGGER
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Tag names look like __T46AA2571_REAL_.1f or __T96AFE3EA_STRING[17]_s:
+# a hash, the PLC type (with an optional size) and the display format.
+_TAG_NAME_RE = re.compile(
+    r"^__T(?P<hash>[0-9A-F]+)_(?P<type>[A-Z]+)(?:\[(?P<size>\d+)\])?_(?P<fmt>.*)$"
+)
+
+
+class TagType(StrEnum):
+    """PLC data types encoded in tag names."""
+
+    REAL = "REAL"
+    BOOL = "BOOL"
+    INT = "INT"
+    STRING = "STRING"
+
+
+@dataclass(frozen=True, kw_only=True)
+class TagSchema:
+    """Type information parsed from a tag name."""
+
+    name: str
+    type: TagType
+    size: int | None
+    fmt: str
+
+
+@cache
+def parse_tag_name(name: str) -> TagSchema | None:
+    """Parse a tag name into its schema, None when it does not follow it."""
+    match = _TAG_NAME_RE.match(name)
+    if match is None:
+        return None
+    try:
+        tag_type = TagType(match["type"])
+    except ValueError:
+        return None
+    size = match["size"]
+    return TagSchema(
+        name=name,
+        type=tag_type,
+        size=int(size) if size is not None else None,
+        fmt=match["fmt"],
+    )
+
+
+def _decode_real(value: str) -> float:
+    number = float(value)
+    if not math.isfinite(number):
+        msg = f"non-finite REAL {value!r}"
+        raise ValueError(msg)
+    return number
+
+
+def _decode_int(value: str) -> int:
+    try:
+        return int(value)
+    except ValueError:
+        number = float(value)
+        if not number.is_integer():
+            raise
+        return int(number)
+
+
+def _decode_bool(value: str) -> bool:
+    if value == "1":
+        return True
+    if value == "0":
+        return False
+    msg = f"invalid BOOL {value!r}"
+    raise ValueError(msg)
+
+
+def _decode_str(value: str) -> str:
+    return value
+
+
+_DECODERS: dict[TagType, Callable[[str], Any]] = {
+    TagType.REAL: _decode_real,
+    TagType.INT: _decode_int,
+    TagType.BOOL: _decode_bool,
+    TagType.STRING: _decode_str,
+}
+
+
+@cache
+def decoder_for(name: str) -> Callable[[str], Any]:
+    """Return the decoder for a tag, raw strings for unknown schemas."""
+    schema = parse_tag_name(name)
+    if schema is None:
+        return _decode_str
+    return _DECODERS[schema.type]
+
+
+def decode_value(name: str, value: str) -> Any:
+    """Decode a raw page value into a typed value, None when malformed."""
+    try:
+        return decoder_for(name)(value)
+    except ValueError:
+        LOGGER.debug("Rejected malformed value %r for %s", value, name)
+        return None
+
+
+def _encode_real(value: Any, schema: TagSchema) -> str:
+    if isinstance(value, bool):
+        msg = f"{value!r} is not a number"
+        raise ValueError(msg)  # noqa: TRY004
+    number = _decode_real(str(value))
+    try:
+        # The display format is the precision the controller keeps.
+        return format(number, schema.fmt)
+    except ValueError:
+        return str(number)
+
+
+def _encode_int(value: Any, _: TagSchema) -> str:
+    if isinstance(value, bool):
+        msg = f"{value!r} is not a number"
+        raise ValueError(msg)  # noqa: TRY004
+    number = _decode_real(str(value))
+    if not number.is_integer():
+        msg = f"{value!r} is not a whole number"
+        raise ValueError(msg)
+    return str(int(number))
+
+
+def _encode_bool(value: Any, _: TagSchema) -> str:
+    if isinstance(value, str):
+        value = value.strip().lower()
+    if value in (True, "1", "on", "true"):
+        return "1"
+    if value in (False, "0", "off", "false"):
+        return "0"
+    msg = f"{value!r} is not a boolean"
+    raise ValueError(msg)
+
+
+def _encode_str(value: Any, schema: TagSchema) -> str:
+    if not isinstance(value, str):
+        msg = f"{value!r} is not a string"
+        raise ValueError(msg)  # noqa: TRY004
+    if schema.size is not None and len(value) > schema.size:
+        msg = f"{value!r} is longer than {schema.size} characters"
+        raise ValueError(msg)
+    return value
+
+
+_ENCODERS: dict[TagType, Callable[[Any, TagSchema], str]] = {
+    TagType.REAL: _encode_real,
+    TagType.INT: _encode_int,
+    TagType.BOOL: _encode_bool,
+    TagType.STRING: _encode_str,
+}
+
+
+def encode_value(name: str, value: Any) -> str:
+    """Encode a value for writing to a tag, raising ValueError if it does not fit."""
+    schema = parse_tag_name(name)
+    if schema is None:
+        msg = f"{name} does not follow the tag name schema"
+        raise ValueError(msg)
+    try:
+        return _ENCODERS[schema.type](value, schema)
+    except ValueError as exception:
+        msg = f"Invalid {schema.type} value for {name}: {exception}"
+        raise ValueError(msg) from exception
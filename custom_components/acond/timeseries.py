@@ -0,0 +1,271 @@
+"""High-rate time series of selected tags, kept outside the recorder."""
+
+from __future__ import annotations
+
+import math
+import struct
+import sys
+import time
+from array import array
+from bisect import bisect_left
+from datetime import timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Self
+
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import STORAGE_DIR
+
+from .const import (
+    COMPRESSOR,
+    DEFROST,
+    DOMAIN,
+    IN_WATER_TEMPARATURE,
+    LOGGER,
+    OUT_WATER_TEMPARATURE,
+    OUTDOR_TEMPERATURE,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence
+    from datetime import datetime
+
+# Series name -> tag sampled on every live update.
+SERIES = {
+    "outdoor_temperature": OUTDOR_TEMPERATURE,
+    "in_water_temperature": IN_WATER_TEMPARATURE,
+    "out_water_temperature": OUT_WATER_TEMPARATURE,
+    "compressor": COMPRESSOR,
+    "defrost": DEFROST,
+}
+# Three days of samples at the default active interval.
+SERIES_CAPACITY = 17_280
+FLUSH_INTERVAL = timedelta(minutes=15)
+
+_MAGIC = b"ACTS"
+_FORMAT_VERSION = 1
+# Magic, format version, number of series and number of samples, followed by
+# the length-prefixed series names, the float64 timestamps and one float32
+# column per series, all little-endian and oldest sample first.
+_HEADER = struct.Struct("<4sBBI")
+
+
+def _little_endian(column: array) -> array:
+    """Return the column in the byte order of the file, swapping in place."""
+    if sys.byteorder == "big":
+        column.byteswap()
+    return column
+
+
+class SeriesBuffer:
+    """
+    Ring buffers of several series sharing one time axis.
+
+    Samples live in typed arrays, so there is no Python object per sample.
+    Missing values are stored as NaN.
+    """
+
+    def __init__(self, names: Sequence[str], capacity: int = SERIES_CAPACITY) -> None:
+        """Initialize empty buffers."""
+        self.names = tuple(names)
+        self.capacity = capacity
+        self._times = array("d", bytes(8 * capacity))
+        self._columns = {name: array("f", [math.nan]) * capacity for name in names}
+        self._next = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Return the number of samples held."""
+        return self._count
+
+    def append(self, timestamp: float, values: Mapping[str, Any]) -> None:
+        """Add a sample, overwriting the oldest one when full."""
+        index = self._next
+        self._times[index] = timestamp
+        for name, column in self._columns.items():
+            value = values.get(name)
+            column[index] = math.nan if value is None else value
+        self._next = (index + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def _chronological(self, column: array) -> array:
+        """Return a copy of the held part of a column, oldest sample first."""
+        if self._count < self.capacity:
+            return column[: self._count]
+        return column[self._next :] + column[: self._next]
+
+    def downsample(
+        self,
+        start: float,
+        end: float,
+        points: int,
+        names: Iterable[str] | None = None,
+    ) -> tuple[list[float], dict[str, list[float | None]]]:
+        """
+        Average the samples between two timestamps into equal time buckets.
+
+        Returns the bucket midpoints and the mean of every series per bucket,
+        leaving out buckets without samples. The mean of a binary series is
+        the fraction of the bucket it was on.
+        """
+        names = self.names if names is None else tuple(names)
+        times = self._chronological(self._times)
+        first, last = bisect_left(times, start), bisect_left(times, end)
+        width = (end - start) / points
+        buckets = [
+            min(int((times[i] - start) / width), points - 1) for i in range(first, last)
+        ]
+        sizes = [0] * points
+        for bucket in buckets:
+            sizes[bucket] += 1
+        series: dict[str, list[float | None]] = {}
+        for name in names:
+            column = self._chronological(self._columns[name])[first:last]
+            sums = [0.0] * points
+            counts = [0] * points
+            for bucket, value in zip(buckets, column, strict=True):
+                if not math.isnan(value):
+                    sums[bucket] += value
+                    counts[bucket] += 1
+            series[name] = [
+                round(sums[bucket] / counts[bucket], 3) if counts[bucket] else None
+                for bucket in range(points)
+                if sizes[bucket]
+            ]
+        midpoints = [
+            start + (bucket + 0.5) * width for bucket in range(points) if sizes[bucket]
+        ]
+        return midpoints, series
+
+    def to_bytes(self) -> bytes:
+        """Serialize the held samples."""
+        parts = [_HEADER.pack(_MAGIC, _FORMAT_VERSION, len(self.names), self._count)]
+        for name in self.names:
+            encoded = name.encode()
+            parts.append(bytes([len(encoded)]) + encoded)
+        parts.append(_little_endian(self._chronological(self._times)).tobytes())
+        parts.extend(
+            _little_endian(self._chronological(self._columns[name])).tobytes()
+            for name in self.names
+        )
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(
+        cls, data: bytes, names: Sequence[str], capacity: int = SERIES_CAPACITY
+    ) -> Self:
+        """Restore the newest samples of the given series from to_bytes output."""
+        if len(data) < _HEADER.size:
+            msg = "Truncated time series header"
+            raise ValueError(msg)
+        magic, version, series_count, count = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != _FORMAT_VERSION:
+            msg = f"Unsupported time series format {magic!r} v{version}"
+            raise ValueError(msg)
+        offset = _HEADER.size
+        stored_names = []
+        for _ in range(series_count):
+            size = data[offset]
+            stored_names.append(data[offset + 1 : offset + 1 + size].decode())
+            offset += 1 + size
+        if len(data) != offset + count * (8 + 4 * series_count):
+            msg = "Truncated time series data"
+            raise ValueError(msg)
+        kept = min(count, capacity)
+        buffer = cls(names, capacity)
+        times = _little_endian(array("d", data[offset : offset + 8 * count]))
+        buffer._times[:kept] = times[count - kept :]
+        offset += 8 * count
+        for name in stored_names:
+            column = _little_endian(array("f", data[offset : offset + 4 * count]))
+            offset += 4 * count
+            if name in buffer._columns:
+                buffer._columns[name][:kept] = column[count - kept :]
+        buffer._count = kept
+        buffer._next = kept % capacity
+        return buffer
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Replace a file without leaving a partial one behind."""
+    temporary = path.with_suffix(".tmp")
+    temporary.write_bytes(data)
+    temporary.replace(path)
+
+
+class AcondSeriesRecorder:
+    """Time series of one controller, flushed to a binary file on a schedule."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize an empty buffer for the given config entry."""
+        self._hass = hass
+        self._path = Path(hass.config.path(STORAGE_DIR, f"{DOMAIN}.{entry_id}.series"))
+        self.buffer = SeriesBuffer(tuple(SERIES))
+        self._dirty = False
+
+    @callback
+    def async_add(self, data: Mapping[str, Any]) -> None:
+        """Sample the series tags of a live update."""
+        self.buffer.append(
+            time.time(), {name: data.get(tag) for name, tag in SERIES.items()}
+        )
+        self._dirty = True
+
+    def downsample(
+        self,
+        start: datetime,
+        end: datetime,
+        points: int,
+        names: Iterable[str] | None = None,
+    ) -> tuple[list[float], dict[str, list[float | None]]]:
+        """Average the samples of a time window, see SeriesBuffer.downsample."""
+        return self.buffer.downsample(start.timestamp(), end.timestamp(), points, names)
+
+    async def async_load(self) -> None:
+        """Restore the samples flushed before the last restart."""
+        try:
+            data = await self._hass.async_add_executor_job(self._path.read_bytes)
+        except FileNotFoundError:
+            return
+        try:
+            self.buffer = SeriesBuffer.from_bytes(data, tuple(SERIES))
+        except (IndexError, ValueError) as exception:
+            LOGGER.warning("Discarding time series %s: %s", self._path, exception)
+
+    async def async_flush(self, _: Any = None) -> None:
+        """Write the samples to disk if there are new ones."""
+        if not self._dirty:
+            return
+        self._dirty = False
+        await self._hass.async_add_executor_job(
+            _write_atomic, self._path, self.buffer.to_bytes()
+        )
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Flush on a schedule and on shutdown, returning the stop callback."""
+        cancel_interval = async_track_time_interval(
+            self._hass, self.async_flush, FLUSH_INTERVAL, name=f"{DOMAIN} series flush"
+        )
+
+        async def _async_final_flush(_: Event) -> None:
+            nonlocal cancel_final_write
+            cancel_final_write = None
+            await self.async_flush()
+
+        cancel_final_write: CALLBACK_TYPE | None = self._hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_FINAL_WRITE, _async_final_flush
+        )
+
+        @callback
+        def stop() -> None:
+            cancel_interval()
+            if cancel_final_write is not None:
+                cancel_final_write()
+
+        return stop
+
+    async def async_remove(self) -> None:
+        """Delete the flushed samples."""
+        await self._hass.async_add_executor_job(self._path.unlink, True)  # noqa: FBT003
@@ -0,0 +1,221 @@
+"""Heating and hot water timetables of the controller."""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.exceptions import HomeAssistantError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from .coordinator import AcondDataUpdateCoordinator
+    from .registry import TimetableDefinition
+
+WEEKDAYS = (
+    "monday",
+    "tuesday",
+    "wednesday",
+    "thursday",
+    "friday",
+    "saturday",
+    "sunday",
+)
+MINUTES_PER_DAY = 24 * 60
+# Timetables only change when edited, which goes through AcondTimetables.
+TIMETABLE_TTL = timedelta(hours=6)
+
+
+@dataclass(frozen=True, slots=True, order=True)
+class TimetableSlot:
+    """A period a timetable is on, in minutes since midnight."""
+
+    start: int
+    end: int
+
+
+# Weekday -> periods it is on, ordered and not overlapping, Monday first.
+type Timetable = tuple[tuple[TimetableSlot, ...], ...]
+
+# The controller marks an unused slot by a zero start and end.
+_UNUSED = TimetableSlot(0, 0)
+
+
+def decode_timetable(
+    definition: TimetableDefinition, values: dict[str, Any]
+) -> Timetable | None:
+    """Return the timetable read from the page values, None if incomplete."""
+    days = []
+    for day in definition.slots:
+        slots = []
+        for start_tag, end_tag in day:
+            start, end = values.get(start_tag), values.get(end_tag)
+            if start is None or end is None:
+                return None
+            if (slot := TimetableSlot(start, end)) != _UNUSED:
+                slots.append(slot)
+        days.append(tuple(sorted(slots)))
+    return tuple(days)
+
+
+def validate_day(
+    definition: TimetableDefinition, weekday: int, slots: list[TimetableSlot]
+) -> tuple[TimetableSlot, ...]:
+    """Return the slots of a day in order, raising ValueError if invalid."""
+    if len(slots) > len(definition.slots[weekday]):
+        msg = (
+            f"{definition.name} has {len(definition.slots[weekday])} slots "
+            f"on {WEEKDAYS[weekday]}, not {len(slots)}"
+        )
+        raise ValueError(msg)
+    ordered = sorted(slots)
+    for slot in ordered:
+        if not 0 <= slot.start < slot.end <= MINUTES_PER_DAY:
+            msg = f"A slot has to end after it starts on the same day, not {slot}"
+            raise ValueError(msg)
+    for previous, slot in itertools.pairwise(ordered):
+        if slot.start < previous.end:
+            msg = f"Slots {previous} and {slot} overlap"
+            raise ValueError(msg)
+    return tuple(ordered)
+
+
+def timetable_changes(
+    definition: TimetableDefinition, old: Timetable, new: Timetable
+) -> dict[str, int]:
+    """Return the values of only the slot tags that differ between timetables."""
+    changes = {}
+    for tags, old_day, new_day in zip(definition.slots, old, new, strict=True):
+        padding = len(tags)
+        old_slots = (*old_day, *(_UNUSED,) * (padding - len(old_day)))
+        new_slots = (*new_day, *(_UNUSED,) * (padding - len(new_day)))
+        for (start_tag, end_tag), old_slot, new_slot in zip(
+            tags, old_slots, new_slots, strict=True
+        ):
+            if new_slot.start != old_slot.start:
+                changes[start_tag] = new_slot.start
+            if new_slot.end != old_slot.end:
+                changes[end_tag] = new_slot.end
+    return changes
+
+
+def iter_periods(
+    timetable: Timetable, start: datetime, end: datetime
+) -> Iterator[tuple[datetime, datetime]]:
+    """Yield the on periods overlapping a window, in the window's time zone."""
+    # Periods end by midnight, so none of the previous day reaches the window.
+    day = start.replace(hour=0, minute=0, second=0, microsecond=0)
+    while day < end:
+        for slot in timetable[day.weekday()]:
+            period_start = day + timedelta(minutes=slot.start)
+            period_end = day + timedelta(minutes=slot.end)
+            if period_start < end and period_end > start:
+                yield period_start, period_end
+        day += timedelta(days=1)
+
+
+class AcondTimetables:
+    """
+    Timetables of one controller, read together and cached for a long time.
+
+    Edits are written as the slot tags that changed only, in one batch.
+    Reads and writes go through the coordinator, so they share its page
+    cache, are checked against the registry and fail with HomeAssistantError.
+    """
+
+    def __init__(
+        self,
+        coordinator: AcondDataUpdateCoordinator,
+        definitions: dict[str, TimetableDefinition],
+    ) -> None:
+        """Initialize with an empty cache."""
+        self._coordinator = coordinator
+        self.definitions = definitions
+        # Key -> (monotonic read time, timetable).
+        self._cache: dict[str, tuple[float, Timetable]] = {}
+        self._lock = asyncio.Lock()
+        self._listeners: set[CALLBACK_TYPE] = set()
+
+    def cached(self, key: str) -> Timetable | None:
+        """Return the last known timetable, however old."""
+        cached = self._cache.get(key)
+        return cached[1] if cached is not None else None
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE) -> Callable[[], None]:
+        """Call back whenever a timetable is read or written."""
+        self._listeners.add(update_callback)
+        return lambda: self._listeners.discard(update_callback)
+
+    async def async_get(self, key: str, *, refresh: bool = False) -> Timetable:
+        """Return a timetable, read from the controller once its cache expired."""
+        if not refresh and (timetable := self._fresh(key)) is not None:
+            return timetable
+        async with self._lock:
+            return await self._async_read(self.definitions[key], refresh=refresh)
+
+    async def async_set_days(
+        self, key: str, days: dict[int, list[TimetableSlot]]
+    ) -> Timetable:
+        """Replace the slots of weekdays, writing only those that changed."""
+        definition = self.definitions[key]
+        try:
+            validated = {
+                weekday: validate_day(definition, weekday, slots)
+                for weekday, slots in days.items()
+            }
+        except ValueError as exception:
+            raise HomeAssistantError(str(exception)) from exception
+        async with self._lock:
+            # The diff is only as good as the timetable it is taken against.
+            if (old := self._fresh(key)) is None:
+                old = await self._async_read(definition)
+            new = tuple(validated.get(weekday, day) for weekday, day in enumerate(old))
+            if not (changes := timetable_changes(definition, old, new)):
+                return old
+            await self._coordinator.async_set_values(changes)
+            # Served from the page the controller answered the write with.
+            return await self._async_read(definition)
+
+    def _fresh(self, key: str) -> Timetable | None:
+        """Return the cached timetable unless it expired."""
+        cached = self._cache.get(key)
+        if (
+            cached is None
+            or time.monotonic() - cached[0] >= TIMETABLE_TTL.total_seconds()
+        ):
+            return None
+        return cached[1]
+
+    async def _async_read(
+        self, definition: TimetableDefinition, *, refresh: bool = False
+    ) -> Timetable:
+        """Read the timetables sharing a page together."""
+        siblings = [
+            sibling
+            for sibling in self.definitions.values()
+            if sibling.page == definition.page
+        ]
+        values = await self._coordinator.async_read_tags(
+            frozenset().union(*(sibling.tags for sibling in siblings)),
+            max_age=timedelta(0) if refresh else None,
+        )
+        for sibling in siblings:
+            if (timetable := decode_timetable(sibling, values)) is not None:
+                self._store(sibling.key, timetable)
+        if (timetable := decode_timetable(definition, values)) is None:
+            msg = f"Timetable {definition.name} is missing from {definition.page}"
+            raise HomeAssistantError(msg)
+        return timetable
+
+    def _store(self, key: str, timetable: Timetable) -> None:
+        """Cache a timetable and tell the listeners."""
+        self._cache[key] = (time.monotonic(), timetable)
+        for update_callback in list(self._listeners):
+            update_callback()
@@ -15,7 +15,7 @@ from homeassistant.components.water_heater.const import (
     STATE_HEAT_PUMP,
     STATE_PERFORMANCE,
 )
-from homeassistant.const import ATTR_TEMPERATURE, CONF_MAC, UnitOfTemperature
+from homeassistant.const import ATTR_TEMPERATURE, CONF_MAC, Platform, UnitOfTemperature
 
 from . import const
 from .entity import AcondProEntity, AcondWaterHeaterEntityDescription
@@ -75,8 +75,17 @@ class AcondProWaterHeater(AcondProEntity, WaterHeaterEntity):
         entity_description: WaterHeaterEntityDescription,
     ) -> None:
         """Initialize the water heater class."""
+        registry = coordinator.config_entry.runtime_data.registry
+        self._current_tag = registry.role(Platform.WATER_HEATER, "current_temperature")
+        self._target_tag = registry.role(Platform.WATER_HEATER, "target_temperature")
+        self._set_tag = registry.role(Platform.WATER_HEATER, "set_temperature")
+        self._mode_tag = registry.role(Platform.WATER_HEATER, "operation_mode")
+        self._set_mode_tag = registry.role(Platform.WATER_HEATER, "set_operation_mode")
         super().__init__(
-            coordinator, entity_description.device_name, entity_description.device_key
+            coordinator,
+            entity_description.device_name,
+            entity_description.device_key,
+            tags=filter(None, (self._current_tag, self._target_tag, self._mode_tag)),
         )
         self.entity_description = entity_description
 
@@ -84,14 +93,14 @@ class AcondProWaterHeater(AcondProEntity, WaterHeaterEntity):
         mac = coordinator.config_entry.data.get(CONF_MAC, "unknown_mac")
         self._attr_unique_id = f"{mac}_{entity_description.key}"
 
-        # Definicja wspieranych funkcji
-        self._attr_supported_features = (
-            WaterHeaterEntityFeature.TARGET_TEMPERATURE
-            | WaterHeaterEntityFeature.OPERATION_MODE
-        )
-
-        # Definicja dostępnych trybów pracy
-        self._attr_operation_list = list(OPERATION_MODE_MAP.keys())
+        # Definicja wspieranych funkcji, tylko dla tagów z rejestru
+        self._attr_supported_features = WaterHeaterEntityFeature(0)
+        if self._set_tag is not None:
+            self._attr_supported_features |= WaterHeaterEntityFeature.TARGET_TEMPERATURE
+        if self._mode_tag is not None and self._set_mode_tag is not None:
+            self._attr_supported_features |= WaterHeaterEntityFeature.OPERATION_MODE
+            # Definicja dostępnych trybów pracy
+            self._attr_operation_list = list(OPERATION_MODE_MAP.keys())
         self._attr_temperature_unit = UnitOfTemperature.CELSIUS
 
         # Wartości min/max dla C.W.U.
@@ -102,32 +111,19 @@ class AcondProWaterHeater(AcondProEntity, WaterHeaterEntity):
     @property
     def current_temperature(self) -> float | None:
         """Return the current water temperature (wartość odczytana z bojlera)."""
-        # Przykład: Zmień klucz na właściwy dla odczytu temperatury wody!
-        temp_data = self.coordinator.data.get(const.BOILER_TEMPERATURE_CURRENT)
-        if temp_data is not None:
-            try:
-                return float(temp_data)
-            except ValueError:
-                return None
-        return None
+        return self.coordinator.data.get(self._current_tag)
 
     @property
     def target_temperature(self) -> float | None:
         """Return the temperature we try to reach (temperatura zadana)."""
-        # Przykład: Zmień klucz na właściwy dla zadanej temperatury wody!
-        target_data = self.coordinator.data.get(const.BOILER_TEMPERATURE_TARGET)
-        if target_data is not None:
-            try:
-                return float(target_data)
-            except ValueError:
-                return None
-        return None
+        return self.coordinator.data.get(self._target_tag)
 
     @property
     def current_operation(self) -> str | None:
         """Return current operation mode (aktualny tryb pracy bojlera)."""
-        # Przykład: Zmień klucz na właściwy dla trybu pracy bojlera!
-        mode_data = self.coordinator.data.get("__T_CURRENT_BOILER_MODE_INT_")
+        if self._mode_tag is None:
+            return None
+        mode_data = self.coordinator.data.get(self._mode_tag)
         if mode_data is not None:
             # Tłumaczenie wartości API (np. "1") na stałą HA (np. "eco")
             return REVERSE_OPERATION_MODE_MAP.get(str(mode_data))
@@ -136,21 +132,13 @@ class AcondProWaterHeater(AcondProEntity, WaterHeaterEntity):
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature (ustawienie nowej temperatury zadanej wody)."""
         temperature = kwargs.get(ATTR_TEMPERATURE)
-        if temperature is not None:
-            # Przykład: Zmień klucz na właściwy dla zapisu temperatury zadanej wody!
-            await self.coordinator.config_entry.runtime_data.client.async_set_value(
-                const.BOILER_TEMPERATURE_TARGET_SET, str(temperature)
-            )
-            await self.coordinator.async_request_refresh()
+        if temperature is not None and self._set_tag is not None:
+            await self.coordinator.async_set_values({self._set_tag: temperature})
 
     async def async_set_operation_mode(self, operation_mode: str) -> None:
         """Set new operation mode (ustawienie trybu pracy bojlera)."""
         # Tłumaczenie stałej HA (np. "eco") na wartość API (np. "1")
         api_value = OPERATION_MODE_MAP.get(operation_mode)
 
-        if api_value is not None:
-            # Przykład: Zmień klucz na właściwy dla zapisu trybu pracy bojlera!
-            await self.coordinator.config_entry.runtime_data.client.async_set_value(
-                "__T_SET_BOILER_MODE_INT_", api_value
-            )
-            await self.coordinator.async_request_refresh()
+        if api_value is not None and self._set_mode_tag is not None:
+            await self.coordinator.async_set_values({self._set_mode_tag: api_value})
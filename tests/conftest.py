@@ -0,0 +1,188 @@
+"""Fixtures serving a simulated controller to a real client."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import multiprocessing
+import ssl
+import sys
+import urllib.request
+from collections import Counter
+from datetime import timedelta
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from homeassistant.config_entries import ConfigEntry, current_entry
+from homeassistant.const import CONF_MAC
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "benchmarks"))
+
+import simulator
+
+from custom_components.acond import api
+from custom_components.acond.api import AcondProApiClient
+from custom_components.acond.const import DOMAIN, LOGGER
+from custom_components.acond.coordinator import AcondDataUpdateCoordinator
+from custom_components.acond.data import AcondProData
+from custom_components.acond.registry import load_registry
+from custom_components.acond.timetable import AcondTimetables
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterator
+
+SIMULATOR_START_TIMEOUT = 30
+# Simulator processes are forked from a server that has imported aiohttp and
+# cryptography once, the simulator module itself is not on the server's path.
+PROCESSES = multiprocessing.get_context("forkserver")
+PROCESSES.set_forkserver_preload(["aiohttp.web", "cryptography.x509"])
+
+
+class Controller:
+    """
+    A simulator served from its own process, and a client pointed at it.
+
+    Tests stay synchronous so that pytest-benchmark can time the client,
+    which runs alone on the loop and in the process of the test.
+    """
+
+    def __init__(self, **options: Any) -> None:
+        """Start serving the simulator."""
+        receiver, sender = PROCESSES.Pipe(duplex=False)
+        self._process = PROCESSES.Process(
+            target=simulator.run, args=(0, sender), kwargs=options, daemon=True
+        )
+        self._process.start()
+        sender.close()
+        if not receiver.poll(SIMULATOR_START_TIMEOUT):
+            self._process.kill()
+            msg = "The simulator did not start"
+            raise RuntimeError(msg)
+        self.port = receiver.recv()
+        receiver.close()
+        self._control_context = ssl.create_default_context()
+        self._control_context.check_hostname = False
+        self._control_context.verify_mode = ssl.CERT_NONE
+        self.loop = asyncio.new_event_loop()
+        self.client = self.new_client()
+
+    def new_client(self, password: str = "admin") -> AcondProApiClient:  # noqa: S107
+        """Return a client of the simulator."""
+        return AcondProApiClient(
+            ip=f"127.0.0.1:{self.port}", username="admin", password=password
+        )
+
+    def run(self, awaitable: Awaitable[Any]) -> Any:
+        """Run a coroutine on the loop of the client."""
+        return self.loop.run_until_complete(awaitable)
+
+    def _control(self, method: str, path: str, body: Any = None) -> Any:
+        """Send a request to a control endpoint of the simulator."""
+        request = urllib.request.Request(
+            f"https://127.0.0.1:{self.port}{path}",
+            data=None if body is None else json.dumps(body).encode(),
+            headers={"Content-Type": "application/json"},
+            method=method,
+        )
+        with urllib.request.urlopen(  # noqa: S310
+            request, context=self._control_context
+        ) as response:
+            return json.load(response)
+
+    def take_requests(self) -> Counter[str]:
+        """Return and reset the simulator's request counters."""
+        return Counter(self._control("DELETE", "/_stats"))
+
+    @property
+    def pages(self) -> dict[str, dict[str, str]]:
+        """Return the current values of the simulator's pages."""
+        return self._control("GET", "/_state")["pages"]
+
+    @property
+    def posted(self) -> list[dict[str, str]]:
+        """Return the form fields of every POST to a page, in order."""
+        return self._control("GET", "/_state")["posted"]
+
+    def set_values(self, url: str, values: dict[str, str]) -> None:
+        """Change values of a page, as the controller itself does."""
+        self._control("PATCH", "/_state", {url: values})
+
+    def expire_sessions(self) -> None:
+        """Drop every session, as a restart of the controller does."""
+        self._control("DELETE", "/_sessions")
+
+    def close(self) -> None:
+        """Stop the client, the loop and the simulator."""
+        self.run(self.client.async_close())
+        self.loop.close()
+        self._process.terminate()
+        self._process.join()
+
+
+@pytest.fixture
+def controller_factory() -> Iterator[Callable[..., Controller]]:
+    """Return a factory of simulated controllers, closed after the test."""
+    controllers: list[Controller] = []
+
+    def factory(**options: Any) -> Controller:
+        controllers.append(Controller(**options))
+        return controllers[-1]
+
+    yield factory
+    for controller in controllers:
+        controller.close()
+
+
+@pytest.fixture
+def controller(controller_factory: Callable[..., Controller]) -> Controller:
+    """Return a simulated controller with the default session lifetime."""
+    return controller_factory()
+
+
+@pytest.fixture
+def coordinator(
+    controller: Controller, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[AcondDataUpdateCoordinator]:
+    """Return the coordinator of a config entry of the simulated controller."""
+    monkeypatch.setattr(api, "PAGE_FRESHNESS", 0)
+
+    async def setup() -> AcondDataUpdateCoordinator:
+        hass = HomeAssistant(str(tmp_path))
+        await er.async_load(hass)
+        entry = ConfigEntry(
+            data={CONF_MAC: "00:11:22:33:44:55"},
+            discovery_keys=MappingProxyType({}),
+            domain=DOMAIN,
+            minor_version=1,
+            options={},
+            source="user",
+            title="Acond",
+            unique_id=None,
+            version=1,
+        )
+        current_entry.set(entry)
+        coordinator = AcondDataUpdateCoordinator(
+            hass,
+            LOGGER,
+            DOMAIN,
+            active_interval=timedelta(seconds=10),
+            idle_interval=timedelta(seconds=60),
+        )
+        registry = load_registry()
+        entry.runtime_data = AcondProData(
+            client=controller.client,
+            coordinator=coordinator,
+            integration=None,  # type: ignore[arg-type]
+            registry=registry,
+            timetables=AcondTimetables(coordinator, registry.timetables),
+        )
+        coordinator.async_plan_initial_pages()
+        return coordinator
+
+    coordinator = controller.run(setup())
+    yield coordinator
+    controller.run(coordinator.hass.async_stop(force=True))
@@ -0,0 +1,157 @@
+"""Request budget and circuit breaker of the client."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from custom_components.acond import api
+from custom_components.acond.api import (
+    BREAKER_BASE_DELAY,
+    BREAKER_CLOSED,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_HALF_OPEN,
+    BREAKER_MAX_DELAY,
+    BREAKER_OPEN,
+    AcondCircuitBreaker,
+    AcondProApiClientCommunicationError,
+    AcondProApiClientUnavailableError,
+    AcondProRequestBudget,
+)
+
+
+class Clock:
+    """Monotonic time of the breaker, advanced by the test."""
+
+    def __init__(self) -> None:
+        """Start at zero."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    """Freeze the breaker's clock and take the jitter out of its delays."""
+    clock = Clock()
+    monkeypatch.setattr(api.time, "monotonic", clock)
+    monkeypatch.setattr(api.random, "uniform", lambda low, high: 0.0)  # noqa: ARG005
+    return clock
+
+
+def fail(breaker: AcondCircuitBreaker, times: int) -> None:
+    """Record consecutive communication failures."""
+    for _ in range(times):
+        breaker.record_failure(AcondProApiClientCommunicationError("refused"))
+
+
+def test_budget_waits_until_repaid() -> None:
+    """An overdrawn budget makes the next request wait, not the last one."""
+    budget = AcondProRequestBudget(max_concurrent_requests=2, bytes_per_second=10_000)
+
+    budget.consume(12_000)
+    started = time.monotonic()
+    asyncio.run(budget.async_wait())
+
+    assert time.monotonic() - started >= 0.19
+
+
+def test_budget_within_bandwidth_does_not_wait() -> None:
+    """Bytes within one second worth of bandwidth do not hold requests back."""
+    budget = AcondProRequestBudget(max_concurrent_requests=2, bytes_per_second=10_000)
+
+    budget.consume(9_000)
+    started = time.monotonic()
+    asyncio.run(budget.async_wait())
+
+    assert time.monotonic() - started < 0.05
+
+
+def test_throttled_wait_holds_no_slot() -> None:
+    """Requests of other controllers get slots while one waits for bandwidth."""
+    budget = AcondProRequestBudget(max_concurrent_requests=1, bytes_per_second=1_000)
+    budget.consume(1_500)
+
+    async def other_request() -> bool:
+        waiting = asyncio.create_task(budget.async_wait())
+        await asyncio.sleep(0)
+        async with asyncio.timeout(0.1), budget.slots:
+            acquired = not waiting.done()
+        waiting.cancel()
+        return acquired
+
+    assert asyncio.run(other_request())
+
+
+@pytest.mark.usefixtures("clock")
+def test_breaker_opens_after_the_threshold() -> None:
+    """Requests fail at once after BREAKER_FAILURE_THRESHOLD failures."""
+    breaker = AcondCircuitBreaker()
+
+    fail(breaker, BREAKER_FAILURE_THRESHOLD - 1)
+    assert breaker.state == BREAKER_CLOSED
+    assert breaker.before_request() is False
+
+    fail(breaker, 1)
+    assert breaker.state == BREAKER_OPEN
+    assert breaker.retry_in == BREAKER_BASE_DELAY
+    with pytest.raises(AcondProApiClientUnavailableError, match="refused"):
+        breaker.before_request()
+
+
+def test_breaker_lets_one_probe_through(clock: Clock) -> None:
+    """A single probe is sent once the delay has passed."""
+    breaker = AcondCircuitBreaker()
+    fail(breaker, BREAKER_FAILURE_THRESHOLD)
+
+    clock.now = BREAKER_BASE_DELAY - 1
+    with pytest.raises(AcondProApiClientUnavailableError):
+        breaker.before_request()
+
+    clock.now = BREAKER_BASE_DELAY
+    assert breaker.state == BREAKER_HALF_OPEN
+    assert breaker.before_request() is True
+    with pytest.raises(AcondProApiClientUnavailableError):
+        breaker.before_request()
+
+    breaker.end_probe()
+    assert breaker.before_request() is True
+
+
+def test_breaker_backoff_doubles_up_to_the_maximum(clock: Clock) -> None:
+    """Every failed probe doubles the delay of the next one."""
+    breaker = AcondCircuitBreaker()
+    fail(breaker, BREAKER_FAILURE_THRESHOLD)
+
+    delays = []
+    for _ in range(8):
+        clock.now += breaker.retry_in
+        assert breaker.before_request() is True
+        fail(breaker, 1)
+        breaker.end_probe()
+        delays.append(breaker.retry_in)
+
+    assert delays[:3] == [BREAKER_BASE_DELAY * 2**step for step in (1, 2, 3)]
+    assert max(delays) == delays[-1] == BREAKER_MAX_DELAY
+
+
+def test_breaker_closes_on_success(clock: Clock) -> None:
+    """An answered probe closes the breaker and resets the backoff."""
+    breaker = AcondCircuitBreaker()
+    fail(breaker, BREAKER_FAILURE_THRESHOLD + 2)
+    clock.now += breaker.retry_in
+    assert breaker.before_request() is True
+
+    breaker.record_success()
+    breaker.end_probe()
+
+    assert breaker.state == BREAKER_CLOSED
+    assert breaker.failures == 0
+    assert breaker.last_error is None
+    assert breaker.before_request() is False
+    fail(breaker, BREAKER_FAILURE_THRESHOLD)
+    assert breaker.retry_in == BREAKER_BASE_DELAY
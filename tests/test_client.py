@@ -0,0 +1,304 @@
+"""Requests, sessions and writes of the client against the simulator."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from custom_components.acond import api
+from custom_components.acond.api import (
+    MAX_WRITES_PER_POST,
+    AcondProApiClientAuthenticationError,
+)
+from custom_components.acond.const import (
+    INDOOR_TEMPERATURE_TERGET_SET,
+    URL_HOME,
+    URL_INFO,
+    URL_LOGIN,
+)
+from custom_components.acond.tags import encode_value
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from .conftest import Controller
+
+LOGIN = f"POST {URL_LOGIN}"
+GET_HOME = f"GET {URL_HOME}"
+GET_INFO = f"GET {URL_INFO}"
+POST_HOME = f"POST {URL_HOME}"
+
+BENCHMARK_ROUNDS = 20
+
+
+@pytest.fixture
+def uncached(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make every read reach the controller, as refreshes seconds apart do."""
+    monkeypatch.setattr(api, "PAGE_FRESHNESS", 0)
+
+
+class Measured:
+    """
+    A benchmarked function, counting its calls and the CPU time they take.
+
+    The simulator runs in its own process, so the CPU time of this process
+    is the client's, its event loop included.
+    """
+
+    def __init__(self, function: Callable[[], Any]) -> None:
+        """Wrap a function."""
+        self.function = function
+        self.calls = 0
+        self.cpu_time = 0.0
+
+    def __call__(self) -> Any:
+        """Call the function, however pytest-benchmark runs it."""
+        started = time.process_time()
+        try:
+            return self.function()
+        finally:
+            self.cpu_time += time.process_time() - started
+            self.calls += 1
+
+    def record(self, benchmark: Any) -> None:
+        """Add the mean CPU time per call to the benchmark results."""
+        benchmark.extra_info["cpu_time_per_call"] = self.cpu_time / self.calls
+
+
+async def gather(*awaitables: Awaitable[Any]) -> list[Any]:
+    """Run awaitables concurrently, on the loop that awaits this."""
+    return await asyncio.gather(*awaitables)
+
+
+def test_first_refresh_logs_in_once(controller: Controller) -> None:
+    """Concurrent first reads share one login."""
+    pages = controller.run(controller.client.async_get_pages([URL_HOME, URL_INFO]))
+
+    assert controller.take_requests() == {LOGIN: 1, GET_HOME: 1, GET_INFO: 1}
+    assert pages[URL_HOME][INDOOR_TEMPERATURE_TERGET_SET] == 21.5
+
+
+@pytest.mark.usefixtures("uncached")
+def test_refresh_reuses_the_session(controller: Controller) -> None:
+    """Later refreshes cost one GET per page and no login."""
+    controller.run(controller.client.async_get_pages([URL_HOME, URL_INFO]))
+    controller.take_requests()
+
+    for _ in range(5):
+        controller.run(controller.client.async_get_pages([URL_HOME, URL_INFO]))
+
+    assert controller.take_requests() == {GET_HOME: 5, GET_INFO: 5}
+
+
+def test_fresh_page_is_not_read_again(controller: Controller) -> None:
+    """A page read within PAGE_FRESHNESS is served from memory."""
+    first = controller.run(controller.client.async_get_pages([URL_HOME]))
+    controller.take_requests()
+
+    second = controller.run(controller.client.async_get_pages([URL_HOME]))
+
+    assert controller.take_requests() == {}
+    assert second == first
+
+
+@pytest.mark.usefixtures("uncached")
+def test_concurrent_reads_share_one_request(controller: Controller) -> None:
+    """Concurrent reads of the same page share the request in flight."""
+    controller.run(controller.client.async_get_pages([URL_HOME]))
+    controller.take_requests()
+
+    controller.run(
+        gather(
+            controller.client.async_get_pages([URL_HOME]),
+            controller.client.async_get_pages([URL_HOME]),
+        )
+    )
+
+    assert controller.take_requests() == {GET_HOME: 1}
+
+
+@pytest.mark.usefixtures("uncached")
+def test_expired_session_logs_in_again(
+    controller_factory: Callable[..., Controller],
+) -> None:
+    """A page refused for an expired session is read again after a login."""
+    controller = controller_factory(session_lifetime=0.2)
+    controller.run(controller.client.async_get_pages([URL_HOME]))
+    controller.take_requests()
+    time.sleep(0.3)
+
+    pages = controller.run(controller.client.async_get_pages([URL_HOME]))
+
+    assert controller.take_requests() == {GET_HOME: 2, LOGIN: 1}
+    assert pages[URL_HOME][INDOOR_TEMPERATURE_TERGET_SET] == 21.5
+
+
+@pytest.mark.usefixtures("uncached")
+def test_early_expiry_does_not_shorten_sessions(controller: Controller) -> None:
+    """A session dropped early, as by a restart, costs a single login."""
+    controller.run(controller.client.async_get_pages([URL_HOME]))
+    controller.expire_sessions()
+    controller.take_requests()
+
+    for _ in range(10):
+        controller.run(controller.client.async_get_pages([URL_HOME]))
+
+    assert controller.take_requests() == {GET_HOME: 11, LOGIN: 1}
+
+
+@pytest.mark.usefixtures("uncached")
+def test_session_lifetime_is_a_lower_bound(
+    controller_factory: Callable[..., Controller], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Sessions are renewed ahead once seen to live, by the longest seen."""
+    monkeypatch.setattr(api, "MIN_SESSION_LIFETIME", 0.1)
+    controller = controller_factory(session_lifetime=0.3)
+    client = controller.client
+    controller.run(client.async_get_pages([URL_HOME]))
+    time.sleep(0.2)
+    controller.run(client.async_get_pages([URL_HOME]))
+    time.sleep(0.2)
+    controller.run(client.async_get_pages([URL_HOME]))
+    controller.take_requests()
+    lifetime = client._session_lifetime
+
+    # Renewed before the session expires, without a refused request.
+    time.sleep(lifetime * api.SESSION_RENEW_MARGIN)
+    controller.run(client.async_get_pages([URL_HOME]))
+    assert controller.take_requests() == {LOGIN: 1, GET_HOME: 1}
+
+    # A shorter life, such as a restart, does not shorten it.
+    controller.expire_sessions()
+    controller.run(client.async_get_pages([URL_HOME]))
+    assert client._session_lifetime == lifetime
+
+
+def test_invalid_credentials(controller: Controller) -> None:
+    """A login refused by the controller raises an authentication error."""
+    client = controller.new_client(password="wrong")  # noqa: S106
+    try:
+        with pytest.raises(AcondProApiClientAuthenticationError):
+            controller.run(client.async_get_pages([URL_HOME]))
+    finally:
+        controller.run(client.async_close())
+
+    assert controller.take_requests() == {LOGIN: 1}
+
+
+def test_write_posts_encoded_values(controller: Controller) -> None:
+    """A write posts the value in its tag's format and returns the page."""
+    page = controller.run(
+        controller.client.async_write_tags({INDOOR_TEMPERATURE_TERGET_SET: 22.04})
+    )
+
+    assert controller.posted == [{INDOOR_TEMPERATURE_TERGET_SET: "22.0"}]
+    assert controller.take_requests() == {LOGIN: 1, POST_HOME: 1}
+    assert page[INDOOR_TEMPERATURE_TERGET_SET] == 22.0
+
+
+def test_read_overtaken_by_a_write(
+    controller: Controller, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A read that finishes after a write returns and keeps the written page."""
+    client = controller.client
+    controller.run(client.async_get_pages([URL_HOME]))
+    send = client._api_txt_wrapper
+
+    async def slow_read(method: str, url: str, **kwargs: Any) -> Any:
+        values = await send(method, url, **kwargs)
+        if method == "get":
+            await asyncio.sleep(api.WRITE_BATCH_DELAY * 2)
+        return values
+
+    monkeypatch.setattr(api, "PAGE_FRESHNESS", 0)
+    monkeypatch.setattr(client, "_api_txt_wrapper", slow_read)
+    read, _ = controller.run(
+        gather(
+            client.async_get_pages([URL_HOME]),
+            client.async_write_tags({INDOOR_TEMPERATURE_TERGET_SET: 22.0}),
+        )
+    )
+    monkeypatch.setattr(api, "PAGE_FRESHNESS", 60)
+
+    assert read[URL_HOME][INDOOR_TEMPERATURE_TERGET_SET] == 22.0
+    cached = controller.run(client.async_get_pages([URL_HOME]))
+    assert cached[URL_HOME][INDOOR_TEMPERATURE_TERGET_SET] == 22.0
+
+
+def test_write_rejects_values_of_the_wrong_type(controller: Controller) -> None:
+    """A value that does not fit its tag fails before anything is sent."""
+    with pytest.raises(ValueError, match="REAL"):
+        controller.run(
+            controller.client.async_write_tags({INDOOR_TEMPERATURE_TERGET_SET: "hot"})
+        )
+
+    assert controller.take_requests() == {}
+
+
+def test_concurrent_writes_are_batched(controller: Controller) -> None:
+    """Writes issued together share POSTs of at most MAX_WRITES_PER_POST."""
+    tags = [name for name in controller.pages[URL_HOME] if "_INT_" in name]
+    tags = tags[: MAX_WRITES_PER_POST + 2]
+
+    controller.run(
+        gather(*(controller.client.async_write_tags({tag: 7}) for tag in tags))
+    )
+
+    assert controller.take_requests() == {LOGIN: 1, POST_HOME: 2}
+    assert [len(form) for form in controller.posted] == [
+        MAX_WRITES_PER_POST,
+        2,
+    ]
+    page = controller.pages[URL_HOME]
+    assert all(page[tag] == encode_value(tag, 7) for tag in tags)
+
+
+@pytest.mark.usefixtures("uncached")
+@pytest.mark.parametrize(
+    "urls", [[URL_HOME, URL_INFO], [URL_HOME]], ids=["all pages", "home page"]
+)
+def test_benchmark_refresh(
+    benchmark: Any, controller: Controller, urls: list[str]
+) -> None:
+    """Time a refresh of a logged in client, one GET per page."""
+    controller.run(controller.client.async_get_pages(urls))
+    controller.take_requests()
+    refresh = Measured(lambda: controller.run(controller.client.async_get_pages(urls)))
+
+    benchmark.pedantic(refresh, rounds=BENCHMARK_ROUNDS)
+    refresh.record(benchmark)
+
+    assert controller.take_requests() == {f"GET {url}": refresh.calls for url in urls}
+
+
+def test_benchmark_cached_refresh(benchmark: Any, controller: Controller) -> None:
+    """Time refreshes served from the freshness window, without requests."""
+    controller.run(controller.client.async_get_pages([URL_HOME, URL_INFO]))
+    controller.take_requests()
+    refresh = Measured(
+        lambda: controller.run(controller.client.async_get_pages([URL_HOME, URL_INFO]))
+    )
+
+    benchmark.pedantic(refresh, rounds=BENCHMARK_ROUNDS)
+    refresh.record(benchmark)
+
+    assert controller.take_requests() == {}
+
+
+def test_benchmark_write(benchmark: Any, controller: Controller) -> None:
+    """Time a write, one POST including the batching delay."""
+    controller.run(controller.client.async_get_pages([URL_HOME]))
+    controller.take_requests()
+    write = Measured(
+        lambda: controller.run(
+            controller.client.async_write_tags({INDOOR_TEMPERATURE_TERGET_SET: 21.5})
+        )
+    )
+
+    benchmark.pedantic(write, rounds=5)
+    write.record(benchmark)
+
+    assert controller.take_requests() == {POST_HOME: write.calls}
@@ -0,0 +1,145 @@
+"""Listener updates and page plan of the coordinator, against the simulator."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from custom_components.acond.api import AcondProApiClientCommunicationError
+from custom_components.acond.const import (
+    ETH2_IP,
+    ETH2_MAC,
+    INDOOR_TEMPERATURE_TERGET_SET,
+    OUTDOR_TEMPERATURE,
+    URL_HOME,
+    URL_INFO,
+)
+from custom_components.acond.tags import encode_value
+
+if TYPE_CHECKING:
+    import pytest
+
+    from custom_components.acond.coordinator import AcondDataUpdateCoordinator
+
+    from .conftest import Controller
+
+GET_HOME = f"GET {URL_HOME}"
+GET_INFO = f"GET {URL_INFO}"
+
+
+def listen(coordinator: AcondDataUpdateCoordinator, *tags: str) -> list[int]:
+    """Listen for updates of tags, all of them if none, counting the calls."""
+    calls = [0]
+
+    def update() -> None:
+        calls[0] += 1
+
+    coordinator.async_add_listener(update, frozenset(tags) if tags else None)
+    return calls
+
+
+def refresh(controller: Controller, coordinator: AcondDataUpdateCoordinator) -> None:
+    """Refresh the coordinator and check that it succeeded."""
+    controller.run(coordinator.async_refresh())
+    assert coordinator.last_update_success
+
+
+def test_initial_refresh_reads_every_page(
+    controller: Controller, coordinator: AcondDataUpdateCoordinator
+) -> None:
+    """Before any entity subscribes, all registered pages are read in full."""
+    assert coordinator.fetch_plan == {URL_HOME, URL_INFO}
+    assert coordinator.wanted_tags is None
+
+    refresh(controller, coordinator)
+
+    assert controller.take_requests()[GET_INFO] == 1
+    assert coordinator.data[ETH2_IP] == controller.pages[URL_INFO][ETH2_IP]
+
+
+def test_fetch_plan_follows_the_listeners(
+    controller: Controller, coordinator: AcondDataUpdateCoordinator
+) -> None:
+    """Pages are read while an entity reads tags from them."""
+    refresh(controller, coordinator)
+    listen(coordinator, INDOOR_TEMPERATURE_TERGET_SET)
+    assert coordinator.fetch_plan == {URL_HOME}
+    assert INDOOR_TEMPERATURE_TERGET_SET in coordinator.wanted_tags
+    assert ETH2_IP not in coordinator.wanted_tags
+
+    remove = coordinator.async_add_listener(lambda: None, frozenset({ETH2_IP}))
+    assert coordinator.fetch_plan == {URL_HOME, URL_INFO}
+    remove()
+    assert coordinator.fetch_plan == {URL_HOME}
+
+    controller.take_requests()
+    refresh(controller, coordinator)
+    assert controller.take_requests() == {GET_HOME: 1}
+
+
+def test_newly_needed_tag_is_read_at_once(
+    controller: Controller, coordinator: AcondDataUpdateCoordinator
+) -> None:
+    """A tag skipped so far re-reads its page, though not due for hours."""
+    listen(coordinator, ETH2_IP)
+    refresh(controller, coordinator)
+    refresh(controller, coordinator)
+    assert ETH2_MAC not in coordinator.data
+    controller.take_requests()
+
+    listen(coordinator, ETH2_MAC)
+    refresh(controller, coordinator)
+
+    assert controller.take_requests() == {GET_HOME: 1, GET_INFO: 1}
+    assert coordinator.data[ETH2_MAC] == controller.pages[URL_INFO][ETH2_MAC]
+    refresh(controller, coordinator)
+    assert controller.take_requests() == {GET_HOME: 1}
+
+
+def test_only_listeners_of_changed_tags_are_called(
+    controller: Controller, coordinator: AcondDataUpdateCoordinator
+) -> None:
+    """Listeners of unchanged tags are skipped, untagged ones always called."""
+    refresh(controller, coordinator)
+    target = listen(coordinator, INDOOR_TEMPERATURE_TERGET_SET)
+    outdoor = listen(coordinator, OUTDOR_TEMPERATURE)
+    untagged = listen(coordinator)
+
+    controller.set_values(
+        URL_HOME,
+        {
+            INDOOR_TEMPERATURE_TERGET_SET: encode_value(
+                INDOOR_TEMPERATURE_TERGET_SET, 23.5
+            )
+        },
+    )
+    refresh(controller, coordinator)
+    refresh(controller, coordinator)
+
+    assert coordinator.data[INDOOR_TEMPERATURE_TERGET_SET] == 23.5
+    assert target == [1]
+    assert outdoor == [0]
+    assert untagged == [2]
+
+
+def test_failed_refresh_updates_every_listener(
+    controller: Controller,
+    coordinator: AcondDataUpdateCoordinator,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Availability changes reach all listeners, whatever their tags."""
+    refresh(controller, coordinator)
+    outdoor = listen(coordinator, OUTDOR_TEMPERATURE)
+    read = controller.client.async_get_pages
+
+    async def unreachable(*_: Any) -> Any:
+        msg = "Timeout error fetching information"
+        raise AcondProApiClientCommunicationError(msg)
+
+    monkeypatch.setattr(controller.client, "async_get_pages", unreachable)
+    controller.run(coordinator.async_refresh())
+    assert not coordinator.last_update_success
+    assert outdoor == [1]
+
+    monkeypatch.setattr(controller.client, "async_get_pages", read)
+    refresh(controller, coordinator)
+    assert outdoor == [2]
@@ -0,0 +1,139 @@
+"""Cycle counts, duty cycles and short cycling of the components."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from custom_components.acond.const import (
+    COMPRESSOR,
+    DEFROST,
+    DERIVED_ELECTRIC_POWER,
+    DERIVED_SHORT_CYCLING,
+    OUTDOR_TEMPERATURE,
+)
+from custom_components.acond.cycles import (
+    DUTY_CYCLE_WINDOW,
+    SHORT_CYCLE,
+    SHORT_CYCLE_ALERT_COUNT,
+    AcondCycleDetector,
+    ComponentCycles,
+    cycles_key,
+    duty_cycle_key,
+)
+
+MINUTE = 60
+HOUR = 3600
+
+
+def switch(
+    cycles: ComponentCycles, now: float, *, on: bool | None, power: float | None = 2.0
+) -> Any:
+    """Track one reading of a component."""
+    return cycles.update(now, on=on, power=power, outdoor_temperature=-5.0)
+
+
+def test_cycle_is_counted_when_it_ends() -> None:
+    """A cycle starts on a transition to on and is recorded when it stops."""
+    cycles = ComponentCycles("compressor")
+    # Already running on the first reading: its start is unknown.
+    assert switch(cycles, 0, on=True) is None
+    assert switch(cycles, 10 * MINUTE, on=False) is None
+    assert cycles.count == 0
+
+    assert switch(cycles, 20 * MINUTE, on=True) is None
+    assert switch(cycles, 50 * MINUTE, on=True) is None
+    record = switch(cycles, HOUR, on=False)
+
+    assert cycles.count == 1
+    assert record.start == 20 * MINUTE
+    assert record.duration == 40 * MINUTE
+    assert record.energy == round(2.0 * 40 / 60, 3)
+    assert record.outdoor_temperature == -5.0
+    assert record.short is False
+
+
+def test_unknown_readings_and_power_gaps() -> None:
+    """Unknown states are skipped, a power gap leaves the energy unknown."""
+    cycles = ComponentCycles("main_pump")
+    switch(cycles, 0, on=False)
+    switch(cycles, MINUTE, on=True)
+    assert switch(cycles, 2 * MINUTE, on=None) is None
+    switch(cycles, 3 * MINUTE, on=True, power=None)
+    record = switch(cycles, 4 * MINUTE, on=False)
+
+    assert record.duration == 3 * MINUTE
+    assert record.energy is None
+    # Only the compressor short cycles.
+    assert record.short is False
+
+
+def test_duty_cycle_over_the_window() -> None:
+    """The duty cycle is the on time within the window, running cycle included."""
+    cycles = ComponentCycles("compressor")
+    window = DUTY_CYCLE_WINDOW.total_seconds()
+    assert cycles.duty_cycle(0) is None
+
+    switch(cycles, 0, on=False)
+    switch(cycles, HOUR, on=True)
+    switch(cycles, 2 * HOUR, on=False)
+    assert cycles.duty_cycle(4 * HOUR) == 25.0
+
+    switch(cycles, 4 * HOUR, on=True)
+    assert cycles.duty_cycle(6 * HOUR) == 50.0
+
+    # Later, the first cycle has half left the window and the second runs.
+    switch(cycles, window + 1.5 * HOUR, on=True)
+    assert cycles.duty_cycle(window + 1.5 * HOUR) == round(
+        100 * (0.5 * HOUR + window - 2.5 * HOUR) / window, 1
+    )
+    switch(cycles, window + 2 * HOUR, on=False)
+    assert cycles.duty_cycle(window + 5 * HOUR) == round(
+        100 * (window - 3 * HOUR) / window, 1
+    )
+
+
+def readings(detector: AcondCycleDetector, *states: tuple[float, bool]) -> Any:
+    """Feed compressor states to the detector, returning the last data."""
+    data: dict[str, Any] = {}
+    for now, on in states:
+        data = {
+            COMPRESSOR: on,
+            DEFROST: False,
+            DERIVED_ELECTRIC_POWER: 1.5,
+            OUTDOR_TEMPERATURE: 2.0,
+        }
+        detector.update(now, data)
+    return data
+
+
+def test_detector_publishes_counts_and_logs_cycles() -> None:
+    """Every update carries the counts and duty cycles of all components."""
+    detector = AcondCycleDetector()
+
+    data = readings(detector, (0, False), (HOUR, True), (2 * HOUR, False))
+
+    assert data[cycles_key("compressor")] == 1
+    assert data[duty_cycle_key("compressor")] == 50.0
+    assert data[cycles_key("defrost")] == 0
+    assert data[duty_cycle_key("defrost")] == 0.0
+    assert data[duty_cycle_key("bivalence_1")] is None
+    assert data[DERIVED_SHORT_CYCLING] is False
+    assert [record.component for record in detector.log] == ["compressor"]
+
+
+def test_short_cycling_alert() -> None:
+    """Enough short compressor cycles within the window raise the alert."""
+    detector = AcondCycleDetector()
+    short = SHORT_CYCLE.total_seconds() - 1
+    states = [(0.0, False)]
+    for cycle in range(SHORT_CYCLE_ALERT_COUNT):
+        start = (cycle + 1) * 15 * MINUTE
+        states += [(start, True), (start + short, False)]
+
+    assert readings(detector, *states[:-2])[DERIVED_SHORT_CYCLING] is False
+    assert readings(detector, *states[-2:])[DERIVED_SHORT_CYCLING] is True
+    assert all(record.short for record in detector.log)
+
+    # The alert clears once the short cycles leave the window.
+    later = states[-1][0] + 2 * HOUR
+    assert readings(detector, (later, False))[DERIVED_SHORT_CYCLING] is False
@@ -0,0 +1,143 @@
+"""Metrics derived from the counters and temperatures."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from custom_components.acond.const import (
+    DEFROST,
+    DERIVED_COP,
+    DERIVED_DEFROST_ENERGY,
+    DERIVED_DEFROST_ENERGY_TOTAL,
+    DERIVED_DELTA_T,
+    DERIVED_ELECTRIC_POWER,
+    ELECTRIC_ENERGY,
+    IN_WATER_TEMPARATURE,
+    OUT_WATER_TEMPARATURE,
+    THERMAL_ENERGY,
+)
+from custom_components.acond.derived import (
+    KWH_PER_GJ,
+    AcondDerivedMetrics,
+    CounterRate,
+)
+
+HOUR = 3600
+
+
+def reading(electric: float, thermal: float, **values: Any) -> dict[str, Any]:
+    """Return the data of a live update with the given counters."""
+    return {ELECTRIC_ENERGY: electric, THERMAL_ENERGY: thermal, **values}
+
+
+def update(metrics: AcondDerivedMetrics, now: float, data: dict[str, Any]) -> Any:
+    """Derive the metrics of one update and return its data."""
+    metrics.update(now, data)
+    return data
+
+
+def test_counter_rate_between_steps() -> None:
+    """The rate is the last step over the time between the last two changes."""
+    rate = CounterRate()
+
+    assert rate.update(0, 100) is None
+    assert rate.update(HOUR, 101) is None
+    assert rate.update(2 * HOUR, 103) == 2.0
+    assert rate.update(2.5 * HOUR, 103) == 2.0
+
+
+def test_counter_rate_decays_without_steps() -> None:
+    """A counter that stopped changing cannot have stepped since."""
+    rate = CounterRate()
+    for now, value in ((0, 100), (HOUR, 101), (2 * HOUR, 102)):
+        rate.update(now, value)
+
+    assert rate.update(6 * HOUR, 102) == 0.25
+
+
+def test_counter_rate_restarts_after_a_reset() -> None:
+    """A counter going back starts over, its next step time being unknown."""
+    rate = CounterRate()
+    for now, value in ((0, 100), (HOUR, 101), (2 * HOUR, 102)):
+        rate.update(now, value)
+
+    assert rate.update(3 * HOUR, 5) is None
+    assert rate.update(4 * HOUR, 6) is None
+    assert rate.update(5 * HOUR, 7) == 1.0
+    assert rate.update(5 * HOUR, None) is None
+
+
+def test_cop_over_the_last_thermal_steps() -> None:
+    """The COP spans the kept thermal steps, however long they took."""
+    metrics = AcondDerivedMetrics(cop_steps=2)
+    # One GJ of heat every 3 days for 100 kWh of electricity, then 50 kWh.
+    readings = [(1000, 10), (1040, 11), (1140, 12), (1240, 13), (1290, 14)]
+
+    cops = [
+        update(metrics, day * 3 * 24 * HOUR, reading(*values))[DERIVED_COP]
+        for day, values in enumerate(readings)
+    ]
+
+    per_100 = round(KWH_PER_GJ / 100, 2)
+    assert cops == [None, None, per_100, per_100, round(2 * KWH_PER_GJ / 150, 2)]
+
+
+def test_cop_ignores_the_first_reading_and_resets() -> None:
+    """The counter may have stepped any time before the first reading."""
+    metrics = AcondDerivedMetrics()
+    update(metrics, 0, reading(1000, 10))
+    update(metrics, HOUR, reading(1010, 11))
+    assert update(metrics, 2 * HOUR, reading(1110, 12))[DERIVED_COP] == round(
+        KWH_PER_GJ / 100, 2
+    )
+
+    assert update(metrics, 3 * HOUR, reading(5, 0))[DERIVED_COP] is None
+    assert update(metrics, 4 * HOUR, reading(105, 1))[DERIVED_COP] is None
+
+
+def test_aggregates_survive_a_restart() -> None:
+    """COP steps and defrost energy continue from the saved aggregates."""
+    metrics = AcondDerivedMetrics()
+    update(metrics, 0, reading(1000, 10))
+    update(metrics, HOUR, reading(1010, 11))
+    update(metrics, 2 * HOUR, reading(1011, 11, **{DEFROST: True}))
+    update(metrics, 2.5 * HOUR, reading(1012, 11, **{DEFROST: False}))
+    saved = metrics.as_dict()
+
+    restarted = AcondDerivedMetrics()
+    restarted.restore(saved)
+    # The first reading after the restart is not a step, the next one is.
+    first = update(restarted, 0, reading(1050, 11))
+    data = update(restarted, HOUR, reading(1110, 12))
+
+    assert first[DERIVED_DEFROST_ENERGY_TOTAL] == saved["defrost_energy_total"] > 0
+    assert data[DERIVED_COP] == round(KWH_PER_GJ / 100, 2)
+
+
+def test_restored_steps_are_dropped_after_a_counter_reset() -> None:
+    """Counters lower than the saved steps were reset while HA was stopped."""
+    metrics = AcondDerivedMetrics()
+    metrics.restore({"cop_steps": [(2777.8, 1000), (3055.6, 1100)]})
+
+    assert update(metrics, 0, reading(5, 0))[DERIVED_COP] is None
+    assert metrics.as_dict()["cop_steps"] == []
+
+
+def test_delta_t_power_and_defrost_energy() -> None:
+    """Instant metrics of one update, and the energy of a defrost cycle."""
+    metrics = AcondDerivedMetrics()
+    temperatures = {OUT_WATER_TEMPARATURE: 35.0, IN_WATER_TEMPARATURE: 30.5}
+    update(metrics, 0, reading(100, 1))
+    update(metrics, HOUR, reading(101, 1))
+    data = update(metrics, 2 * HOUR, reading(103, 1, **temperatures, **{DEFROST: True}))
+    assert data[DERIVED_DELTA_T] == 4.5
+    assert data[DERIVED_ELECTRIC_POWER] == 2.0
+    assert data[DERIVED_DEFROST_ENERGY] is None
+
+    data = update(metrics, 2.25 * HOUR, reading(103, 1, **{DEFROST: False}))
+
+    assert data[DERIVED_DEFROST_ENERGY] == pytest.approx(0.5)
+    assert data[DERIVED_DEFROST_ENERGY_TOTAL] == pytest.approx(0.5)
+    assert data[DERIVED_DELTA_T] is None
@@ -0,0 +1,66 @@
+"""Cold import time of the integration and of its platforms."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parent.parent
+PACKAGE = "custom_components.acond"
+MODULES = (
+    PACKAGE,
+    f"{PACKAGE}.sensor",
+    f"{PACKAGE}.binary_sensor",
+    f"{PACKAGE}.calendar",
+    f"{PACKAGE}.climate",
+    f"{PACKAGE}.water_heater",
+    f"{PACKAGE}.select",
+    f"{PACKAGE}.switch",
+)
+# Loaded by Home Assistant itself before any integration is imported.
+PRELOADED = (
+    "homeassistant.core",
+    "homeassistant.config_entries",
+    "homeassistant.helpers.config_validation",
+    "homeassistant.helpers.entity_platform",
+    "homeassistant.helpers.storage",
+    "homeassistant.helpers.update_coordinator",
+    "homeassistant.util.ssl",
+)
+# Only needed by the previous parser, they must not be loaded anymore.
+UNUSED = ("bs4", "lxml")
+
+RUN = """
+import importlib, json, sys, time
+sys.path.insert(0, {root!r})
+for module in {preloaded!r}:
+    importlib.import_module(module)
+loaded = set(sys.modules)
+started = time.perf_counter()
+for module in {modules!r}:
+    importlib.import_module(module)
+print(json.dumps({{
+    "seconds": time.perf_counter() - started,
+    "modules": sorted(set(sys.modules) - loaded),
+}}))
+"""
+
+
+def import_once() -> dict[str, Any]:
+    """Import the modules in a fresh interpreter, return the time and modules."""
+    code = RUN.format(root=str(ROOT), preloaded=PRELOADED, modules=MODULES)
+    output = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output)
+
+
+def test_benchmark_import(benchmark: Any) -> None:
+    """Time the import, which must not load the previous parser's packages."""
+    result = benchmark.pedantic(import_once, rounds=5)
+
+    loaded = {module.partition(".")[0] for module in result["modules"]}
+    assert loaded.isdisjoint(UNUSED)
@@ -0,0 +1,119 @@
+"""Page parser against the previous BeautifulSoup implementation."""
+
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from typing import Any
+
+import pytest
+from bs4 import BeautifulSoup
+
+from custom_components.acond.parser import parse_inputs, parse_values
+from custom_components.acond.tags import decode_value
+
+FIXTURES = Path(__file__).resolve().parent.parent / "benchmarks" / "fixtures"
+PAGES = ("PAGE115.XML", "PAGE121.XML")
+
+
+def legacy_parse(body: bytes) -> dict[str, str | None]:
+    """Parse a page the way AcondProApiClient.map_response used to."""
+    soup = BeautifulSoup(body.decode("utf-8", errors="replace"), "lxml-xml")
+    return {elem.get("NAME"): elem.get("VALUE") for elem in soup.find_all("INPUT")}
+
+
+@pytest.fixture(params=PAGES)
+def body(request: pytest.FixtureRequest) -> bytes:
+    """Return the body of a controller page."""
+    return (FIXTURES / request.param).read_bytes()
+
+
+def test_parse_inputs_matches_legacy(body: bytes) -> None:
+    """Every element of a page parses as it did with BeautifulSoup."""
+    assert parse_inputs(body) == legacy_parse(body)
+
+
+def test_parse_values_is_typed(body: bytes) -> None:
+    """Values are decoded by the format in their tag name."""
+    assert parse_values(body) == {
+        name: decode_value(name, value) for name, value in legacy_parse(body).items()
+    }
+
+
+def test_projection_returns_only_wanted_tags(body: bytes) -> None:
+    """A projection returns the wanted tags present on the page, and no other."""
+    values = parse_values(body)
+    wanted = frozenset([*sorted(values)[::10], "__TMISSING_INT_"])
+
+    assert parse_values(body, wanted) == {
+        name: value for name, value in values.items() if name in wanted
+    }
+
+
+def test_parse_values_in_another_layout(body: bytes) -> None:
+    """A page with VALUE first and single quotes parses the same."""
+    swapped = re.sub(rb'NAME="([^"]*)" VALUE="([^"]*)"', rb"VALUE='\2' NAME='\1'", body)
+    values = parse_values(body)
+    wanted = frozenset(sorted(values)[::10])
+
+    assert swapped != body
+    assert parse_inputs(swapped) == legacy_parse(swapped)
+    assert parse_values(swapped) == values
+    assert parse_values(swapped, wanted) == parse_values(body, wanted)
+
+
+def test_projection_of_nothing(body: bytes) -> None:
+    """An empty projection does not scan the page."""
+    assert parse_values(body, frozenset()) == {}
+
+
+def test_benchmark_legacy(benchmark: Any, body: bytes) -> None:
+    """Time the previous BeautifulSoup parse of a page."""
+    assert benchmark(legacy_parse, body)
+
+
+def test_benchmark_parse_inputs(benchmark: Any, body: bytes) -> None:
+    """Time the raw parse of a page."""
+    assert benchmark(parse_inputs, body) == legacy_parse(body)
+
+
+def test_benchmark_parse_values(benchmark: Any, body: bytes) -> None:
+    """Time the typed parse of a whole page."""
+    assert len(benchmark(parse_values, body)) == len(legacy_parse(body))
+
+
+def test_benchmark_projection(benchmark: Any, body: bytes) -> None:
+    """Time the typed parse of a tenth of the tags, as with few entities."""
+    wanted = frozenset(sorted(parse_inputs(body))[::10])
+
+    assert benchmark(parse_values, body, wanted).keys() == wanted
+
+
+@pytest.mark.parametrize(
+    "element",
+    [
+        b'<INPUT NAME="__TA_INT_" VALUE="1"/>',
+        b'<INPUT VALUE="1" NAME="__TA_INT_"/>',
+        b"<INPUT NAME='__TA_INT_' VALUE='1'/>",
+        b"<INPUT VALUE='1' NAME=\"__TA_INT_\"/>",
+        b'<INPUT\n  TYPE="hidden"  NAME = "__TA_INT_"\tVALUE="1" ID="a"/>',
+        b'<INPUT VALUE="it\'s" NAME="__TA_STRING_"/>',
+        b"<INPUT NAME='__TA_STRING_' VALUE='say \"hi\"'/>",
+        b'<INPUT NAME="__TA_STRING_" VALUE="a &amp; b &lt;c&gt; &quot;d&quot;"/>',
+        b"<INPUT VALUE='&#39;&#x41;&apos;' NAME='__TA_STRING_'/>",
+        b'<INPUT NAME="__TA_STRING_" VALUE=""/>',
+        b'<INPUT NAME="__TA_INT_"/>',
+        b"<INPUT TYPE='hidden' NAME='__TA_INT_' />",
+        b'<INPUT NAME="__TA_INT_"/><INPUT NAME="__TB_INT_" VALUE="2"/>',
+    ],
+)
+def test_parse_inputs_matches_legacy_attributes(element: bytes) -> None:
+    """Attributes parse in any order, either quote style, with entities or absent."""
+    body = b'<?xml version="1.0"?><PAGE>' + element + b"</PAGE>"
+    wanted = frozenset(legacy_parse(body))
+
+    assert parse_inputs(body) == legacy_parse(body)
+    assert parse_values(body, wanted) == {
+        name: None if value is None else decode_value(name, value)
+        for name, value in legacy_parse(body).items()
+    }
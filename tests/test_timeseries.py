@@ -0,0 +1,95 @@
+"""Ring buffers of the time series and their file format."""
+
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from custom_components.acond.timeseries import SeriesBuffer
+
+NAMES = ("temperature", "compressor")
+
+
+def filled(count: int, capacity: int = 8) -> SeriesBuffer:
+    """Return a buffer of one sample per second, temperature equal to time."""
+    buffer = SeriesBuffer(NAMES, capacity)
+    for second in range(count):
+        buffer.append(
+            second, {"temperature": float(second), "compressor": second % 2 == 0}
+        )
+    return buffer
+
+
+def samples(buffer: SeriesBuffer) -> list[tuple[float, float]]:
+    """Return the held (time, temperature) samples, oldest first."""
+    times = buffer._chronological(buffer._times)
+    temperatures = buffer._chronological(buffer._columns["temperature"])
+    return list(zip(times, temperatures, strict=True))
+
+
+def test_wraparound_keeps_the_newest_samples() -> None:
+    """A full buffer overwrites its oldest samples, keeping time order."""
+    buffer = filled(11)
+
+    assert len(buffer) == 8
+    assert samples(buffer) == [(float(t), float(t)) for t in range(3, 11)]
+
+
+def test_round_trip() -> None:
+    """Serialized samples are restored unchanged, missing values as NaN."""
+    buffer = filled(11)
+    buffer.append(11, {"temperature": None})
+
+    restored = SeriesBuffer.from_bytes(buffer.to_bytes(), NAMES, capacity=8)
+
+    assert restored.to_bytes() == buffer.to_bytes()
+    assert samples(restored)[:-1] == [(float(t), float(t)) for t in range(4, 11)]
+    assert math.isnan(samples(restored)[-1][1])
+
+
+def test_restore_into_a_smaller_buffer_and_other_series() -> None:
+    """Only the newest samples fit, series no longer kept are skipped."""
+    data = filled(6).to_bytes()
+
+    restored = SeriesBuffer.from_bytes(data, ("temperature", "defrost"), capacity=4)
+
+    assert samples(restored) == [(float(t), float(t)) for t in range(2, 6)]
+    _, series = restored.downsample(0, 6, 1)
+    assert series == {"temperature": [3.5], "defrost": [None]}
+
+
+@pytest.mark.parametrize(
+    "data",
+    [b"ACTS", b"XXXX\x01\x00\x00\x00\x00\x00", filled(3).to_bytes()[:-1]],
+    ids=["truncated header", "magic", "truncated data"],
+)
+def test_invalid_data(data: bytes) -> None:
+    """Data not written by to_bytes is refused."""
+    with pytest.raises(ValueError, match="time series"):
+        SeriesBuffer.from_bytes(data, NAMES)
+
+
+def test_downsample_averages_buckets() -> None:
+    """Buckets average their samples, binary series give the on fraction."""
+    buffer = filled(8, capacity=16)
+    buffer.append(8, {"temperature": None, "compressor": True})
+
+    midpoints, series = buffer.downsample(0, 12, 3)
+
+    # Seconds 0-3, 4-7 and 8, the last bucket without a temperature.
+    assert midpoints == [2.0, 6.0, 10.0]
+    assert series == {
+        "temperature": [1.5, 5.5, None],
+        "compressor": [0.5, 0.5, 1.0],
+    }
+
+
+def test_downsample_skips_empty_buckets() -> None:
+    """Buckets without samples are left out, and so is the end of the window."""
+    buffer = filled(8)
+
+    midpoints, series = buffer.downsample(2, 10, 4, ["temperature"])
+
+    assert midpoints == [3.0, 5.0, 7.0]
+    assert series == {"temperature": [2.5, 4.5, 6.5]}
@@ -0,0 +1,160 @@
+"""Timetable model, and its cached reads and diff writes against the simulator."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from homeassistant.exceptions import HomeAssistantError
+
+from custom_components.acond.api import AcondProApiClientCommunicationError
+from custom_components.acond.const import URL_HOME
+from custom_components.acond.registry import REGISTRY_FILE, load_registry
+from custom_components.acond.timetable import (
+    TimetableSlot,
+    iter_periods,
+    timetable_changes,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from custom_components.acond.coordinator import AcondDataUpdateCoordinator
+    from custom_components.acond.timetable import AcondTimetables
+
+    from .conftest import Controller
+
+GET_HOME = f"GET {URL_HOME}"
+POST_HOME = f"POST {URL_HOME}"
+MONDAY, SATURDAY = 0, 5
+# The heating timetable of the simulator's fixture page, in minutes.
+WORKDAY = (TimetableSlot(360, 540), TimetableSlot(960, 1320))
+WEEKEND = (TimetableSlot(420, 1380),)
+
+
+@pytest.fixture
+def timetables(coordinator: AcondDataUpdateCoordinator) -> AcondTimetables:
+    """Return the timetables of the simulated controller."""
+    return coordinator.config_entry.runtime_data.timetables
+
+
+def test_read_once_and_cached(
+    controller: Controller, timetables: AcondTimetables
+) -> None:
+    """Timetables of a page are read in one request and then served cached."""
+    heating = controller.run(timetables.async_get("heating"))
+
+    assert heating == (WORKDAY,) * 5 + (WEEKEND,) * 2
+    assert controller.take_requests()[GET_HOME] == 1
+    assert timetables.cached("hot_water") is not None
+
+    controller.run(timetables.async_get("heating"))
+    controller.run(timetables.async_get("hot_water"))
+    assert controller.take_requests() == {}
+
+    controller.run(timetables.async_get("heating", refresh=True))
+    assert controller.take_requests() == {GET_HOME: 1}
+
+
+def test_edit_writes_only_the_changed_slots(
+    controller: Controller, timetables: AcondTimetables
+) -> None:
+    """An edit posts the tags that differ and reads back the answered page."""
+    definition = timetables.definitions["heating"]
+    controller.run(timetables.async_get("heating"))
+    controller.take_requests()
+
+    written = controller.run(
+        timetables.async_set_days(
+            "heating", {MONDAY: [TimetableSlot(960, 1350), TimetableSlot(360, 540)]}
+        )
+    )
+
+    evening_end = definition.slots[MONDAY][1][1]
+    assert controller.posted == [{evening_end: "1350"}]
+    assert controller.take_requests() == {POST_HOME: 1}
+    assert written[MONDAY] == (TimetableSlot(360, 540), TimetableSlot(960, 1350))
+    assert written[1:] == (WORKDAY,) * 4 + (WEEKEND,) * 2
+
+    # A removed slot is written as unused, an unchanged timetable not at all.
+    controller.run(timetables.async_set_days("heating", {SATURDAY: []}))
+    controller.run(timetables.async_set_days("heating", {SATURDAY: []}))
+    start, end = definition.slots[SATURDAY][0]
+    assert controller.posted[1:] == [{start: "0", end: "0"}]
+
+
+def test_invalid_edit_sends_nothing(
+    controller: Controller, timetables: AcondTimetables
+) -> None:
+    """Overlapping, reversed or too many slots fail before anything is sent."""
+    edits = (
+        [TimetableSlot(60, 120), TimetableSlot(90, 180)],
+        [TimetableSlot(120, 60)],
+        [TimetableSlot(0, 10), TimetableSlot(20, 30), TimetableSlot(40, 50)],
+    )
+    for slots in edits:
+        with pytest.raises(HomeAssistantError):
+            controller.run(timetables.async_set_days("heating", {MONDAY: slots}))
+
+    assert controller.take_requests() == {}
+
+
+def test_read_failure_is_a_home_assistant_error(
+    controller: Controller,
+    timetables: AcondTimetables,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Client errors reach the calendar and services wrapped by the coordinator."""
+
+    async def unreachable(*_: Any) -> Any:
+        msg = "Timeout error fetching information"
+        raise AcondProApiClientCommunicationError(msg)
+
+    monkeypatch.setattr(controller.client, "async_read_tags", unreachable)
+
+    with pytest.raises(HomeAssistantError, match="Timeout"):
+        controller.run(timetables.async_get("heating"))
+    assert timetables.cached("heating") is None
+
+
+def test_changes_pad_unused_slots() -> None:
+    """The diff compares slots in order, a missing slot being unused."""
+    definition = load_registry().timetables["heating"]
+    old = (WORKDAY,) * 5 + (WEEKEND,) * 2
+    new = ((WORKDAY[1],), *old[1:])
+    (morning_start, morning_end), (evening_start, evening_end) = definition.slots[0]
+
+    assert timetable_changes(definition, old, new) == {
+        morning_start: 960,
+        morning_end: 1320,
+        evening_start: 0,
+        evening_end: 0,
+    }
+    assert timetable_changes(definition, old, old) == {}
+
+
+def test_periods_within_a_window() -> None:
+    """Periods overlapping the window are yielded day by day, in order."""
+    timetable = (WORKDAY,) * 5 + (WEEKEND,) * 2
+    # A Friday evening to the Saturday night.
+    start = datetime(2026, 10, 16, 17, 0)  # noqa: DTZ001
+    end = start + timedelta(days=1)
+
+    assert list(iter_periods(timetable, start, end)) == [
+        (datetime(2026, 10, 16, 16, 0), datetime(2026, 10, 16, 22, 0)),  # noqa: DTZ001
+        (datetime(2026, 10, 17, 7, 0), datetime(2026, 10, 17, 23, 0)),  # noqa: DTZ001
+    ]
+
+
+def test_slot_tags_have_to_be_registered_writable(tmp_path: Path) -> None:
+    """A timetable cannot write tags the registry does not allow writing."""
+    raw = json.loads(REGISTRY_FILE.read_text(encoding="utf-8"))
+    start_tag = raw["timetables"]["heating"]["slots"]["monday"][0][0]
+    raw["tags"][start_tag]["writable"] = False
+    path = tmp_path / "registry.json"
+    path.write_text(json.dumps(raw), encoding="utf-8")
+
+    with pytest.raises(ValueError, match=start_tag):
+        load_registry(path)